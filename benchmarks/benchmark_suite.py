@@ -0,0 +1,173 @@
+import argparse
+import json
+import statistics
+import sys
+import time
+
+from benchmarks.headless_simulation import HeadlessSimulation
+
+
+class BenchmarkSuite:
+    DEFAULT_REPEATS = 50
+    DEFAULT_NPCS_COUNT = 100
+    DEFAULT_LOOT_COUNT = 100
+    A_STAR_QUERIES_COUNT = 20
+    INVENTORY_ITEMS_COUNT = 40
+
+    def __init__(self, repeats=DEFAULT_REPEATS, npcs_count=DEFAULT_NPCS_COUNT, loot_count=DEFAULT_LOOT_COUNT, seed=0):
+        self.repeats = repeats
+        self.simulation = HeadlessSimulation(npcs_count=npcs_count, loot_count=loot_count, seed=seed, script=())
+
+        self.benchmarks = {
+            'a_star': self.benchmark_a_star,
+            'draw_map': self.benchmark_draw_map,
+            'draw_loot': self.benchmark_draw_loot,
+            'draw_npcs': self.benchmark_draw_npcs,
+            'inventory_add_items': self.benchmark_inventory_add_items,
+            'inventory_sell_all_trash': self.benchmark_inventory_sell_all_trash,
+            'inventory_draw': self.benchmark_inventory_draw,
+            'interface_draw': self.benchmark_interface_draw
+        }
+
+    def setup(self) -> None:
+        self.simulation.boot()
+        # warm up caches so that the first repeat does not dominate the results
+        self.simulation.run(1)
+
+    @property
+    def game_screen(self):
+        return self.simulation.game_screen
+
+    def get_random_field(self) -> (int, int):
+        x, y = self.simulation.get_random_free_position()
+        map_manager = self.game_screen.map_manager
+        return map_manager.get_row(y), map_manager.get_column(x)
+
+    def benchmark_a_star(self):
+        from src.pathfinding.a_star import a_star
+
+        grid = self.game_screen.pathfinding_manager.grid
+        queries = [self.get_random_field() + self.get_random_field() for _ in range(self.A_STAR_QUERIES_COUNT)]
+
+        def run():
+            for start_row, start_column, destination_row, destination_column in queries:
+                a_star(grid, start_row, start_column, destination_row, destination_column)
+        return run
+
+    def benchmark_draw_map(self):
+        return self.game_screen.map_manager.draw_map
+
+    def benchmark_draw_loot(self):
+        return self.game_screen.loot_manager.draw_loot
+
+    def benchmark_draw_npcs(self):
+        return self.game_screen.npcs_manager.draw_npcs
+
+    def fill_inventory(self) -> None:
+        inventory_manager = self.game_screen.inventory_manager
+        game_catalog = inventory_manager.game_catalog
+        inventory_manager.inventory.clear()
+        for item_info in game_catalog.get_random_items(self.INVENTORY_ITEMS_COUNT):
+            inventory_manager.add_item_to_inventory(item_info, 1)
+
+    def benchmark_inventory_add_items(self):
+        return self.fill_inventory
+
+    def benchmark_inventory_sell_all_trash(self):
+        inventory_manager = self.game_screen.inventory_manager
+
+        def run():
+            self.fill_inventory()
+            inventory_manager.sell_all_trash()
+        return run
+
+    def benchmark_inventory_draw(self):
+        inventory_manager = self.game_screen.inventory_manager
+        self.fill_inventory()
+        if not inventory_manager.is_open:
+            inventory_manager.switch_open()
+        return inventory_manager.draw_inventory
+
+    def benchmark_interface_draw(self):
+        interface_manager = self.game_screen.interface_manager
+        self.fill_inventory()
+        for window in (self.game_screen.inventory_manager, interface_manager.equipment_manager,
+                       interface_manager.chat_manager):
+            if not window.is_open:
+                window.switch_open()
+        return interface_manager.draw_interface
+
+    def measure(self, function) -> dict:
+        timings_in_ms = []
+        for _ in range(self.repeats):
+            start_time = time.perf_counter()
+            function()
+            timings_in_ms.append((time.perf_counter() - start_time) * 1_000)
+        return {
+            'repeats': self.repeats,
+            'min_ms': round(min(timings_in_ms), 4),
+            'median_ms': round(statistics.median(timings_in_ms), 4),
+            'mean_ms': round(statistics.fmean(timings_in_ms), 4),
+            'max_ms': round(max(timings_in_ms), 4)
+        }
+
+    def run(self, benchmark_names=None) -> dict:
+        results = {}
+        for benchmark_name, benchmark in self.benchmarks.items():
+            if benchmark_names and benchmark_name not in benchmark_names:
+                continue
+            results[benchmark_name] = self.measure(benchmark())
+        return results
+
+
+def compare_with_baseline(results, baseline, tolerance) -> list:
+    regressions = []
+    for benchmark_name, result in results.items():
+        if benchmark_name not in baseline:
+            continue
+        # medians are compared, means are too sensitive to single hiccups
+        ratio = result['median_ms'] / max(baseline[benchmark_name]['median_ms'], 1e-9)
+        result['baseline_ratio'] = round(ratio, 3)
+        if ratio > 1 + tolerance:
+            regressions.append(benchmark_name)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark hot paths of the game in headless mode')
+    parser.add_argument('benchmarks', nargs='*', help='names of benchmarks to run, all when omitted')
+    parser.add_argument('--repeats', type=int, default=BenchmarkSuite.DEFAULT_REPEATS)
+    parser.add_argument('--npcs', type=int, default=BenchmarkSuite.DEFAULT_NPCS_COUNT)
+    parser.add_argument('--loot', type=int, default=BenchmarkSuite.DEFAULT_LOOT_COUNT)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--baseline', help='json results of an earlier run to compare against')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='allowed slowdown against the baseline')
+    parser.add_argument('--output', help='json file for the results, printed to stdout when omitted')
+    args = parser.parse_args()
+
+    benchmark_suite = BenchmarkSuite(repeats=args.repeats, npcs_count=args.npcs, loot_count=args.loot, seed=args.seed)
+    unknown_benchmarks = set(args.benchmarks) - set(benchmark_suite.benchmarks)
+    if unknown_benchmarks:
+        parser.error(f'unknown benchmarks: {", ".join(sorted(unknown_benchmarks))}')
+
+    benchmark_suite.setup()
+    results = benchmark_suite.run(args.benchmarks)
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline, 'rt', encoding='utf-8') as f:
+            regressions = compare_with_baseline(results, json.load(f), args.tolerance)
+
+    if args.output:
+        with open(args.output, 'wt', encoding='utf-8') as f:
+            json.dump(results, f, indent=4)
+    else:
+        print(json.dumps(results, indent=4))
+
+    if regressions:
+        print(f'Regressions: {", ".join(regressions)}', file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
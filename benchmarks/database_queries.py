@@ -0,0 +1,212 @@
+import argparse
+import json
+import os
+import shutil
+import sqlite3
+import statistics
+import tempfile
+import time
+
+from database.database_migrate import migrate_game_database, GAME_DATABASE_INDEXES
+from database.game_database_table_columns_names import MapsTable, NpcsTable, ItemsTable, EquipmentSlotsTable, \
+    FactionsTable, ObjectsTable, MapFadingWallsTable
+from src.database_service import DatabaseService
+from src.managers.core.database_connection_manager import DatabaseConnectionManager
+from src.paths import GAME_DATABASE_PATH
+
+
+class DatabaseQueriesBenchmark:
+    DEFAULT_REPEATS = 200
+    DEFAULT_CHARACTER_ID = 1
+
+    def __init__(self, database_path=GAME_DATABASE_PATH, repeats=DEFAULT_REPEATS, character_id=DEFAULT_CHARACTER_ID):
+        self.source_database_path = database_path
+        self.repeats = repeats
+        self.character_id = character_id
+
+        self.temporary_directory = None
+        self.database_path = None
+        self.statements = []
+
+    def __enter__(self):
+        # migration runs on a copy, the game database stays untouched
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.database_path = os.path.join(self.temporary_directory.name, os.path.basename(self.source_database_path))
+        shutil.copyfile(self.source_database_path, self.database_path)
+        self.revert_migration()
+        return self
+
+    def __exit__(self, *args):
+        DatabaseService.close_connections()
+        self.temporary_directory.cleanup()
+
+    def revert_migration(self) -> None:
+        # the shipped database is already migrated, the copy is brought back to the state from before it
+        conn = sqlite3.connect(self.database_path)
+        for index_name, _, _ in GAME_DATABASE_INDEXES:
+            conn.execute(f'DROP INDEX IF EXISTS {index_name}')
+        conn.execute('DROP TABLE IF EXISTS sqlite_stat1')
+        conn.commit()
+        conn.execute('PRAGMA journal_mode = DELETE')
+        conn.close()
+
+    def use_database(self) -> None:
+        DatabaseService.close_connections()
+        DatabaseService._connection_manager = DatabaseConnectionManager(self.database_path)
+        DatabaseService._connect().set_trace_callback(self.statements.append)
+
+    def get_first_value(self, table_name, column_name, default=1):
+        with sqlite3.connect(self.database_path) as conn:
+            row = conn.execute(f'SELECT {column_name} FROM {table_name} ORDER BY {column_name} LIMIT 1').fetchone()
+        return default if row is None else row[0]
+
+    def get_query_cases(self) -> dict:
+        # (method, arguments) per DatabaseService read, ids are taken from the database so that queries find rows
+        map_id = self.get_first_value(MapsTable._TABLE_NAME, MapsTable.MAP_ID)
+        npc_id = self.get_first_value(NpcsTable._TABLE_NAME, NpcsTable.NPC_ID)
+        item_id = self.get_first_value(ItemsTable._TABLE_NAME, ItemsTable.ITEM_ID)
+        object_id = self.get_first_value(ObjectsTable._TABLE_NAME, ObjectsTable.OBJECT_ID)
+        faction_id = self.get_first_value(FactionsTable._TABLE_NAME, FactionsTable.FACTION_ID)
+        fading_wall_id = self.get_first_value(MapFadingWallsTable._TABLE_NAME, MapFadingWallsTable.FADING_WALL_ID)
+        equipment_slot_name = self.get_first_value(
+            EquipmentSlotsTable._TABLE_NAME,
+            EquipmentSlotsTable.EQUIPMENT_SLOT_NAME,
+            default=''
+        )
+        character_id = self.character_id
+
+        return {
+            'get_catalog_version': (),
+            'get_rarities': (),
+            'get_factions': (),
+            'get_attributes': (),
+            'get_item_categories': (),
+            'get_all_items': (),
+            'get_kill_series_titles': (),
+            'get_map_info': (map_id,),
+            'get_objects_on_map': (map_id,),
+            'get_objects_by_ids': ([object_id],),
+            'get_map_objects': (map_id,),
+            'get_object_types': (),
+            'get_rarity_by_id': (1,),
+            'get_map_npc_positions': (map_id,),
+            'get_npcs_by_ids': ([npc_id],),
+            'get_npc_roles_names': (npc_id,),
+            'get_map_npcs': (map_id,),
+            'get_character_data': (character_id,),
+            'get_character_position': (character_id,),
+            'get_faction_name': (faction_id,),
+            'get_character_spells': (character_id,),
+            'get_npc_spells': (npc_id,),
+            'get_character_attributes': (character_id,),
+            'get_npc_attributes': (npc_id,),
+            'get_item': (item_id,),
+            'get_items': ([item_id],),
+            'get_items_count': (),
+            'get_equipment_slots': (),
+            'get_equipment_slot_id': (equipment_slot_name,),
+            'get_character_equipped_items': (character_id,),
+            'get_character_currencies': (character_id,),
+            'get_character_inventory': (character_id,),
+            'get_character_inventory_limits': (character_id,),
+            'get_character_bank_limits': (character_id,),
+            'get_character_free_inventory_slot_nr': (character_id,),
+            'get_character_equipped_item_id': (character_id, equipment_slot_name),
+            'get_map_fading_wall_positions': (map_id,),
+            'get_map_fading_walls': ([(fading_wall_id,)],)
+        }
+
+    def get_query_plans(self) -> list[str]:
+        conn = DatabaseService._connect()
+        query_plans = []
+        for statement in self.statements:
+            if not statement.lstrip().upper().startswith('SELECT'):
+                continue
+            rows = conn.execute(f'EXPLAIN QUERY PLAN {statement}').fetchall()
+            query_plans.extend(row['detail'] for row in rows)
+        return query_plans
+
+    def measure(self, method, arguments) -> dict:
+        self.statements.clear()
+        try:
+            method(*arguments)
+        except sqlite3.Error as e:
+            return {'error': str(e)}
+        # plans are read from the statements of the first call, with the arguments bound
+        query_plans = self.get_query_plans()
+
+        timings_in_us = []
+        for _ in range(self.repeats):
+            start_time = time.perf_counter()
+            method(*arguments)
+            timings_in_us.append((time.perf_counter() - start_time) * 1_000_000)
+        return {
+            'median_us': round(statistics.median(timings_in_us), 2),
+            'min_us': round(min(timings_in_us), 2),
+            'query_plan': query_plans
+        }
+
+    def measure_all(self, query_cases) -> dict:
+        self.use_database()
+        return {
+            method_name: self.measure(getattr(DatabaseService, method_name), arguments)
+            for method_name, arguments in query_cases.items()
+        }
+
+    def run(self) -> dict:
+        query_cases = self.get_query_cases()
+        before = self.measure_all(query_cases)
+        DatabaseService.close_connections()
+        migrate_game_database(self.database_path)
+        after = self.measure_all(query_cases)
+
+        results = {}
+        for method_name in query_cases:
+            result = {'before': before[method_name], 'after': after[method_name]}
+            if 'median_us' in before[method_name] and 'median_us' in after[method_name]:
+                result['speedup'] = round(
+                    before[method_name]['median_us'] / max(after[method_name]['median_us'], 1e-9),
+                    2
+                )
+            results[method_name] = result
+        return results
+
+
+def format_results(results) -> list[str]:
+    lines = [f'{"method":<40}{"before us":>12}{"after us":>12}{"speedup":>10}']
+    for method_name, result in results.items():
+        before, after = result['before'], result['after']
+        if 'error' in before or 'error' in after:
+            lines.append(f'{method_name:<40}  {before.get("error") or after.get("error")}')
+            continue
+        lines.append(f'{method_name:<40}{before["median_us"]:>12}{after["median_us"]:>12}{result["speedup"]:>10}')
+        if before['query_plan'] != after['query_plan']:
+            for detail in before['query_plan']:
+                lines.append(f'    before: {detail}')
+            for detail in after['query_plan']:
+                lines.append(f'    after:  {detail}')
+    return lines
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Compare DatabaseService query plans and timings before and after the database migration'
+    )
+    parser.add_argument('--database', default=GAME_DATABASE_PATH, help='game database, only a copy of it is migrated')
+    parser.add_argument('--repeats', type=int, default=DatabaseQueriesBenchmark.DEFAULT_REPEATS)
+    parser.add_argument('--character-id', type=int, default=DatabaseQueriesBenchmark.DEFAULT_CHARACTER_ID)
+    parser.add_argument('--output', help='json file for the results, a table is printed to stdout when omitted')
+    args = parser.parse_args()
+
+    with DatabaseQueriesBenchmark(args.database, args.repeats, args.character_id) as benchmark:
+        results = benchmark.run()
+
+    if args.output:
+        with open(args.output, 'wt', encoding='utf-8') as f:
+            json.dump(results, f, indent=4)
+    else:
+        print('\n'.join(format_results(results)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,233 @@
+import argparse
+import json
+import random
+import statistics
+import time
+
+from src.enums.frame_phase_type import FramePhaseType
+from src.enums.game_mode import GameMode
+from src.enums.screen_type import ScreenType
+from src.game_context import GameContext
+from src.managers.core.accounts_manager import AccountsManager
+from src.managers.gameplay.map_manager import MAP_COLLISION_TILE
+
+
+class HeadlessSimulation:
+    DEFAULT_DELTA_TIME = 1 / 60
+    DEFAULT_ACCOUNT_ID = 1
+
+    # (frame period, action) pairs, action runs on every frame divisible by its period
+    DEFAULT_SCRIPT = (
+        (120, 'move_player'),
+        (300, 'toggle_loot_names'),
+        (450, 'toggle_inventory'),
+        (600, 'toggle_npc_update_tiers')
+    )
+
+    def __init__(self, npcs_count=0, loot_count=0, delta_time=DEFAULT_DELTA_TIME, seed=0,
+                 script=DEFAULT_SCRIPT, account_id=DEFAULT_ACCOUNT_ID, hostile=False):
+        self.npcs_count = npcs_count
+        self.loot_count = loot_count
+        self.delta_time = delta_time
+        self.script = script
+        self.account_id = account_id
+        self.hostile = hostile
+        self.random = random.Random(seed)
+
+        self.game_context = None
+        self.game_screen = None
+        self.frame_nr = 0
+        self.phase_timings = {frame_phase_type: [] for frame_phase_type in FramePhaseType}
+        self.frame_timings = []
+
+        self.actions = {
+            'move_player': self.move_player,
+            'toggle_loot_names': self.toggle_loot_names,
+            'toggle_inventory': self.toggle_inventory,
+            'toggle_equipment': self.toggle_equipment,
+            'toggle_npc_update_tiers': self.toggle_npc_update_tiers
+        }
+
+    def boot(self) -> None:
+        if not AccountsManager.sign_in_by_id(self.account_id):
+            raise ValueError(f'Account {self.account_id} does not exist')
+
+        self.game_context = GameContext(GameMode.HEADLESS)
+        self.game_screen = self.game_context.screen_manager.screens[ScreenType.GAME]
+        self.game_screen.setup()
+
+        if self.hostile:
+            self.make_player_hostile()
+        self.spawn_npcs(self.npcs_count)
+        self.spawn_loot(self.loot_count)
+
+    def get_random_free_position(self) -> (int, int):
+        grid = self.game_screen.pathfinding_manager.grid
+        while True:
+            row = self.random.randrange(grid.rows)
+            column = self.random.randrange(grid.columns)
+            if not grid.is_blocked(row, column):
+                return ((column * MAP_COLLISION_TILE) + (MAP_COLLISION_TILE // 2),
+                        (row * MAP_COLLISION_TILE) + (MAP_COLLISION_TILE // 2))
+
+    def make_player_hostile(self) -> None:
+        from src.enums.character_status_type import CharacterStatusType
+
+        # npcs only chase and attack characters with the hostile status
+        self.game_screen.player_manager.status = CharacterStatusType.HOSTILE
+
+    def spawn_npcs(self, npcs_count) -> None:
+        from database.game_database_table_columns_names import NpcsTable
+        from src.database_service import DatabaseService
+        from src.enums.character_status_type import CharacterStatusType
+
+        if npcs_count <= 0:
+            return
+
+        npcs_manager = self.game_screen.npcs_manager
+        map_id = self.game_screen.map_manager.map_id
+        # one template per npc kind, placed npcs repeat them
+        templates = list({
+            npc_data[NpcsTable.NPC_ID]: npc_data
+            for npc_data in DatabaseService.get_map_npcs(map_id)
+        }.values())
+        if not templates:
+            raise ValueError(f'Map {map_id} has no npcs to copy')
+
+        status = CharacterStatusType.HOSTILE if self.hostile else None
+        for _ in range(npcs_count):
+            npc_data = self.random.choice(templates)
+            x, y = self.get_random_free_position()
+            npcs_manager.add_npc(
+                npcs_manager.create_npc(
+                    map_id=map_id,
+                    npc_data=npc_data,
+                    x=x,
+                    y=y,
+                    attributes=dict(npc_data['attributes']),
+                    roles_names=[],
+                    status=status
+                )
+            )
+        npcs_manager.build_npcs_store(map_id)
+
+    def spawn_loot(self, loot_count) -> None:
+        loot_manager = self.game_screen.loot_manager
+        for loot_nr in range(loot_count):
+            position = self.get_random_free_position()
+            if loot_nr % 2 == 0:
+                loot_manager.generate_loot(position)
+            else:
+                loot_manager.generate_gold(position, npc_lvl=1, npc_rarity=None)
+
+    def move_player(self) -> None:
+        self.game_screen.player_manager.set_path(*self.get_random_free_position())
+
+    def toggle_loot_names(self) -> None:
+        self.game_screen.loot_manager.switch_show_names()
+
+    def toggle_inventory(self) -> None:
+        self.game_screen.inventory_manager.switch_open()
+
+    def toggle_equipment(self) -> None:
+        self.game_screen.interface_manager.equipment_manager.switch_open()
+
+    def toggle_npc_update_tiers(self) -> None:
+        self.game_screen.npcs_manager.switch_show_update_tiers()
+
+    def run_script(self) -> None:
+        for frame_period, action_name in self.script:
+            if self.frame_nr % frame_period == 0:
+                self.actions[action_name]()
+
+    def run_frame(self) -> None:
+        self.run_script()
+
+        delta_time = self.game_context.game_clock.tick_fixed(self.delta_time)
+        frame_start_time = time.perf_counter()
+        frame_phase_timings = dict.fromkeys(FramePhaseType, 0.0)
+        for frame_phase_type, frame_phase, phase_delta_time in self.game_screen.get_frame_phases(delta_time):
+            phase_start_time = time.perf_counter()
+            frame_phase(phase_delta_time)
+            frame_phase_timings[frame_phase_type] += time.perf_counter() - phase_start_time
+        self.frame_timings.append(time.perf_counter() - frame_start_time)
+        for frame_phase_type, timing in frame_phase_timings.items():
+            self.phase_timings[frame_phase_type].append(timing)
+
+        self.frame_nr += 1
+
+    def run(self, frames_count) -> dict:
+        for _ in range(frames_count):
+            self.run_frame()
+        return self.get_report()
+
+    @staticmethod
+    def summarize_timings(timings) -> dict:
+        if not timings:
+            return {}
+        timings_in_ms = sorted(timing * 1_000 for timing in timings)
+        return {
+            'total_ms': round(sum(timings_in_ms), 3),
+            'mean_ms': round(statistics.fmean(timings_in_ms), 4),
+            'p50_ms': round(timings_in_ms[len(timings_in_ms) // 2], 4),
+            'p95_ms': round(timings_in_ms[min(len(timings_in_ms) - 1, int(len(timings_in_ms) * 0.95))], 4),
+            'max_ms': round(timings_in_ms[-1], 4)
+        }
+
+    def get_report(self) -> dict:
+        return {
+            'frames': self.frame_nr,
+            'delta_time': self.delta_time,
+            'npcs': sum(len(npcs) for npcs in self.game_screen.npcs_manager.npcs.values()),
+            'loot': {
+                'items': len(self.game_screen.loot_manager.items[self.game_screen.map_manager.map_id]),
+                'gold': len(self.game_screen.loot_manager.gold[self.game_screen.map_manager.map_id])
+            },
+            'frame': self.summarize_timings(self.frame_timings),
+            'phases': {
+                frame_phase_type.value: self.summarize_timings(timings)
+                for frame_phase_type, timings in self.phase_timings.items()
+            }
+        }
+
+
+def load_script(script_path):
+    # json list of [frame period, action name] pairs
+    with open(script_path, 'rt', encoding='utf-8') as f:
+        return tuple((frame_period, action_name) for frame_period, action_name in json.load(f))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run the game loop without a display and report phase timings')
+    parser.add_argument('--frames', type=int, default=600)
+    parser.add_argument('--npcs', type=int, default=0, help='extra npcs spawned on the starting map')
+    parser.add_argument('--loot', type=int, default=0, help='loot piles spawned on the starting map')
+    parser.add_argument('--delta-time', type=float, default=HeadlessSimulation.DEFAULT_DELTA_TIME)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--account-id', type=int, default=HeadlessSimulation.DEFAULT_ACCOUNT_ID)
+    parser.add_argument('--hostile', action='store_true', help='make spawned npcs and the player fight each other')
+    parser.add_argument('--script', help='json file replacing the default scripted input')
+    parser.add_argument('--output', help='json file for the report, printed to stdout when omitted')
+    args = parser.parse_args()
+
+    simulation = HeadlessSimulation(
+        npcs_count=args.npcs,
+        loot_count=args.loot,
+        delta_time=args.delta_time,
+        seed=args.seed,
+        script=load_script(args.script) if args.script else HeadlessSimulation.DEFAULT_SCRIPT,
+        account_id=args.account_id,
+        hostile=args.hostile
+    )
+    simulation.boot()
+    report = simulation.run(args.frames)
+
+    if args.output:
+        with open(args.output, 'wt', encoding='utf-8') as f:
+            json.dump(report, f, indent=4)
+    else:
+        print(json.dumps(report, indent=4))
+
+
+if __name__ == '__main__':
+    main()
@@ -1 +1,15 @@
-MAX_FPS = 60
\ No newline at end of file
+MAX_FPS = 60
+PATH_REQUESTS_PER_FRAME = 8
+SIMULATION_RATE = 30
+MAX_SIMULATION_STEPS_PER_FRAME = 5
+PERF_RECORDS_PATH = 'perf_records.csv'
+DIRTY_RECTS_RENDERING = True
+# world is drawn at this fraction of the screen resolution and upscaled, the interface stays native
+RENDER_SCALE = 1.0
+MIN_RENDER_SCALE = 0.5
+RENDER_SCALE_SMOOTH = False
+# lowers the render scale down to MIN_RENDER_SCALE while frames take longer than TARGET_FRAME_TIME
+ADAPTIVE_RENDER_SCALE = False
+TARGET_FRAME_TIME = 1 / MAX_FPS
+# changed character state is written in the background at most this many seconds after it changes
+AUTOSAVE_INTERVAL = 10.0
@@ -2,6 +2,7 @@ import sqlite3
 
 from database.accounts_database_table_columns_names import AccountsTable
 from database.database_config import ACCOUNTS_DATABASE_NAME
+from database.database_migrate import migrate_accounts_database
 
 ACCOUNT_NAME_MIN_LENGTH = 3
 ACCOUNT_NAME_MAX_LENGTH = 20
@@ -25,6 +26,8 @@ def create_accounts_database():
     database_connection.commit()
     database_connection.close()
 
+    migrate_accounts_database()
+
 
 if __name__ == '__main__':
     create_accounts_database()
@@ -0,0 +1,127 @@
+import sys
+
+from database.database_config import GAME_DATABASE_NAME, ACCOUNTS_DATABASE_NAME
+from database.database_connector import DatabaseConnector
+from database.game_database_table_columns_names import MapNpcPositionsTable, MapObjectPositionsTable, \
+    MapFadingWallPositionsTable, CharacterAttributesTable, CharacterSpellsTable, NpcAttributesTable, NpcSpellsTable
+
+# (index name, table, columns), columns after the filtered ones make the index covering for the selected ones
+GAME_DATABASE_INDEXES = (
+    (
+        'idx_map_npc_positions_map_id',
+        MapNpcPositionsTable._TABLE_NAME,
+        (MapNpcPositionsTable.MAP_ID, MapNpcPositionsTable.NPC_ID, MapNpcPositionsTable.X, MapNpcPositionsTable.Y)
+    ),
+    (
+        'idx_map_object_positions_map_id',
+        MapObjectPositionsTable._TABLE_NAME,
+        (MapObjectPositionsTable.MAP_ID, MapObjectPositionsTable.OBJECT_ID,
+         MapObjectPositionsTable.X, MapObjectPositionsTable.Y)
+    ),
+    (
+        'idx_map_fading_wall_positions_map_id',
+        MapFadingWallPositionsTable._TABLE_NAME,
+        (MapFadingWallPositionsTable.MAP_ID,)
+    ),
+    # primary key starts with the attribute id, so it cannot be searched by the character
+    (
+        'idx_character_attributes_character_id',
+        CharacterAttributesTable._TABLE_NAME,
+        (CharacterAttributesTable.CHARACTER_ID, CharacterAttributesTable.ATTRIBUTE_ID,
+         CharacterAttributesTable.ATTRIBUTE_VALUE)
+    ),
+    (
+        'idx_character_spells_character_id',
+        CharacterSpellsTable._TABLE_NAME,
+        (CharacterSpellsTable.CHARACTER_ID, CharacterSpellsTable.SPELL_ID)
+    ),
+    (
+        'idx_npc_attributes_npc_id',
+        NpcAttributesTable._TABLE_NAME,
+        (NpcAttributesTable.NPC_ID, NpcAttributesTable.ATTRIBUTE_ID, NpcAttributesTable.ATTRIBUTE_VALUE)
+    ),
+    (
+        'idx_npc_spells_npc_id',
+        NpcSpellsTable._TABLE_NAME,
+        (NpcSpellsTable.NPC_ID, NpcSpellsTable.SPELL_ID)
+    )
+)
+
+# created by earlier migrations, character_id already leads the primary key of their tables
+OBSOLETE_GAME_DATABASE_INDEXES = (
+    'idx_character_equipment_character_id',
+    'idx_character_currencies_character_id'
+)
+
+
+def get_table_names(database_connector) -> set[str]:
+    database_connector.execute(
+        query='''
+        SELECT name
+        FROM sqlite_master
+        WHERE type = 'table'
+        '''
+    )
+    return {row[0] for row in database_connector.fetchall()}
+
+
+def create_indexes(database_connector, indexes) -> None:
+    table_names = get_table_names(database_connector)
+    for index_name, table_name, columns in indexes:
+        # older databases may miss tables added to the schema later
+        if table_name not in table_names:
+            continue
+        database_connector.execute(
+            query=f'''
+            CREATE INDEX IF NOT EXISTS {index_name}
+            ON {table_name} ({', '.join(columns)})
+            '''
+        )
+
+
+def drop_indexes(database_connector, index_names) -> None:
+    for index_name in index_names:
+        database_connector.execute(
+            query=f'''
+            DROP INDEX IF EXISTS {index_name}
+            '''
+        )
+
+
+def tune_database(database_connector) -> None:
+    # wal lets the game read while the autosave writes, it stays switched on in the database file
+    database_connector.execute(
+        query='''
+        PRAGMA journal_mode = WAL
+        '''
+    )
+    # query planner statistics, without them it may prefer a full scan on small tables
+    database_connector.execute(
+        query='''
+        ANALYZE
+        '''
+    )
+
+
+def migrate_database(database_name, indexes=(), obsolete_index_names=()) -> None:
+    database_connector = DatabaseConnector(database_name)
+    database_connector.connect()
+    drop_indexes(database_connector, obsolete_index_names)
+    create_indexes(database_connector, indexes)
+    tune_database(database_connector)
+    database_connector.disconnect()
+
+
+def migrate_game_database(database_name=GAME_DATABASE_NAME) -> None:
+    migrate_database(database_name, GAME_DATABASE_INDEXES, OBSOLETE_GAME_DATABASE_INDEXES)
+
+
+def migrate_accounts_database(database_name=ACCOUNTS_DATABASE_NAME) -> None:
+    migrate_database(database_name)
+
+
+if __name__ == '__main__':
+    # optional paths of the game and the accounts database, names from the config when omitted
+    migrate_game_database(*sys.argv[1:2])
+    migrate_accounts_database(*sys.argv[2:3])
+    print('Databases migrated successfully')
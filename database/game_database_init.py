@@ -2,6 +2,7 @@ import os
 
 from database.database_config import GAME_DATABASE_NAME
 from database.database_connector import DatabaseConnector
+from database.database_migrate import create_indexes, GAME_DATABASE_INDEXES
 from database.game_database_table_columns_names import MapsTable, AttributesTable, ItemCategoriesTable, ItemsTable, \
     ItemAttributesTable, CharactersTable, CharacterAttributesTable, NpcsTable, NpcAttributesTable, NpcRolesTypesTable, \
     NpcRolesTable, MapNpcPositionsTable, ObjectsTable, MapObjectPositionsTable, KillSeriesTitlesTable, \
@@ -414,6 +415,8 @@ def create_game_database():
         '''
     )
 
+    create_indexes(database_connector, GAME_DATABASE_INDEXES)
+
     database_connector.disconnect()
 
 
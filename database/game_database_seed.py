@@ -1,6 +1,7 @@
 import os
 
 from database.database_connector import DatabaseConnector
+from database.database_migrate import tune_database
 from database.game_database_init import GAME_DATABASE_NAME
 from database.game_database_table_columns_names import ItemsTable, KillSeriesTitlesTable, NpcsTable, NpcRolesTypesTable, \
     MapsTable, ItemCategoriesTable, AttributesTable, CurrenciesTable, EquipmentSlotsTable, NpcAttributesTable, \
@@ -440,6 +441,21 @@ def seed_objects(database_connector, objects):
             )
 
 
+def increment_catalog_version(database_connector):
+    database_connector.execute(
+        query='''
+        PRAGMA user_version;
+        '''
+    )
+    catalog_version = database_connector.fetchone()[0]
+
+    database_connector.execute(
+        query=f'''
+        PRAGMA user_version = {catalog_version + 1};
+        '''
+    )
+
+
 def main():
     database_connector = DatabaseConnector(GAME_DATABASE_NAME)
     database_connector.connect()
@@ -487,6 +503,9 @@ def main():
     items = load_json(PATH_DIR_ITEMS)
     seed_items(database_connector, items)
 
+    increment_catalog_version(database_connector)
+    tune_database(database_connector)
+
     database_connector.disconnect()
 
 
@@ -14,10 +14,29 @@ def get_fps_rate(delta_time) -> int:
 
 
 def load_json(file_path: str) -> dict | list:
+    from src.world_snapshot import WorldSnapshot
+
+    world_snapshot = WorldSnapshot.get_instance()
+    if world_snapshot is not None:
+        data = world_snapshot.get_json(file_path)
+        if data is not None:
+            return data
     with open(file_path, 'rt', encoding='utf-8') as f:
         return json.load(f)
 
 
+def load_image(file_path: str) -> pygame.Surface:
+    from src.world_snapshot import WorldSnapshot
+
+    # decoded pixels from the world snapshot when it holds the image, still to be converted by the caller
+    world_snapshot = WorldSnapshot.get_instance()
+    if world_snapshot is not None:
+        image = world_snapshot.get_image(file_path)
+        if image is not None:
+            return image
+    return pygame.image.load(file_path)
+
+
 def load_json_from_directory(directory_path: str) -> dict | list:
     data = []
     for filename in os.listdir(directory_path):
@@ -33,6 +52,14 @@ def load_txt(path: str):
 
 
 def quit_game():
+    from src.database_service import DatabaseService
+    from src.managers.core.save_manager import SaveManager
+
+    # unsaved changes are written before the connections close
+    save_manager = SaveManager.get_instance()
+    if save_manager is not None:
+        save_manager.stop()
+    DatabaseService.close_connections()
     pygame.quit()
     sys.exit()
 
@@ -1,21 +1,117 @@
-import sqlite3
-
 from database.game_database_table_columns_names import MapObjectPositionsTable, MapsTable, ObjectsTable, \
     MapNpcPositionsTable, NpcsTable, NpcRolesTable, NpcRolesTypesTable, CharactersTable, CharacterAttributesTable, \
     AttributesTable, ItemsTable, CharacterEquipmentTable, CurrenciesTable, CharacterCurrenciesTable, \
     CharacterBankLimitsTable, CharacterInventoryLimitsTable, CharacterInventoryTable, EquipmentSlotsTable, \
     NpcAttributesTable, KillSeriesTitlesTable, ObjectTypesTable, CharacterSpellsTable, SpellsTable, NpcSpellsTable, \
-    CharacterPositionsTable, FactionsTable, MapFadingWallPositionsTable, MapFadingWallsTable, RaritiesTable
+    CharacterPositionsTable, FactionsTable, MapFadingWallPositionsTable, MapFadingWallsTable, RaritiesTable, \
+    ItemCategoriesTable
+from src.enums.save_field_type import SaveFieldType
+from src.managers.core.database_connection_manager import DatabaseConnectionManager
 from src.paths import GAME_DATABASE_PATH
 
 
 class DatabaseService:
+    _connection_manager = DatabaseConnectionManager(GAME_DATABASE_PATH)
 
     @staticmethod
     def _connect():
-        conn = sqlite3.connect(GAME_DATABASE_PATH)
-        conn.row_factory = sqlite3.Row
-        return conn
+        return DatabaseService._connection_manager.get_read_connection()
+
+    @staticmethod
+    def _connect_for_writing():
+        return DatabaseService._connection_manager.get_write_connection()
+
+    @staticmethod
+    def close_connections():
+        DatabaseService._connection_manager.close()
+
+    @staticmethod
+    def get_catalog_version() -> int:
+        with DatabaseService._connect() as conn:
+            cursor = conn.cursor()
+
+            cursor.execute(
+                '''
+                PRAGMA user_version
+                '''
+            )
+
+            return cursor.fetchone()[0]
+
+    @staticmethod
+    def get_rarities():
+        with DatabaseService._connect() as conn:
+            cursor = conn.cursor()
+
+            cursor.execute(
+                f'''
+                SELECT *
+                FROM {RaritiesTable._TABLE_NAME}
+                ORDER BY {RaritiesTable.RARITY_ID}
+                '''
+            )
+
+            return [dict(row) for row in cursor.fetchall()]
+
+    @staticmethod
+    def get_factions():
+        with DatabaseService._connect() as conn:
+            cursor = conn.cursor()
+
+            cursor.execute(
+                f'''
+                SELECT *
+                FROM {FactionsTable._TABLE_NAME}
+                ORDER BY {FactionsTable.FACTION_ID}
+                '''
+            )
+
+            return [dict(row) for row in cursor.fetchall()]
+
+    @staticmethod
+    def get_attributes():
+        with DatabaseService._connect() as conn:
+            cursor = conn.cursor()
+
+            cursor.execute(
+                f'''
+                SELECT *
+                FROM {AttributesTable._TABLE_NAME}
+                ORDER BY {AttributesTable.ATTRIBUTE_ID}
+                '''
+            )
+
+            return [dict(row) for row in cursor.fetchall()]
+
+    @staticmethod
+    def get_item_categories():
+        with DatabaseService._connect() as conn:
+            cursor = conn.cursor()
+
+            cursor.execute(
+                f'''
+                SELECT *
+                FROM {ItemCategoriesTable._TABLE_NAME}
+                ORDER BY {ItemCategoriesTable.CATEGORY_ID}
+                '''
+            )
+
+            return [dict(row) for row in cursor.fetchall()]
+
+    @staticmethod
+    def get_all_items():
+        with DatabaseService._connect() as conn:
+            cursor = conn.cursor()
+
+            cursor.execute(
+                f'''
+                SELECT *
+                FROM {ItemsTable._TABLE_NAME}
+                ORDER BY {ItemsTable.ITEM_ID}
+                '''
+            )
+
+            return [dict(row) for row in cursor.fetchall()]
 
     @staticmethod
     def get_kill_series_titles():
@@ -118,6 +214,54 @@ class DatabaseService:
 
             return cursor.fetchone()
 
+    @staticmethod
+    def get_map_objects(map_id):
+        # objects placed on the map with the row from the table of their type, one query per object type on the map
+        with DatabaseService._connect() as conn:
+            cursor = conn.cursor()
+
+            cursor.execute(
+                f'''
+                SELECT o.*, t.{ObjectTypesTable.OBJECT_TYPE_NAME}, t.{ObjectTypesTable.OBJECT_TYPE_TABLE_NAME},
+                    p.{MapObjectPositionsTable.X}, p.{MapObjectPositionsTable.Y}
+                FROM {MapObjectPositionsTable._TABLE_NAME} p
+                JOIN {ObjectsTable._TABLE_NAME} o ON p.{MapObjectPositionsTable.OBJECT_ID} = o.{ObjectsTable.OBJECT_ID}
+                JOIN {ObjectTypesTable._TABLE_NAME} t ON o.{ObjectsTable.OBJECT_TYPE_ID} = t.{ObjectTypesTable.OBJECT_TYPE_ID}
+                WHERE p.{MapObjectPositionsTable.MAP_ID} = ?
+                ORDER BY p.{MapObjectPositionsTable.MAP_OBJECT_ID}
+                ''',
+                (
+                    map_id,
+                )
+            )
+            objects = [dict(row) for row in cursor.fetchall()]
+
+            object_type_data = {}
+            for table_name in {obj[ObjectTypesTable.OBJECT_TYPE_TABLE_NAME] for obj in objects}:
+                cursor.execute(
+                    f'''
+                    SELECT *
+                    FROM {table_name}
+                    WHERE {ObjectsTable.OBJECT_ID} IN (
+                        SELECT {MapObjectPositionsTable.OBJECT_ID}
+                        FROM {MapObjectPositionsTable._TABLE_NAME}
+                        WHERE {MapObjectPositionsTable.MAP_ID} = ?
+                    )
+                    ''',
+                    (
+                        map_id,
+                    )
+                )
+                for row in cursor.fetchall():
+                    object_type_data.setdefault((table_name, row[ObjectsTable.OBJECT_ID]), dict(row))
+
+        for obj in objects:
+            obj['object_type_data'] = object_type_data.get(
+                (obj[ObjectTypesTable.OBJECT_TYPE_TABLE_NAME], obj[ObjectsTable.OBJECT_ID])
+            )
+
+        return objects
+
     @staticmethod
     def get_rarity_by_id(id):
         with DatabaseService._connect() as conn:
@@ -189,6 +333,72 @@ class DatabaseService:
             )
             return [row[0] for row in cursor.fetchall()]
 
+    @staticmethod
+    def get_map_npcs(map_id):
+        # npcs placed on the map with their attributes and roles, the queries count does not grow with the npcs count
+        with DatabaseService._connect() as conn:
+            cursor = conn.cursor()
+
+            cursor.execute(
+                f'''
+                SELECT n.*, p.{MapNpcPositionsTable.X}, p.{MapNpcPositionsTable.Y}
+                FROM {MapNpcPositionsTable._TABLE_NAME} p
+                JOIN {NpcsTable._TABLE_NAME} n ON p.{MapNpcPositionsTable.NPC_ID} = n.{NpcsTable.NPC_ID}
+                WHERE p.{MapNpcPositionsTable.MAP_ID} = ?
+                ORDER BY p.{MapNpcPositionsTable.MAP_NPC_ID}
+                ''',
+                (
+                    map_id,
+                )
+            )
+            npcs = [dict(row) for row in cursor.fetchall()]
+
+            cursor.execute(
+                f'''
+                SELECT na.{NpcAttributesTable.NPC_ID}, a.{AttributesTable.ATTRIBUTE_NAME}, na.{NpcAttributesTable.ATTRIBUTE_VALUE}
+                FROM {NpcAttributesTable._TABLE_NAME} na
+                JOIN {AttributesTable._TABLE_NAME} a ON na.{NpcAttributesTable.ATTRIBUTE_ID} = a.{AttributesTable.ATTRIBUTE_ID}
+                WHERE na.{NpcAttributesTable.NPC_ID} IN (
+                    SELECT {MapNpcPositionsTable.NPC_ID}
+                    FROM {MapNpcPositionsTable._TABLE_NAME}
+                    WHERE {MapNpcPositionsTable.MAP_ID} = ?
+                )
+                ''',
+                (
+                    map_id,
+                )
+            )
+            attributes_by_npc_id = {}
+            for npc_id, attribute_name, value in cursor.fetchall():
+                attributes_by_npc_id.setdefault(npc_id, {})[attribute_name] = value
+
+            cursor.execute(
+                f'''
+                SELECT r.{NpcRolesTable.NPC_ID}, t.{NpcRolesTypesTable.NPC_ROLE_NAME}
+                FROM {NpcRolesTable._TABLE_NAME} r
+                JOIN {NpcRolesTypesTable._TABLE_NAME} t ON r.{NpcRolesTable.NPC_ROLE_TYPE_ID} = t.{NpcRolesTypesTable.NPC_ROLE_TYPE_ID}
+                WHERE r.{NpcRolesTable.NPC_ID} IN (
+                    SELECT {MapNpcPositionsTable.NPC_ID}
+                    FROM {MapNpcPositionsTable._TABLE_NAME}
+                    WHERE {MapNpcPositionsTable.MAP_ID} = ?
+                )
+                ''',
+                (
+                    map_id,
+                )
+            )
+            roles_names_by_npc_id = {}
+            for npc_id, npc_role_name in cursor.fetchall():
+                roles_names_by_npc_id.setdefault(npc_id, []).append(npc_role_name)
+
+        for npc in npcs:
+            npc_id = npc[NpcsTable.NPC_ID]
+            # copied for every placed npc, each of them loses hp on its own
+            npc['attributes'] = dict(attributes_by_npc_id.get(npc_id, {}))
+            npc['roles_names'] = list(roles_names_by_npc_id.get(npc_id, []))
+
+        return npcs
+
     @staticmethod
     def get_character_data(character_id):
         with DatabaseService._connect() as conn:
@@ -541,7 +751,7 @@ class DatabaseService:
 
     @staticmethod
     def add_item_to_character_inventory(character_id, item_id, item_quantity):
-        with DatabaseService._connect() as conn:
+        with DatabaseService._connect_for_writing() as conn:
             cursor = conn.cursor()
 
             slot_nr = DatabaseService.get_character_free_inventory_slot_nr(character_id)
@@ -590,7 +800,7 @@ class DatabaseService:
 
     @staticmethod
     def add_item_to_character_equipment(character_id, item_id, equipment_slot_name):
-        with DatabaseService._connect() as conn:
+        with DatabaseService._connect_for_writing() as conn:
             cursor = conn.cursor()
 
             equipment_slot_id = DatabaseService.get_equipment_slot_id(equipment_slot_name)
@@ -608,9 +818,155 @@ class DatabaseService:
                 )
             )
 
+    @staticmethod
+    def _save_character_progress(cursor, character_id, lvl, xp):
+        cursor.execute(
+            f'''
+            UPDATE {CharactersTable._TABLE_NAME}
+            SET {CharactersTable.LVL} = ?, {CharactersTable.XP} = ?
+            WHERE {CharactersTable.CHARACTER_ID} = ?
+            ''',
+            (
+                lvl,
+                xp,
+                character_id
+            )
+        )
+
+    @staticmethod
+    def _save_character_position(cursor, character_id, map_id, x, y):
+        cursor.execute(
+            f'''
+            INSERT OR REPLACE INTO {CharacterPositionsTable._TABLE_NAME} (
+                {CharacterPositionsTable.CHARACTER_ID},
+                {CharacterPositionsTable.MAP_ID},
+                {CharacterPositionsTable.X},
+                {CharacterPositionsTable.Y}
+            ) VALUES (?, ?, ?, ?)
+            ''',
+            (
+                character_id,
+                map_id,
+                x,
+                y
+            )
+        )
+
+    @staticmethod
+    def _save_character_attributes(cursor, character_id, attributes):
+        # names missing from the attributes table are skipped by the select
+        cursor.executemany(
+            f'''
+            INSERT OR REPLACE INTO {CharacterAttributesTable._TABLE_NAME} (
+                {CharacterAttributesTable.CHARACTER_ID},
+                {CharacterAttributesTable.ATTRIBUTE_ID},
+                {CharacterAttributesTable.ATTRIBUTE_VALUE}
+            )
+            SELECT ?, {AttributesTable.ATTRIBUTE_ID}, ?
+            FROM {AttributesTable._TABLE_NAME}
+            WHERE {AttributesTable.ATTRIBUTE_NAME} = ?
+            ''',
+            [
+                (character_id, attribute_value, attribute_name)
+                for attribute_name, attribute_value in attributes.items()
+            ]
+        )
+
+    @staticmethod
+    def _save_character_currencies(cursor, character_id, currencies):
+        cursor.executemany(
+            f'''
+            INSERT OR REPLACE INTO {CharacterCurrenciesTable._TABLE_NAME} (
+                {CharacterCurrenciesTable.CHARACTER_ID},
+                {CharacterCurrenciesTable.CURRENCY_ID},
+                {CharacterCurrenciesTable.AMOUNT}
+            )
+            SELECT ?, {CurrenciesTable.CURRENCY_ID}, ?
+            FROM {CurrenciesTable._TABLE_NAME}
+            WHERE {CurrenciesTable.CURRENCY_NAME} = ?
+            ''',
+            [
+                (character_id, amount, currency_name)
+                for currency_name, amount in currencies.items()
+            ]
+        )
+
+    @staticmethod
+    def _save_character_inventory(cursor, character_id, inventory):
+        # whole inventory is rewritten, items move between slots too often to track them one by one
+        cursor.execute(
+            f'''
+            DELETE FROM {CharacterInventoryTable._TABLE_NAME}
+            WHERE {CharacterInventoryTable.CHARACTER_ID} = ?
+            ''',
+            (
+                character_id,
+            )
+        )
+        cursor.executemany(
+            f'''
+            INSERT INTO {CharacterInventoryTable._TABLE_NAME} (
+                {CharacterInventoryTable.CHARACTER_ID},
+                {CharacterInventoryTable.ITEM_ID},
+                {CharacterInventoryTable.ITEM_QUANTITY},
+                {CharacterInventoryTable.SLOT_NR}
+            ) VALUES (?, ?, ?, ?)
+            ''',
+            [
+                (character_id, item_id, item_quantity, slot_nr)
+                for slot_nr, (item_id, item_quantity) in inventory.items()
+            ]
+        )
+
+    @staticmethod
+    def _save_character_equipment(cursor, character_id, equipment):
+        # empty slots have no rows
+        cursor.execute(
+            f'''
+            DELETE FROM {CharacterEquipmentTable._TABLE_NAME}
+            WHERE {CharacterEquipmentTable.CHARACTER_ID} = ?
+            ''',
+            (
+                character_id,
+            )
+        )
+        cursor.executemany(
+            f'''
+            INSERT INTO {CharacterEquipmentTable._TABLE_NAME} (
+                {CharacterEquipmentTable.CHARACTER_ID},
+                {CharacterEquipmentTable.EQUIPMENT_SLOT_ID},
+                {CharacterEquipmentTable.ITEM_ID}
+            ) VALUES (?, ?, ?)
+            ''',
+            [
+                (character_id, equipment_slot_id, item_id)
+                for equipment_slot_id, item_id in equipment.items()
+            ]
+        )
+
+    @staticmethod
+    def save_character_state(character_id, character_state):
+        # only the given fields are written, all of them in one transaction
+        with DatabaseService._connect_for_writing() as conn:
+            cursor = conn.cursor()
+
+            for save_field, value in character_state.items():
+                if save_field == SaveFieldType.PROGRESS:
+                    DatabaseService._save_character_progress(cursor, character_id, *value)
+                elif save_field == SaveFieldType.POSITION:
+                    DatabaseService._save_character_position(cursor, character_id, *value)
+                elif save_field == SaveFieldType.ATTRIBUTES:
+                    DatabaseService._save_character_attributes(cursor, character_id, value)
+                elif save_field == SaveFieldType.CURRENCIES:
+                    DatabaseService._save_character_currencies(cursor, character_id, value)
+                elif save_field == SaveFieldType.INVENTORY:
+                    DatabaseService._save_character_inventory(cursor, character_id, value)
+                elif save_field == SaveFieldType.EQUIPMENT:
+                    DatabaseService._save_character_equipment(cursor, character_id, value)
+
     @staticmethod
     def delete_character(character_id):
-        with DatabaseService._connect() as conn:
+        with DatabaseService._connect_for_writing() as conn:
             cursor = conn.cursor()
 
             cursor.execute(
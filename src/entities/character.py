@@ -1,6 +1,6 @@
 from abc import abstractmethod
 
-from src.common_utils import normalise_movement_vector
+from src.common_utils import normalise_movement_vector, manhattan_distance
 from src.entities.entity import Entity
 from src.enums.character_attribute_type import CharacterAttributeType
 from src.enums.character_status_type import CharacterStatusType
@@ -53,11 +53,15 @@ class Character(Entity):
         self.last_attack_time = float('-inf')
         self.combat_start_time = float('-inf')
 
+    pathfinding_manager = None
+
     @classmethod
     def setup_references(cls):
         from src.managers.gameplay.map_manager import MapManager
+        from src.managers.gameplay.pathfinding_manager import PathfindingManager
 
         cls.map_manager = MapManager.get_instance()
+        cls.pathfinding_manager = PathfindingManager.get_instance()
 
     def load_spells(self):
         from src.spells.spells_handler import SpellsHandler
@@ -218,18 +222,37 @@ class Character(Entity):
     def is_target_in_attack_distance(self, target) -> bool:
         return self.is_target_in_distance(target, self.attack_distance)
 
+    def apply_path(self, path, destination_row_and_column) -> None:
+        self.path = path
+        if self.path:
+            self.is_moving_to_destination_row_and_column = True
+            self.destination_row_and_column = destination_row_and_column
+
+    def is_following_path_to(self, destination_row_and_column) -> bool:
+        if not (self.path and self.is_moving_to_destination_row_and_column):
+            return False
+        if self.destination_row_and_column != destination_row_and_column:
+            return False
+
+        field = (self.row, self.column)
+        if len(self.path) > 1 and field == self.path[1]:
+            self.path.pop(0)
+        return manhattan_distance(field, self.path[0]) <= 1
+
     def set_path(self, destination_x, destination_y) -> None:
         destination_row = self.map_manager.get_row(destination_y)
         destination_column = self.map_manager.get_column(destination_x)
-        self.path = self.map_manager.a_star(
-            self.row,
-            self.column,
-            destination_row,
-            destination_column
+        if self.is_following_path_to((destination_row, destination_column)):
+            return
+        self.apply_path(
+            self.pathfinding_manager.find_path(
+                self.row,
+                self.column,
+                destination_row,
+                destination_column
+            ),
+            (destination_row, destination_column)
         )
-        if self.path:
-            self.is_moving_to_destination_row_and_column = True
-            self.destination_row_and_column = (destination_row, destination_column)
 
     def update_path(self) -> None:
         if self.is_moving_to_destination_row_and_column and self.path:
@@ -288,6 +311,7 @@ class Character(Entity):
             movement_vector = normalise_movement_vector(movement_vector)
             pixel_movement_vector = [movement_vector[0] * self.movement_speed * delta_time,
                                      movement_vector[1] * self.movement_speed * delta_time]
+            self.save_previous_position()
             new_x = self._x + pixel_movement_vector[0]
             new_y = self._y + pixel_movement_vector[1]
             new_row_nr = self.map_manager.get_row(new_y)
@@ -296,3 +320,4 @@ class Character(Entity):
                 self._y = new_y
             if not self.map_manager.is_collision_on_field(self.row, new_column_nr):
                 self._x = new_x
+            self.on_position_changed()
@@ -14,14 +14,25 @@ class Entity:
     interface_manager = None
     interactive_objects_manager = None
     player_manager = None
+    viewport_manager = None
+    save_manager = None
     game_clock = None
 
+    # room for the marker and the mini hp bar above the sprite and the npc update tier below it
+    DIRTY_RECT_MARGIN = 25
+    # entities with a light radius light up the darkness around them at night
+    LIGHT_RADIUS = None
+
     def __init__(self, game_surface, map_id, x, y, draw_size, name):
         self.game_surface = game_surface
 
         self._map_id = map_id
         self._x = x
         self._y = y
+        # position before the last simulation step that moved the entity, rendering interpolates from it
+        self._previous_x = x
+        self._previous_y = y
+        self._previous_position_step_nr = None
 
         self._name = name
 
@@ -31,6 +42,8 @@ class Entity:
 
         self.interaction_distance = self._draw_size
 
+        self.spatial_hash = None
+
     @classmethod
     def setup_references(cls):
         from src.managers.gameplay.map_manager import MapManager
@@ -42,6 +55,8 @@ class Entity:
         from src.managers.ui.interface_manager import InterfaceManager
         from src.managers.gameplay.interactive_objects_manager import InteractiveObjectsManager
         from src.managers.gameplay.player_manager import PlayerManager
+        from src.managers.gameplay.viewport_manager import ViewportManager
+        from src.managers.core.save_manager import SaveManager
         from src.game_clock import GameClock
 
         cls.game_clock = GameClock.get_instance()
@@ -54,6 +69,8 @@ class Entity:
         cls.interface_manager = InterfaceManager.get_instance()
         cls.interactive_objects_manager = InteractiveObjectsManager.get_instance()
         cls.player_manager = PlayerManager.get_instance()
+        cls.viewport_manager = ViewportManager.get_instance()
+        cls.save_manager = SaveManager.get_instance()
 
     @property
     def name(self):
@@ -71,8 +88,33 @@ class Entity:
         return self._x, self._y
 
     def set_position(self, x, y) -> None:
+        # teleports are not interpolated
+        self._previous_position_step_nr = None
         self._x = x
         self._y = y
+        self.on_position_changed()
+
+    def save_previous_position(self) -> None:
+        simulation_step_nr = self.game_clock.simulation_step_nr
+        if self._previous_position_step_nr != simulation_step_nr:
+            self._previous_x = self._x
+            self._previous_y = self._y
+            self._previous_position_step_nr = simulation_step_nr
+
+    @property
+    def render_position(self) -> (float, float):
+        if self._previous_position_step_nr != self.game_clock.simulation_step_nr:
+            return self._x, self._y
+        interpolation_factor = self.game_clock.interpolation_factor
+        return (self._previous_x + ((self._x - self._previous_x) * interpolation_factor),
+                self._previous_y + ((self._y - self._previous_y) * interpolation_factor))
+
+    def on_position_changed(self) -> None:
+        self.update_spatial_hash()
+
+    def update_spatial_hash(self) -> None:
+        if self.spatial_hash is not None:
+            self.spatial_hash.move(self, self._x, self._y)
 
     @property
     def x(self):
@@ -114,9 +156,45 @@ class Entity:
     def is_target_in_interaction_distance(self, target):
         return euclidean_distance((self._x, self._y), target.position) <= self.interaction_distance
 
+    def get_draw_area_size(self) -> (int, int):
+        return (
+            self._draw_size + (2 * self.DIRTY_RECT_MARGIN),
+            (2 * self._draw_size) + (2 * self.DIRTY_RECT_MARGIN)
+        )
+
+    def get_dirty_rect(self) -> pygame.Rect:
+        screen_x, screen_y = self.viewport_manager.convert_map_position_to_screen_position(*self.render_position)
+        dirty_rect = pygame.Rect((0, 0), self.get_draw_area_size())
+        dirty_rect.center = (int(screen_x), int(screen_y))
+        return dirty_rect
+
+    @property
+    def is_visible(self) -> bool:
+        return self.viewport_manager.is_area_visible(*self.render_position, *self.get_draw_area_size())
+
+    def get_draw_state(self) -> tuple:
+        # everything the drawn pixels depend on
+        screen_x, screen_y = self.viewport_manager.convert_map_position_to_screen_position(*self.render_position)
+        return (
+            int(screen_x),
+            int(screen_y),
+            None if self.animated_sprite is None else self.animated_sprite.get_current_frame(),
+            None if self.marker is None else self.marker.current_offset
+        )
+
+    def update_animation(self) -> None:
+        if self.animated_sprite is not None:
+            self.animated_sprite.increment_current_frame_nr()
+        if self.marker is not None:
+            self.marker.change_offset()
+
     def draw(self):
         if self.map_manager.map_id == self._map_id:
-            position_on_screen = self.map_manager.convert_map_position_to_screen_position(self.x, self.y)
+            if not self.is_visible:
+                # off screen entities keep animating, only blitting is skipped
+                self.update_animation()
+                return
+            position_on_screen = self.viewport_manager.convert_map_position_to_screen_position(*self.render_position)
             if self.animated_sprite is not None:
                 self.animated_sprite.draw(position_on_screen)
             if self.marker is not None:
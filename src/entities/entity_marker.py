@@ -2,7 +2,7 @@ import os
 
 import pygame
 
-from src.common_utils import remove_filename_extension
+from src.common_utils import remove_filename_extension, load_image
 from src.enums.entity_marker_type import EntityMarkerType
 from src.paths import DIR_ASSETS_NPC_MARKERS
 
@@ -16,6 +16,7 @@ ENTITY_MARKER_PRIORITIES = {
 
 class EntityMarker:
     game_clock = None
+    render_scale_manager = None
 
     _markers = {}
     MARKER_SIZE = 60
@@ -35,14 +36,16 @@ class EntityMarker:
     @classmethod
     def setup_references(cls):
         from src.game_clock import GameClock
+        from src.managers.core.render_scale_manager import RenderScaleManager
 
         cls.game_clock = GameClock.get_instance()
+        cls.render_scale_manager = RenderScaleManager.get_instance()
 
     @classmethod
     def load_entity_markers(cls):
         marker_names = os.listdir(DIR_ASSETS_NPC_MARKERS)
         for marker_name in marker_names:
-            marker_image = pygame.image.load(os.path.join(DIR_ASSETS_NPC_MARKERS, marker_name)).convert_alpha()
+            marker_image = load_image(os.path.join(DIR_ASSETS_NPC_MARKERS, marker_name)).convert_alpha()
             marker_image = pygame.transform.scale(marker_image, (cls.MARKER_SIZE, cls.MARKER_SIZE))
             cls._markers[remove_filename_extension(marker_name)] = marker_image
 
@@ -64,11 +67,11 @@ class EntityMarker:
                     self.current_offset -= 1
 
     def draw_entity_marker(self, screen_position):
-        self.game_surface.blit(
+        self.change_offset()
+        self.render_scale_manager.draw_world_surface(
             self.marker,
             (
                 screen_position[0] - (self.MARKER_SIZE // 2),
                 screen_position[1] - self.entity_draw_size - self.MARKER_Y_OFFSET + self.current_offset
             )
         )
-        self.change_offset()
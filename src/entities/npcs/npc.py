@@ -27,6 +27,10 @@ NPC_CURSOR_NAMES = {
 class Npc(Character):
     RESPAWN_TIME_IN_SECONDS = 60.0
 
+    # set when the npc is backed by an NpcsStore, None on the per-object fallback
+    store = None
+    store_index = None
+
     ACTIVATION_DISTANCE_HYSTERESIS = 500
 
     hostile_mini_hp_bar = None
@@ -89,6 +93,79 @@ class Npc(Character):
             border_radius=90
         )
 
+    def attach_store(self, store, store_index) -> None:
+        self.store = store
+        self.store_index = store_index
+
+    @property
+    def is_activated(self) -> bool:
+        if self.store is not None:
+            return bool(self.store.activation_flags[self.store_index])
+        return self._is_activated
+
+    @is_activated.setter
+    def is_activated(self, is_activated) -> None:
+        if self.store is not None:
+            self.store.set_activated(self.store_index, is_activated)
+        else:
+            self._is_activated = is_activated
+
+    @property
+    def death_time(self) -> float:
+        if self.store is not None:
+            return float(self.store.death_times[self.store_index])
+        return self._death_time
+
+    @death_time.setter
+    def death_time(self, death_time) -> None:
+        if self.store is not None:
+            self.store.death_times[self.store_index] = death_time
+        else:
+            self._death_time = death_time
+
+    @property
+    def last_attack_time(self) -> float:
+        if self.store is not None:
+            return float(self.store.last_attack_times[self.store_index])
+        return self._last_attack_time
+
+    @last_attack_time.setter
+    def last_attack_time(self, last_attack_time) -> None:
+        if self.store is not None:
+            self.store.set_last_attack_time(self.store_index, last_attack_time)
+        else:
+            self._last_attack_time = last_attack_time
+
+    @property
+    def is_attack_ready(self) -> bool:
+        if self.store is not None:
+            return bool(self.store.attack_ready_flags[self.store_index])
+        return super().is_attack_ready
+
+    @property
+    def distance_to_player(self) -> float:
+        if self.store is not None and not self.store.is_dirty(self.store_index):
+            return float(self.store.distances_to_player[self.store_index])
+        return euclidean_distance(self.position, self.player_manager.position)
+
+    @override
+    def on_position_changed(self) -> None:
+        super().on_position_changed()
+        if self.store is not None:
+            self.store.set_position(self.store_index, self._x, self._y)
+
+    @override
+    def increase_hp(self, delta: int) -> None:
+        super().increase_hp(delta)
+        if self.store is not None:
+            self.store.hp[self.store_index] = self.get_attribute(CharacterAttributeType.HP)
+
+    @override
+    def decrease_hp(self, delta: int) -> None:
+        super().decrease_hp(delta)
+        if self.store is not None:
+            self.store.hp[self.store_index] = self.get_attribute(CharacterAttributeType.HP)
+
     def create_roles(self, roles_names):
         roles = []
         for role_name in roles_names:
@@ -117,6 +194,10 @@ class Npc(Character):
         return NPC_CURSOR_NAMES.get(role_name, CursorType.POINT)
 
     def handle_respawn(self):
+        if self.store is not None:
+            if self.store.respawn_due_flags[self.store_index]:
+                self.reset()
+            return
         if self.is_dead:
             if (self.game_clock.game_time - self.death_time) > self.RESPAWN_TIME_IN_SECONDS:
                 self.reset()
@@ -134,6 +215,10 @@ class Npc(Character):
         return False
 
     def is_target_in_activation_distance(self, target):
+        if (self.store is not None
+                and target is self.player_manager
+                and not self.store.is_dirty(self.store_index)):
+            return bool(self.store.player_in_activation_distance_flags[self.store_index])
         if target.is_dead or target.is_immune:
             return False
         elif self.is_activated:
@@ -167,18 +252,32 @@ class Npc(Character):
 
             if not is_activated and is_target_in_activation_distance and not is_collision_between_fields:
                 self.is_activated = True
-                target_x = target.x
-                target_y = target.y
                 quote_type = QuoteType.ENEMY if self.is_enemy(target) else QuoteType.NPC
                 self.quotes_manager.push_quote_to_queue(quote_type, self, self._draw_size)
+                self.set_path_to_target(target)
             elif is_activated and is_target_in_activation_distance:
-                target_x = target.x
-                target_y = target.y
+                self.set_path_to_target(target)
             else:
                 self.is_activated = False
-                target_x = self.spawn_x
-                target_y = self.spawn_y
-            self.set_path(target_x, target_y)
+                self.set_path(self.spawn_x, self.spawn_y)
+
+    @override
+    def set_path(self, destination_x, destination_y) -> None:
+        destination_row = self.map_manager.get_row(destination_y)
+        destination_column = self.map_manager.get_column(destination_x)
+        if self.is_following_path_to((destination_row, destination_column)):
+            return
+        self.pathfinding_manager.request_path(self, destination_row, destination_column)
+
+    def set_path_to_target(self, target) -> None:
+        if target is self.player_manager:
+            path = self.pathfinding_manager.get_path_to_player(self.row, self.column)
+            if path is not None:
+                self.path = path
+                self.is_moving_to_destination_row_and_column = True
+                self.destination_row_and_column = (target.row, target.column)
+                return
+        self.set_path(target.x, target.y)
 
     @property
     def is_clicked(self):
@@ -196,8 +295,7 @@ class Npc(Character):
         self.last_attack_time = float('-inf')
         self.increase_hp(-1)
         self.increase_mana(-1)
-        self._x = self.spawn_x
-        self._y = self.spawn_y
+        self.set_position(self.spawn_x, self.spawn_y)
         self.is_activated = False
 
     def handle_quote(self):
@@ -211,19 +309,20 @@ class Npc(Character):
         #     self.is_activated = False
 
     def get_nearest_target(self):
-        nearest_target = None
-        nearest_distance = float('inf')
-        for npc in self.npcs_manager.npcs[self._map_id]:
-            if npc != self and not npc.is_dead:
-                distance = euclidean_distance(self.position, npc.position)
-                if distance < nearest_distance:
-                    nearest_distance = distance
-                    nearest_target = npc
-
-        if euclidean_distance(self.position, self.player_manager.position) < nearest_distance:
-            nearest_target = self.player_manager
-
-        return nearest_target
+        distance_to_player = self.distance_to_player
+        if self.spatial_hash is None:
+            return self.player_manager
+
+        # only npcs closer than the player can be chosen, player wins otherwise
+        nearest_npcs = self.spatial_hash.query_nearest(
+            self._x,
+            self._y,
+            max_radius=distance_to_player,
+            predicate=lambda npc: npc is not self and not npc.is_dead
+        )
+        if nearest_npcs:
+            return nearest_npcs[0]
+        return self.player_manager
 
     def perform_hostile_actions(self, delta_time):
         target = self.get_nearest_target()
@@ -244,10 +343,18 @@ class Npc(Character):
         for role in self.roles:
             role.interact()
 
+    def get_draw_state(self) -> tuple:
+        # mini hp bar is drawn over the npc
+        return (
+            *super().get_draw_state(),
+            self.is_dead,
+            self.attributes[CharacterAttributeType.HP],
+            self.attributes[CharacterAttributeType.MAX_HP]
+        )
+
     def draw_mini_hp_bar(self) -> None:
         if not self.is_dead:
-            screen_position = self.map_manager.convert_map_position_to_screen_position(self.x, self.y)
-            draw_x, draw_y = screen_position
+            draw_x, draw_y = self.viewport_manager.convert_map_position_to_screen_position(*self.render_position)
             mini_hp_bar_x = draw_x - (self.MINI_HP_BAR_WIDTH // 2)
             mini_hp_bar_y = draw_y - (self._draw_size // 2) - self.MINI_HP_BAR_OFFSET_Y
             if self.is_enemy(self.player_manager):
@@ -2,12 +2,12 @@ from typing import override
 
 from src.entities.npcs.npc_roles.npc_role import NpcRole
 from src.enums.npc_role_type import NpcRoleType
-from src.database_service import DatabaseService
 
 
 class Vendor(NpcRole):
     vendor_manager = None
     loot_manager = None
+    game_catalog = None
 
     def __init__(self, owner_reference):
         super().__init__(owner_reference)
@@ -20,16 +20,18 @@ class Vendor(NpcRole):
     def setup_references(cls):
         from src.managers.gameplay.loot_manager import LootManager
         from src.managers.gameplay.vendor_manager import VendorManager
+        from src.game_catalog import GameCatalog
 
         cls.vendor_manager = VendorManager.get_instance()
         cls.loot_manager = LootManager.get_instance()
+        cls.game_catalog = GameCatalog.get_instance()
 
     def get_items(self):
         return self.items
 
     def generate_items(self):
         items_to_generate = self.vendor_manager.grid_size
-        generated_items = DatabaseService.get_random_items(items_to_generate)
+        generated_items = self.game_catalog.get_random_items(items_to_generate)
         return [[generated_item, 1] for generated_item in generated_items]
 
     @override
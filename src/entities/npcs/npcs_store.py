@@ -0,0 +1,79 @@
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from src.enums.character_attribute_type import CharacterAttributeType
+
+
+class NpcsStore:
+    # struct of arrays with the simulation state of all npcs on one map, npcs read and write it through their views
+
+    def __init__(self, npcs, activation_distance_hysteresis, attack_cooldown, respawn_time):
+        self.npcs = list(npcs)
+        self.size = len(self.npcs)
+
+        self.activation_distance_hysteresis = activation_distance_hysteresis
+        self.attack_cooldown = attack_cooldown
+        self.respawn_time = respawn_time
+
+        self.positions = np.array([npc.position for npc in self.npcs], dtype=np.float64).reshape(self.size, 2)
+        self.hp = np.array(
+            [npc.get_attribute(CharacterAttributeType.HP) for npc in self.npcs],
+            dtype=np.float64
+        )
+        self.activation_distances = np.array(
+            [npc.get_attribute(CharacterAttributeType.ACTIVATION_DISTANCE) for npc in self.npcs],
+            dtype=np.float64
+        )
+        self.death_times = np.array([npc.death_time for npc in self.npcs], dtype=np.float64)
+        self.last_attack_times = np.array([npc.last_attack_time for npc in self.npcs], dtype=np.float64)
+        self.activation_flags = np.array([npc.is_activated for npc in self.npcs], dtype=np.bool_)
+
+        # recomputed by update() once per tick
+        self.distances_to_player = np.full(self.size, np.inf)
+        self.player_in_activation_distance_flags = np.zeros(self.size, dtype=np.bool_)
+        self.attack_ready_flags = np.zeros(self.size, dtype=np.bool_)
+        self.respawn_due_flags = np.zeros(self.size, dtype=np.bool_)
+        # npcs moved or (de)activated since the last update, their batched results are stale
+        self.dirty_flags = np.zeros(self.size, dtype=np.bool_)
+
+        for index, npc in enumerate(self.npcs):
+            npc.attach_store(self, index)
+
+    @staticmethod
+    def is_available() -> bool:
+        return np is not None
+
+    def set_position(self, index, x, y) -> None:
+        self.positions[index, 0] = x
+        self.positions[index, 1] = y
+        self.dirty_flags[index] = True
+
+    def set_activated(self, index, is_activated) -> None:
+        self.activation_flags[index] = is_activated
+        self.dirty_flags[index] = True
+
+    def set_last_attack_time(self, index, last_attack_time) -> None:
+        self.last_attack_times[index] = last_attack_time
+        self.attack_ready_flags[index] = False
+
+    def is_dirty(self, index) -> bool:
+        return bool(self.dirty_flags[index])
+
+    def update(self, player_position, is_player_targetable, game_time) -> None:
+        if self.size == 0:
+            return
+
+        deltas = self.positions - np.asarray(player_position, dtype=np.float64)
+        self.distances_to_player = np.hypot(deltas[:, 0], deltas[:, 1])
+
+        is_dead = self.hp <= 0
+        activation_distances = (self.activation_distances
+                                + self.activation_flags * self.activation_distance_hysteresis)
+        self.player_in_activation_distance_flags = (
+            is_player_targetable & (self.distances_to_player <= activation_distances)
+        )
+        self.attack_ready_flags = (game_time - self.last_attack_times) > self.attack_cooldown
+        self.respawn_due_flags = is_dead & ((game_time - self.death_times) > self.respawn_time)
+        self.dirty_flags[:] = False
@@ -45,7 +45,17 @@ class Object(Entity):
     def is_clicked(self):
         return MouseManager.is_left_clicked() and self.is_name_hovered()
 
-    def draw_name(self, screen_position):
+    @override
+    def get_dirty_rect(self) -> pygame.Rect:
+        # name rect is placed while drawing, so it lags one frame behind a moving camera
+        return super().get_dirty_rect().union(self.name_rect)
+
+    @override
+    def get_draw_area_size(self) -> (int, int):
+        draw_area_width, draw_area_height = super().get_draw_area_size()
+        return max(draw_area_width, self.name_rect.width), draw_area_height
+
+    def set_name_position(self, screen_position):
         screen_x, screen_y = screen_position
 
         self.name_rect.x = screen_x - (self.name_rect.width // 2)
@@ -53,6 +63,7 @@ class Object(Entity):
                             - (self._draw_size // 2)
                             - self.NAME_OFFSET_Y)
 
+    def draw_name(self):
         if self.is_name_hovered():
             background_color = BLACK
             border_color = WHITE
@@ -85,5 +96,8 @@ class Object(Entity):
     def draw(self):
         super().draw()
         if self.map_manager.map_id == self._map_id:
-            position_on_screen = self.map_manager.convert_map_position_to_screen_position(self.x, self.y)
-            self.draw_name(position_on_screen)
+            position_on_screen = self.viewport_manager.convert_map_position_to_screen_position(self._x, self._y)
+            # name is hit tested on screen, it has to follow the camera even when it is not drawn
+            self.set_name_position(position_on_screen)
+            if self.is_visible:
+                self.draw_name()
@@ -5,6 +5,7 @@ from src.entities.objects.object import Object
 
 
 class LocationChanger(Object):
+    LIGHT_RADIUS = 150
 
     def __init__(self, game_surface, map_id, x, y, destination_map_id, destination_x, destination_y,
                  draw_size, name, sprite_name):
@@ -28,3 +29,5 @@ class LocationChanger(Object):
         self.interactive_objects_manager.update()
         self.npcs_manager.update()
         self.quotes_manager.clear_quotes_queue()
+        self.player_manager.journal_position()
+        self.save_manager.request_save()
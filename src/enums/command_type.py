@@ -5,3 +5,11 @@ class CommandType(StrEnum):
     QUIT = 'quit'
     GAME_TIME = 'game time'
     POSITION = 'position'
+    PATHFINDING = 'pathfinding'
+    PERF = 'perf'
+    PERF_RECORD = 'perf record'
+    PERF_STOP = 'perf stop'
+    DIRTY_RECTS = 'dirty rects'
+    TEXT_CACHE = 'text cache'
+    RENDER_SCALE = 'render scale'
+    SAVE = 'save'
@@ -0,0 +1,13 @@
+from enum import StrEnum
+
+
+class FramePhaseType(StrEnum):
+    INPUT = 'input'
+    PLAYER = 'player'
+    PATHFINDING = 'pathfinding'
+    AI = 'ai'
+    WORLD = 'world'
+    DRAW_MAP = 'draw_map'
+    DRAW_ENTITIES = 'draw_entities'
+    DRAW_UI = 'draw_ui'
+    PRESENT = 'present'
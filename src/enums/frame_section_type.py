@@ -0,0 +1,17 @@
+from enum import StrEnum
+
+
+class FrameSectionType(StrEnum):
+    MAP = 'map'
+    INTERACTIVE_OBJECTS = 'interactive_objects'
+    LOOT = 'loot'
+    NPCS = 'npcs'
+    PLAYER_CHARACTER = 'player_character'
+    NIGHT_OVERLAY = 'night_overlay'
+    HOVERED_NPC_INFO = 'hovered_npc_info'
+    NPC_UPDATE_TIERS = 'npc_update_tiers'
+    QUOTES = 'quotes'
+    INTERFACE = 'interface'
+    FRAME_PROFILER = 'frame_profiler'
+    CURSOR = 'cursor'
+    FLIP = 'flip'
@@ -4,3 +4,4 @@ from enum import Enum
 class GameMode(Enum):
     STANDARD = 0
     DEBUG = 1
+    HEADLESS = 2
@@ -0,0 +1,7 @@
+from enum import StrEnum
+
+
+class NpcUpdateTierType(StrEnum):
+    FULL = 'full'
+    REDUCED = 'reduced'
+    DORMANT = 'dormant'
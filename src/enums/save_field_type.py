@@ -0,0 +1,10 @@
+from enum import StrEnum
+
+
+class SaveFieldType(StrEnum):
+    PROGRESS = 'progress'
+    POSITION = 'position'
+    ATTRIBUTES = 'attributes'
+    CURRENCIES = 'currencies'
+    INVENTORY = 'inventory'
+    EQUIPMENT = 'equipment'
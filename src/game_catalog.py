@@ -0,0 +1,162 @@
+import random
+
+from database.game_database_table_columns_names import RaritiesTable, FactionsTable, EquipmentSlotsTable, \
+    AttributesTable, ObjectTypesTable, ItemsTable, ItemCategoriesTable
+from src.database_service import DatabaseService
+
+
+class GameCatalog:
+    _instance = None
+
+    @classmethod
+    def get_instance(cls):
+        return cls._instance
+
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if not hasattr(self, 'initialized'):
+            self.initialized = True
+
+            self.version = None
+
+            self.rarities = ()
+            self.rarities_by_id = {}
+            self.rarities_by_name = {}
+
+            self.factions = ()
+            self.factions_by_id = {}
+            self.factions_by_name = {}
+
+            self.equipment_slots = ()
+            self.equipment_slots_by_id = {}
+            self.equipment_slots_by_name = {}
+
+            self.attributes = ()
+            self.attributes_by_id = {}
+            self.attributes_by_name = {}
+
+            self.object_types = ()
+            self.object_types_by_id = {}
+            self.object_types_by_name = {}
+
+            self.item_categories = ()
+            self.item_categories_by_id = {}
+
+            self.items = ()
+            self.items_by_id = {}
+            self.items_by_rarity = {}
+            self.items_by_category = {}
+
+    @property
+    def is_loaded(self) -> bool:
+        return self.version is not None
+
+    def is_up_to_date(self) -> bool:
+        return self.is_loaded and self.version == DatabaseService.get_catalog_version()
+
+    @staticmethod
+    def read_tables() -> dict:
+        return {
+            RaritiesTable._TABLE_NAME: DatabaseService.get_rarities(),
+            FactionsTable._TABLE_NAME: DatabaseService.get_factions(),
+            EquipmentSlotsTable._TABLE_NAME: DatabaseService.get_equipment_slots(),
+            AttributesTable._TABLE_NAME: DatabaseService.get_attributes(),
+            ObjectTypesTable._TABLE_NAME: list(DatabaseService.get_object_types().values()),
+            ItemCategoriesTable._TABLE_NAME: DatabaseService.get_item_categories(),
+            ItemsTable._TABLE_NAME: DatabaseService.get_all_items()
+        }
+
+    def load(self) -> None:
+        if self.is_up_to_date():
+            return
+
+        from src.world_snapshot import WorldSnapshot
+        world_snapshot = WorldSnapshot.get_instance()
+        tables = world_snapshot.get_section('catalog') if world_snapshot is not None else None
+        if tables is None:
+            tables = self.read_tables()
+
+        self.rarities, self.rarities_by_id, self.rarities_by_name = self._index(
+            tables[RaritiesTable._TABLE_NAME],
+            RaritiesTable.RARITY_ID,
+            RaritiesTable.RARITY_NAME
+        )
+        self.factions, self.factions_by_id, self.factions_by_name = self._index(
+            tables[FactionsTable._TABLE_NAME],
+            FactionsTable.FACTION_ID,
+            FactionsTable.FACTION_NAME
+        )
+        self.equipment_slots, self.equipment_slots_by_id, self.equipment_slots_by_name = self._index(
+            tables[EquipmentSlotsTable._TABLE_NAME],
+            EquipmentSlotsTable.EQUIPMENT_SLOT_ID,
+            EquipmentSlotsTable.EQUIPMENT_SLOT_NAME
+        )
+        self.attributes, self.attributes_by_id, self.attributes_by_name = self._index(
+            tables[AttributesTable._TABLE_NAME],
+            AttributesTable.ATTRIBUTE_ID,
+            AttributesTable.ATTRIBUTE_NAME
+        )
+        self.object_types, self.object_types_by_id, self.object_types_by_name = self._index(
+            tables[ObjectTypesTable._TABLE_NAME],
+            ObjectTypesTable.OBJECT_TYPE_ID,
+            ObjectTypesTable.OBJECT_TYPE_NAME
+        )
+        self.item_categories, self.item_categories_by_id, _ = self._index(
+            tables[ItemCategoriesTable._TABLE_NAME],
+            ItemCategoriesTable.CATEGORY_ID,
+            ItemCategoriesTable.CATEGORY_NAME
+        )
+
+        self.items = tuple(tables[ItemsTable._TABLE_NAME])
+        self.items_by_id = {item[ItemsTable.ITEM_ID]: item for item in self.items}
+        self.items_by_rarity = self._group(self.items, ItemsTable.RARITY_ID)
+        self.items_by_category = self._group(self.items, ItemsTable.CATEGORY_ID)
+
+        self.version = DatabaseService.get_catalog_version()
+
+    @staticmethod
+    def _index(rows, id_column, name_column):
+        rows = tuple(rows)
+        return (
+            rows,
+            {row[id_column]: row for row in rows},
+            {row[name_column]: row for row in rows}
+        )
+
+    @staticmethod
+    def _group(rows, column):
+        groups = {}
+        for row in rows:
+            groups.setdefault(row[column], []).append(row)
+        return {key: tuple(group) for key, group in groups.items()}
+
+    def get_rarity_name(self, rarity_id):
+        return self.rarities_by_id[rarity_id][RaritiesTable.RARITY_NAME]
+
+    def get_faction_name(self, faction_id):
+        faction = self.factions_by_id.get(faction_id)
+        if faction is None:
+            return None
+        return faction[FactionsTable.FACTION_NAME]
+
+    def get_equipment_slot_id(self, equipment_slot_name):
+        return self.equipment_slots_by_name[equipment_slot_name][EquipmentSlotsTable.EQUIPMENT_SLOT_ID]
+
+    def get_item(self, item_id):
+        return self.items_by_id.get(item_id)
+
+    def get_items(self, item_ids):
+        return [self.items_by_id[item_id] for item_id in item_ids if item_id in self.items_by_id]
+
+    def get_random_items(self, how_many):
+        if not self.items:
+            return []
+
+        items = random.sample(self.items, min(how_many, len(self.items)))
+        while len(items) < how_many:
+            items.extend(random.sample(self.items, min(how_many - len(items), len(self.items))))
+        return items
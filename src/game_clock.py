@@ -1,6 +1,6 @@
 import pygame
 
-from config import MAX_FPS
+from config import MAX_FPS, SIMULATION_RATE, MAX_SIMULATION_STEPS_PER_FRAME
 
 
 class GameClock:
@@ -26,6 +26,15 @@ class GameClock:
 
             self._delta_time = 0.0
 
+            # simulation runs in fixed steps, rendering once per frame in between them
+            self.simulation_delta_time = 1 / SIMULATION_RATE
+            self.max_simulation_steps_per_frame = MAX_SIMULATION_STEPS_PER_FRAME
+            self._accumulated_time = 0.0
+            self.simulation_step_nr = 0
+            # how far the rendered frame is between the previous and the last simulation step
+            self.interpolation_factor = 1.0
+            self.dropped_simulation_time = 0.0
+
     @property
     def game_time(self):
         return self._game_time
@@ -47,6 +56,27 @@ class GameClock:
         self._delta_time = self._game_clock.tick(MAX_FPS) / 1_000
         return self._delta_time
 
-    def update(self):
-        if not self._is_game_paused:
-            self._game_time += self._delta_time
+    def tick_fixed(self, delta_time) -> float:
+        # used by the headless simulation, frames are not limited and always last delta_time
+        self._delta_time = delta_time
+        return self._delta_time
+
+    def get_simulation_steps_count(self) -> int:
+        if self._is_game_paused:
+            return 0
+
+        self._accumulated_time += self._delta_time
+        simulation_steps_count = int(self._accumulated_time / self.simulation_delta_time)
+        if simulation_steps_count > self.max_simulation_steps_per_frame:
+            # after a long frame the game slows down instead of spending the next frames catching up
+            simulation_steps_count = self.max_simulation_steps_per_frame
+            simulation_time = simulation_steps_count * self.simulation_delta_time
+            self.dropped_simulation_time += self._accumulated_time - simulation_time
+            self._accumulated_time = simulation_time
+        self._accumulated_time -= simulation_steps_count * self.simulation_delta_time
+        self.interpolation_factor = self._accumulated_time / self.simulation_delta_time
+        return simulation_steps_count
+
+    def begin_simulation_step(self) -> None:
+        self.simulation_step_nr += 1
+        self._game_time += self.simulation_delta_time
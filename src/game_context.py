@@ -1,18 +1,25 @@
+import os
+
 import pygame
 
 from project_info import _PROJECT_NAME
+from src.common_utils import load_image
 from src.enums.game_mode import GameMode
 from src.game_clock import GameClock
 from src.managers.core.accounts_manager import AccountsManager
 from src.managers.core.mouse_manager import MouseManager
 from src.managers.core.sound_manager import SoundManager
+from src.managers.ui.text_cache_manager import TextCacheManager
 from src.paths import PATH_IMAGE_LOGO
 from src.screens.screen_manager import ScreenManager
+from src.world_snapshot import WorldSnapshot
 
 
 class GameContext:
     _instance = None
 
+    HEADLESS_SCREEN_SIZE = (1920, 1080)
+
     @classmethod
     def get_instance(cls):
         return cls._instance
@@ -27,8 +34,13 @@ class GameContext:
             self.initialized = True
 
             self.game_mode = game_mode
+            # opened before anything is loaded, stale or missing snapshot is ignored
+            self.world_snapshot = WorldSnapshot()
 
-            self._screen_surface = self.init_game_resources()
+            if self.is_headless:
+                self._screen_surface = self.init_headless_game_resources()
+            else:
+                self._screen_surface = self.init_game_resources()
             self._game_surface = pygame.Surface(
                 (
                     self._screen_surface.get_width(),
@@ -40,7 +52,10 @@ class GameContext:
             self.game_clock = GameClock()
 
             self.sound_manager = SoundManager()
+            if self.is_headless:
+                self.sound_manager.disable_music()
             self.mouse_manager = MouseManager(self.game_surface)
+            self.text_cache_manager = TextCacheManager()
             self.accounts_manager = AccountsManager()
             self.screen_manager = ScreenManager()
 
@@ -48,6 +63,10 @@ class GameContext:
     def is_in_debug_mode(self):
         return self.game_mode == GameMode.DEBUG
 
+    @property
+    def is_headless(self):
+        return self.game_mode == GameMode.HEADLESS
+
     @property
     def game_surface(self):
         return self._game_surface
@@ -61,7 +80,7 @@ class GameContext:
         pygame.init()
 
         pygame.display.set_caption(_PROJECT_NAME)
-        pygame.display.set_icon(pygame.image.load(PATH_IMAGE_LOGO))
+        pygame.display.set_icon(load_image(PATH_IMAGE_LOGO))
 
         screen_info = pygame.display.Info()
         SCREEN_WIDTH, SCREEN_HEIGHT = screen_info.current_w, screen_info.current_h
@@ -76,3 +95,12 @@ class GameContext:
         )
 
         return screen_surface
+
+    @classmethod
+    def init_headless_game_resources(cls) -> pygame.Surface:
+        # dummy drivers have to be selected before pygame initializes the display and the mixer
+        os.environ['SDL_VIDEODRIVER'] = 'dummy'
+        os.environ['SDL_AUDIODRIVER'] = 'dummy'
+        pygame.init()
+
+        return pygame.display.set_mode(cls.HEADLESS_SCREEN_SIZE)
@@ -2,11 +2,15 @@ import pygame
 
 from src.colors import BLACK, WHITE
 from src.fonts import FONT_ARIAL_18
+from src.interface.cached_surface import CachedSurface
 from src.interface.interface_constants import BORDER_WIDTH
+from src.managers.ui.text_cache_manager import render_text
 
 
 class Bar:
     INFO_RECT_WIDTH_PADDING = 5
+    # a few fillings are kept, bars like npc mini hp bars are shared by many npcs
+    CACHED_FILLINGS_COUNT = 8
 
     def __init__(self, game_surface, x, y, width, height, color, is_fill_complement=False, parts=1, text=None,
                  border_radius=0):
@@ -26,6 +30,8 @@ class Bar:
         self.text = text
         self.hoverable = text is not None
         self.info_text_font = FONT_ARIAL_18
+        self.cached_surface = CachedSurface(self.rect.size, self.render, capacity=self.CACHED_FILLINGS_COUNT,
+                                            is_opaque=True)
 
     def set_position(self, x, y):
         self.rect = pygame.Rect(
@@ -35,25 +41,26 @@ class Bar:
             self.height
         )
 
-    def draw(self, value: int, max_value: int) -> None:
+    def get_filled_width(self, value: int, max_value: int) -> int:
+        if self.is_fill_complement:
+            return int(((max_value - value) / max_value) * self.width)
+        return int((value / max_value) * self.width)
+
+    def render(self, surface, filled_width) -> None:
         pygame.draw.rect(
-            self.game_surface,
+            surface,
             BLACK,
-            self.rect,
+            (0, 0, self.width, self.height),
             border_radius=self.border_radius
         )
 
         # draw filling
-        if self.is_fill_complement:
-            filled_width = int(((max_value - value) / max_value) * self.width)
-        else:
-            filled_width = int((value / max_value) * self.width)
         pygame.draw.rect(
-            self.game_surface,
+            surface,
             self.color,
             (
-                self.rect.x + BORDER_WIDTH,
-                self.rect.y + BORDER_WIDTH,
+                BORDER_WIDTH,
+                BORDER_WIDTH,
                 filled_width - (2 * BORDER_WIDTH),
                 self.height - (2 * BORDER_WIDTH)
             ),
@@ -65,21 +72,25 @@ class Bar:
         for part_nr in range(1, self.parts):
             division_x = (part_nr * part_width + ((part_nr - 1) * BORDER_WIDTH))
             pygame.draw.rect(
-                self.game_surface,
+                surface,
                 BLACK,
                 (
-                    self.rect.x + division_x - BORDER_WIDTH,
-                    self.rect.y,
+                    division_x - BORDER_WIDTH,
+                    0,
                     BORDER_WIDTH,
                     self.height
                 )
             )
 
+    def draw(self, value: int, max_value: int) -> None:
+        self.game_surface.blit(self.cached_surface.get(self.get_filled_width(value, max_value)), self.rect.topleft)
+
     def draw_info(self, value, max_value):
         mouse_x, mouse_y = pygame.mouse.get_pos()
         info_rect_x = mouse_x + 20
         info_rect_y = mouse_y
-        info_text = self.info_text_font.render(
+        info_text = render_text(
+            self.info_text_font,
             f'{self.text}: {value}/{max_value} ({round(value / max_value * 100, 2)}%)',
             True,
             WHITE
@@ -3,6 +3,7 @@ import pygame
 from src.colors import WHITE, GRAY, BLACK
 from src.common_utils import adjust_color
 from src.fonts import FONT_ALICE_IN_WONDERLAND_32
+from src.interface.cached_surface import CachedSurface
 from src.interface.interface_constants import BORDER_WIDTH
 from src.managers.core.mouse_manager import MouseManager
 
@@ -79,6 +80,8 @@ class Button:
             border_radius=90
         )
 
+        self.cached_surface = CachedSurface(self._rect.size, self.render)
+
     @property
     def is_hovered(self) -> bool:
         return self._rect.collidepoint(pygame.mouse.get_pos())
@@ -93,37 +96,41 @@ class Button:
             return True
         return False
 
-    def draw_not_ready_overlay(self):
-        self._parent.blit(self.not_ready_overlay_surface, (self.x, self.y))
-
-    def draw(self) -> None:
-        current_color = self._button_color
-        if self.is_hovered:
-            current_color = self._button_hover_color
-        if self._is_pressed:
-            current_color = self._button_press_color
+    def render(self, surface, state):
+        current_color, is_ready = state
+        local_rect = surface.get_rect()
 
         pygame.draw.rect(
-            self._parent,
+            surface,
             current_color,
-            self._rect,
+            local_rect,
             border_radius=90
         )
 
         if self._has_border:
             pygame.draw.rect(
-                self._parent,
+                surface,
                 BLACK,
-                self._rect,
+                local_rect,
                 width=BORDER_WIDTH,
                 border_radius=90
             )
 
         if self._image:
-            self._parent.blit(self._image, (self.x, self.y))
+            surface.blit(self._image, (0, 0))
 
         if self._text:
-            self._parent.blit(self._text, self._text_rect)
+            surface.blit(self._text, self._text_rect.move(-self.x, -self.y))
+
+        if not is_ready:
+            surface.blit(self.not_ready_overlay_surface, (0, 0))
+
+    def draw(self) -> None:
+        current_color = self._button_color
+        if self.is_hovered:
+            current_color = self._button_hover_color
+        if self._is_pressed:
+            current_color = self._button_press_color
+        is_ready = self._is_ready_check is None or self._is_ready_check()
 
-        if self._is_ready_check is not None and not self._is_ready_check():
-            self.draw_not_ready_overlay()
+        self._parent.blit(self.cached_surface.get((current_color, is_ready)), (self.x, self.y))
@@ -0,0 +1,40 @@
+import pygame
+
+
+class CachedSurface:
+    TRANSPARENT = (0, 0, 0, 0)
+    # never drawn by opaque widgets, marks their rounded corners
+    COLORKEY = (255, 0, 255)
+
+    def __init__(self, size, render_function, capacity=1, is_opaque=False):
+        self.size = size
+        # opaque widgets are blitted with a colorkey, much faster than per pixel alpha of big windows
+        self.is_opaque = is_opaque
+        # render_function(surface, state) draws the widget in local coordinates of the surface
+        self.render_function = render_function
+        # widgets shared between many owners, like npc mini hp bars, keep more than one state
+        self.capacity = capacity
+        self.surfaces = {}
+
+    def invalidate(self) -> None:
+        self.surfaces.clear()
+
+    def create_surface(self) -> pygame.Surface:
+        if not self.is_opaque:
+            return pygame.Surface(self.size, pygame.SRCALPHA)
+        surface = pygame.Surface(self.size)
+        surface.set_colorkey(self.COLORKEY, pygame.RLEACCEL)
+        return surface
+
+    def get(self, state) -> pygame.Surface:
+        surface = self.surfaces.get(state)
+        if surface is None:
+            if len(self.surfaces) < self.capacity:
+                surface = self.create_surface()
+            else:
+                # the oldest state makes room for the new one
+                surface = self.surfaces.pop(next(iter(self.surfaces)))
+            surface.fill(self.COLORKEY if self.is_opaque else self.TRANSPARENT)
+            self.render_function(surface, state)
+            self.surfaces[state] = surface
+        return surface
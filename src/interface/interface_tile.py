@@ -53,30 +53,36 @@ class InterfaceTile:
         self.name = name
         self.name_text = self.NAME_FONT.render(self.name, True, WHITE)
 
-    def draw_requirements_not_met_overlay(self):
-        self.game_surface.blit(self.REQUIREMENTS_NOT_MET_OVERLAY, self.rect.topleft)
+    def get_render_state(self) -> tuple:
+        return self.icon, self.are_requirements_met()
 
-    def draw_icon(self):
-        self.game_surface.blit(
+    def draw_requirements_not_met_overlay(self, surface, position):
+        surface.blit(self.REQUIREMENTS_NOT_MET_OVERLAY, position)
+
+    def draw_icon(self, surface, position):
+        surface.blit(
             self.icon,
-            self.rect
+            position
         )
 
         if not self.are_requirements_met():
-            self.draw_requirements_not_met_overlay()
+            self.draw_requirements_not_met_overlay(surface, position)
 
         # draw black border
         pygame.draw.rect(
-            self.game_surface,
+            surface,
             BLACK,
-            self.rect,
+            (position, self.rect.size),
             width=BORDER_WIDTH
         )
 
     @abstractmethod
-    def draw(self):
+    def render(self, surface, position):
         pass
 
+    def draw(self):
+        self.render(self.game_surface, self.rect.topleft)
+
     @abstractmethod
     def draw_hover_info(self):
         pass
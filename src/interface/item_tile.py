@@ -4,11 +4,11 @@ from typing import override
 import pygame
 
 from database.game_database_table_columns_names import ItemsTable, AttributesTable, ItemAttributesTable
-from src.colors import BLACK, WHITE, RARITY_COLORS
-from src.database_service import DatabaseService
+from src.colors import BLACK, WHITE, LIGHT_RED, RARITY_COLORS
 from src.fonts import FONT_ARIAL_18, FONT_ARIAL_16
 from src.interface.interface_constants import BORDER_WIDTH, INTERFACE_TILE_SIZE
 from src.interface.interface_tile import InterfaceTile
+from src.managers.ui.text_cache_manager import render_text
 
 
 class ItemTile(InterfaceTile):
@@ -18,9 +18,14 @@ class ItemTile(InterfaceTile):
     MARGIN_OFFSET = 5
     INFO_FONT = FONT_ARIAL_18
     ITEM_INFO_WINDOW_MAX_WIDTH_IN_CHARS = 50
+    REQUIRED_LVL_LINE = 'Requires level {}'
+
+    # finished tooltips shared by all item grids, keyed on item id and whether its required level is reached
+    tooltip_cards = {}
 
     player_manager = None
     item_icons_manager = None
+    game_catalog = None
 
     def __init__(self, game_surface, x, y):
         super().__init__(
@@ -37,9 +42,11 @@ class ItemTile(InterfaceTile):
     def setup_references(cls):
         from src.managers.ui.item_icons_manager import ItemIconsManager
         from src.managers.gameplay.player_manager import PlayerManager
+        from src.game_catalog import GameCatalog
 
         cls.player_manager = PlayerManager.get_instance()
         cls.item_icons_manager = ItemIconsManager.get_instance()
+        cls.game_catalog = GameCatalog.get_instance()
 
     @override
     @property
@@ -76,25 +83,29 @@ class ItemTile(InterfaceTile):
                 lines.append(chunk)
 
         if item_info[ItemsTable.REQUIRED_LVL] > 0:
-            lines.append(f'Requires level {item_info[ItemsTable.REQUIRED_LVL]}')
+            lines.append(self.REQUIRED_LVL_LINE.format(item_info[ItemsTable.REQUIRED_LVL]))
 
         lines.append(f'Value: {item_info[ItemsTable.ITEM_VALUE]}')
 
         return lines
 
-    def draw_item_quantity(self):
+    @override
+    def get_render_state(self) -> tuple:
+        return *super().get_render_state(), self.item_quantity
+
+    def draw_item_quantity(self, surface, position):
         if self.item_quantity is not None and self.item_quantity > 1:
-            quantity_text = self.QUANTITY_FONT.render(str(self.item_quantity), False, WHITE)
+            quantity_text = render_text(self.QUANTITY_FONT, str(self.item_quantity), False, WHITE)
             quantity_rect = pygame.Rect(
-                self.rect.x + self.QUANTITY_TILE_SIZE,
-                self.rect.y + self.QUANTITY_TILE_SIZE,
+                position[0] + self.QUANTITY_TILE_SIZE,
+                position[1] + self.QUANTITY_TILE_SIZE,
                 self.QUANTITY_TILE_SIZE,
                 self.QUANTITY_TILE_SIZE
             )
 
             # draw black background
             pygame.draw.rect(
-                self.game_surface,
+                surface,
                 BLACK,
                 quantity_rect,
                 border_radius=10
@@ -102,7 +113,7 @@ class ItemTile(InterfaceTile):
 
             # draw white border
             pygame.draw.rect(
-                self.game_surface,
+                surface,
                 WHITE,
                 quantity_rect,
                 width=BORDER_WIDTH,
@@ -116,30 +127,41 @@ class ItemTile(InterfaceTile):
                                + (self.QUANTITY_TILE_SIZE // 2)
                                - (quantity_text.get_height() // 2))
 
-            self.game_surface.blit(quantity_text, (quantity_text_x, quantity_text_y))
+            surface.blit(quantity_text, (quantity_text_x, quantity_text_y))
 
     @override
-    def draw(self):
-        self.draw_icon()
-        self.draw_item_quantity()
+    def render(self, surface, position):
+        self.draw_icon(surface, position)
+        self.draw_item_quantity(surface, position)
 
-    @override
-    def draw_hover_info(self) -> None:
-        mouse_x, mouse_y = pygame.mouse.get_pos()
-        if not self.is_empty:
-            name_text = self.NAME_FONT.render(
+    @classmethod
+    def clear_tooltip_cards(cls) -> None:
+        cls.tooltip_cards.clear()
+
+    def get_tooltip_card_key(self):
+        if self.is_empty:
+            return self.name
+        return self.item_info[ItemsTable.ITEM_ID], self.are_requirements_met()
+
+    def get_item_info_texts(self) -> list:
+        is_required_lvl_reached = self.are_requirements_met()
+        required_lvl_line = self.REQUIRED_LVL_LINE.format(self.item_info[ItemsTable.REQUIRED_LVL])
+        infos = [
+            self.NAME_FONT.render(
                 self.item_info[ItemsTable.ITEM_NAME],
                 False,
-                RARITY_COLORS[DatabaseService.get_rarity_by_id(self.item_info[ItemsTable.RARITY_ID])]
+                RARITY_COLORS[self.game_catalog.get_rarity_name(self.item_info[ItemsTable.RARITY_ID])]
             )
-            infos = [name_text]
-            infos_widths = [name_text.get_width()]
-            info_lines = self.get_item_formatted_info(self.item_info)
-            for line in info_lines:
-                info_text = self.INFO_FONT.render(line, False, WHITE)
-                infos.append(info_text)
-                infos_widths.append(info_text.get_width())
-            info_window_width = max(infos_widths) + (2 * self.MARGIN_OFFSET)
+        ]
+        for line in self.get_item_formatted_info(self.item_info):
+            line_color = LIGHT_RED if line == required_lvl_line and not is_required_lvl_reached else WHITE
+            infos.append(self.INFO_FONT.render(line, False, line_color))
+        return infos
+
+    def create_tooltip_card(self) -> pygame.Surface:
+        if not self.is_empty:
+            infos = self.get_item_info_texts()
+            info_window_width = max(info.get_width() for info in infos) + (2 * self.MARGIN_OFFSET)
             info_window_height = len(infos) * (self.INFO_FONT.get_height() + self.MARGIN_OFFSET)
         elif self.name == self.EMPTY_INTERFACE_TILE_NAME:
             info_window_width = self.EMPTY_INTERFACE_TILE_NAME_TEXT.get_width() + (2 * self.MARGIN_OFFSET)
@@ -150,42 +172,57 @@ class ItemTile(InterfaceTile):
             info_window_height = self.INFO_FONT.get_height() + (2 * self.MARGIN_OFFSET)
             infos = [self.name_text]
 
-        if mouse_x < self.game_surface.get_width() // 2:
-            window_x_pos = self.rect.x + INTERFACE_TILE_SIZE
-        else:
-            window_x_pos = self.rect.x - info_window_width
-
-        if mouse_y + info_window_height < self.game_surface.get_height():
-            window_y_pos = mouse_y
-        else:
-            window_y_pos = mouse_y - info_window_height
+        tooltip_card = pygame.Surface((info_window_width, info_window_height), pygame.SRCALPHA)
 
         # draw black background
         pygame.draw.rect(
-            self.game_surface, BLACK,
-            (window_x_pos,
-             window_y_pos,
-             info_window_width,
-             info_window_height),
+            tooltip_card,
+            BLACK,
+            tooltip_card.get_rect(),
             border_radius=10
         )
 
         # draw white border
         pygame.draw.rect(
-            self.game_surface, WHITE,
-            (window_x_pos,
-             window_y_pos,
-             info_window_width,
-             info_window_height),
+            tooltip_card,
+            WHITE,
+            tooltip_card.get_rect(),
             width=BORDER_WIDTH,
             border_radius=10
         )
 
         for info_nr in range(len(infos)):
-            self.game_surface.blit(
+            tooltip_card.blit(
                 infos[info_nr],
                 (
-                    window_x_pos + self.MARGIN_OFFSET,
-                    window_y_pos + (info_nr * (self.INFO_FONT.get_height() + self.MARGIN_OFFSET))
+                    self.MARGIN_OFFSET,
+                    info_nr * (self.INFO_FONT.get_height() + self.MARGIN_OFFSET)
                 )
             )
+
+        return tooltip_card
+
+    def get_tooltip_card(self) -> pygame.Surface:
+        tooltip_card_key = self.get_tooltip_card_key()
+        tooltip_card = self.tooltip_cards.get(tooltip_card_key)
+        if tooltip_card is None:
+            tooltip_card = self.create_tooltip_card()
+            self.tooltip_cards[tooltip_card_key] = tooltip_card
+        return tooltip_card
+
+    @override
+    def draw_hover_info(self) -> None:
+        mouse_x, mouse_y = pygame.mouse.get_pos()
+        tooltip_card = self.get_tooltip_card()
+
+        if mouse_x < self.game_surface.get_width() // 2:
+            window_x_pos = self.rect.x + INTERFACE_TILE_SIZE
+        else:
+            window_x_pos = self.rect.x - tooltip_card.get_width()
+
+        if mouse_y + tooltip_card.get_height() < self.game_surface.get_height():
+            window_y_pos = mouse_y
+        else:
+            window_y_pos = mouse_y - tooltip_card.get_height()
+
+        self.game_surface.blit(tooltip_card, (window_x_pos, window_y_pos))
@@ -1,5 +1,6 @@
 import pygame
 
+from src.interface.cached_surface import CachedSurface
 from src.interface.interface_constants import INTERFACE_TILE_SIZE
 from src.interface.item_tile import ItemTile
 from src.managers.ui.item_icons_manager import ItemIconsManager
@@ -24,6 +25,10 @@ class ItemTilesGrid:
         self.item_icons_manager = ItemIconsManager.get_instance()
         self.tiles = []
         self.create_grid()
+        self.cached_surface = CachedSurface(
+            (self.columns * INTERFACE_TILE_SIZE, self.rows * INTERFACE_TILE_SIZE),
+            self.render
+        )
 
     def create_grid(self):
         tiles_added = 0
@@ -107,20 +112,18 @@ class ItemTilesGrid:
                 tile_nr += 1
         return None
 
+    def get_visible_tiles(self) -> list:
+        return [tile for row in self.tiles for tile in row][:self.max_tiles]
+
+    def render(self, surface, tiles_states):
+        for tile in self.get_visible_tiles():
+            tile.render(surface, (tile.rect.x - self.rect.x, tile.rect.y - self.rect.y))
+
     def draw(self):
-        tile_nr = 0
-        for row_nr in range(self.rows):
-            for column_nr in range(self.columns):
-                if tile_nr == self.max_tiles:
-                    return
-                self.tiles[row_nr][column_nr].draw()
-                tile_nr += 1
+        # the whole grid is rendered again only when any of its visible tiles changed
+        tiles_states = tuple(tile.get_render_state() for tile in self.get_visible_tiles())
+        self.game_surface.blit(self.cached_surface.get(tiles_states), self.rect.topleft)
 
     def draw_hovered(self):
-        tile_nr = 0
-        for row_nr in range(self.rows):
-            for column_nr in range(self.columns):
-                if tile_nr == self.max_tiles:
-                    return
-                self.tiles[row_nr][column_nr].draw_hovered()
-                tile_nr += 1
+        for tile in self.get_visible_tiles():
+            tile.draw_hovered()
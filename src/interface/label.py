@@ -1,6 +1,7 @@
 import pygame
 
 from src.colors import BLACK, WHITE
+from src.interface.cached_surface import CachedSurface
 from src.interface.interface_constants import BORDER_WIDTH
 
 
@@ -16,25 +17,35 @@ class Label:
         self.background_color = background_color
         self.border_color = border_color
         self.border_radius = border_radius
+        self.cached_surface = CachedSurface(self.rect.size, self.render, is_opaque=True)
 
     @property
     def is_hovered(self):
         return self.rect.collidepoint(pygame.mouse.get_pos())
 
-    def draw(self):
+    def render(self, surface, colors):
+        background_color, border_color = colors
+        local_rect = surface.get_rect()
+
         # draw background
         pygame.draw.rect(
-            self.game_surface,
-            self.background_color,
-            self.rect,
+            surface,
+            background_color,
+            local_rect,
             border_radius=self.border_radius
         )
 
         # draw border
         pygame.draw.rect(
-            self.game_surface,
-            self.border_color,
-            self.rect,
+            surface,
+            border_color,
+            local_rect,
             width=BORDER_WIDTH,
             border_radius=self.border_radius
         )
+
+    def draw(self):
+        self.game_surface.blit(
+            self.cached_surface.get((self.background_color, self.border_color)),
+            self.rect.topleft
+        )
@@ -36,12 +36,9 @@ class ScrollableItemTilesGrid(ItemTilesGrid):
         if self.handle_scrolling(event):
             return True
 
-    def draw(self):
-        for row_nr in range(self.rows):
-            for column_nr in range(self.columns):
-                self.tiles[row_nr + self.row_offset][column_nr].draw()
-
-    def draw_hovered(self):
-        for row_nr in range(self.rows):
-            for column_nr in range(self.columns):
-                self.tiles[row_nr + self.row_offset][column_nr].draw_hovered()
+    def get_visible_tiles(self) -> list:
+        return [
+            self.tiles[row_nr + self.row_offset][column_nr]
+            for row_nr in range(self.rows)
+            for column_nr in range(self.columns)
+        ]
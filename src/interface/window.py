@@ -3,6 +3,7 @@ import pygame
 from src.colors import GRAY, RED, BLACK, WHITE
 from src.fonts import FONT_ALICE_IN_WONDERLAND_16
 from src.interface.button import Button
+from src.interface.cached_surface import CachedSurface
 from src.interface.interface_constants import BORDER_WIDTH, WINDOW_DEFAULT_STRIPE_HEIGHT, WINDOW_DEFAULT_BORDER_RADIUS
 
 
@@ -23,6 +24,8 @@ class Window:
             self.rect.height - (2 * BORDER_WIDTH) - (2 * self.stripe_height)
         )
 
+        self.cached_surface = CachedSurface(self.rect.size, self.render_window, is_opaque=True)
+
         self.name_font = FONT_ALICE_IN_WONDERLAND_16
         self.name = None
         self.name_text = None
@@ -84,22 +87,25 @@ class Window:
                     return True
         return False
 
-    def draw_window(self):
+    def render_window(self, surface, state):
         pygame.draw.rect(
-            self.game_surface,
+            surface,
             BLACK,
-            self.rect,
+            surface.get_rect(),
             border_radius=self.border_radius
         )
 
         pygame.draw.rect(
-            self.game_surface,
+            surface,
             self.color,
-            self.content_rect
+            self.content_rect.move(-self.rect.x, -self.rect.y)
         )
 
-    def draw_name(self):
-        self.game_surface.blit(self.name_text, self.name_position)
+        surface.blit(self.name_text, (self.name_position[0] - self.rect.x, self.name_position[1] - self.rect.y))
+
+    def draw_window(self):
+        # frame and name change rarely, content of the window is drawn on top of the cached frame
+        self.game_surface.blit(self.cached_surface.get((self.name, self.color)), self.rect.topleft)
 
     def draw_buttons(self):
         for window_button in self._buttons:
@@ -108,5 +114,4 @@ class Window:
     def draw(self):
         if self.is_open:
             self.draw_window()
-            self.draw_name()
             self.draw_buttons()
@@ -2,6 +2,8 @@ import pygame
 
 KEY_SWITCH_SHOW_INTERFACE = pygame.K_F1
 KEY_SWITCH_SHOW_FPS_RATE = pygame.K_F2
+KEY_SWITCH_SHOW_NPC_UPDATE_TIERS = pygame.K_F3
+KEY_SWITCH_SHOW_FRAME_PROFILER = pygame.K_F4
 
 KEY_SWITCH_SHOW_FRIENDLY_NPC_MINI_HP_BARS = pygame.K_z
 KEY_SWITCH_SHOW_HOSTILE_NPC_MINI_HP_BARS = pygame.K_v
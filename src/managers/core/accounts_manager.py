@@ -36,6 +36,33 @@ class AccountsManager:
     def get_account_id(cls):
         return cls._account_id
 
+    @classmethod
+    def sign_in(cls, account_name, account_id):
+        cls._account_name = account_name
+        cls._account_id = account_id
+
+    @classmethod
+    def sign_in_by_id(cls, account_id) -> bool:
+        # skips the password check, meant for the headless simulation only
+        conn = sqlite3.connect(USERS_DATABASE_PATH)
+        try:
+            cursor = conn.cursor()
+            cursor.execute(
+                f'''
+                SELECT {AccountsTable.ACCOUNT_NAME}
+                FROM accounts
+                WHERE {AccountsTable.ACCOUNT_ID} = ?
+                ''',
+                (account_id,))
+            result = cursor.fetchone()
+        finally:
+            conn.close()
+
+        if result is None:
+            return False
+        cls.sign_in(result[0], account_id)
+        return True
+
     @staticmethod
     def is_password_valid(provided_password: str, stored_hash: str) -> bool:
         return bcrypt.checkpw(provided_password.encode('utf-8'), stored_hash.encode('utf-8'))
@@ -59,8 +86,7 @@ class AccountsManager:
                 user_id = result[0]
                 stored_password_hash = result[1]
                 if cls.is_password_valid(provided_password, stored_password_hash):
-                    cls._account_name = account_name
-                    cls._account_id = user_id
+                    cls.sign_in(account_name, user_id)
                     return True
 
             return False
@@ -0,0 +1,66 @@
+import atexit
+import sqlite3
+import threading
+
+
+class DatabaseConnectionManager:
+    STATEMENT_CACHE_SIZE = 256
+    MMAP_SIZE = 256 * 1024 * 1024
+    # negative value means KiB instead of pages
+    CACHE_SIZE = -16 * 1024
+
+    def __init__(self, database_path):
+        self.database_path = database_path
+        # every thread gets its own connections, keyed by thread id and whether they are read only
+        self._connections = {}
+        self._connections_lock = threading.Lock()
+        self._is_shutdown_hook_registered = False
+
+    def _open_connection(self):
+        # connections are never shared between threads, the check is off only so that close works from any thread
+        conn = sqlite3.connect(
+            self.database_path,
+            cached_statements=self.STATEMENT_CACHE_SIZE,
+            check_same_thread=False
+        )
+        conn.row_factory = sqlite3.Row
+        conn.execute(f'PRAGMA mmap_size = {self.MMAP_SIZE}')
+        conn.execute(f'PRAGMA cache_size = {self.CACHE_SIZE}')
+        # with the database in wal mode only the last commits can be lost on a power cut, the file never gets corrupted
+        conn.execute('PRAGMA synchronous = NORMAL')
+
+        if not self._is_shutdown_hook_registered:
+            atexit.register(self.close)
+            self._is_shutdown_hook_registered = True
+
+        return conn
+
+    def _get_connection(self, is_query_only):
+        connection_key = (threading.get_ident(), is_query_only)
+        conn = self._connections.get(connection_key)
+        if conn is None:
+            conn = self._open_connection()
+            if is_query_only:
+                conn.execute('PRAGMA query_only = ON')
+            with self._connections_lock:
+                self._connections[connection_key] = conn
+        return conn
+
+    def get_read_connection(self):
+        return self._get_connection(is_query_only=True)
+
+    def get_write_connection(self):
+        return self._get_connection(is_query_only=False)
+
+    def close(self) -> None:
+        with self._connections_lock:
+            connections = list(self._connections.items())
+            self._connections.clear()
+        for (_, is_query_only), conn in connections:
+            if not is_query_only:
+                # refreshes planner statistics of tables that grew since the last analyze
+                try:
+                    conn.execute('PRAGMA optimize')
+                except sqlite3.Error:
+                    pass
+            conn.close()
@@ -0,0 +1,212 @@
+from itertools import combinations
+
+import pygame
+
+from config import DIRTY_RECTS_RENDERING
+
+
+class DirtyRectsManager:
+    _instance = None
+
+    # updating more rects than that one by one costs more than updating their bounding rect at once
+    MAX_DIRTY_RECTS = 64
+    # every clip rect is a separate pass over all the draw calls of the frame
+    MAX_CLIP_RECTS = 4
+
+    @classmethod
+    def get_instance(cls):
+        return cls._instance
+
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self, game_surface, screen_surface):
+        if not hasattr(self, 'initialized'):
+            self.initialized = True
+
+            self.game_surface = game_surface
+            self.screen_surface = screen_surface
+            self.screen_rect = game_surface.get_rect()
+
+            self.game_clock = None
+            self.mouse_manager = None
+            self.frame_profiler_manager = None
+            self.map_manager = None
+            self.player_manager = None
+            self.viewport_manager = None
+            self.lighting_manager = None
+            self.render_scale_manager = None
+            self.npcs_manager = None
+            self.interactive_objects_manager = None
+            self.quotes_manager = None
+            self.interface_manager = None
+
+            self.is_enabled = DIRTY_RECTS_RENDERING
+
+            self.is_full_redraw = True
+            self._is_full_redraw_requested = True
+            # everything that changes the whole screen at once, any difference forces a full redraw
+            self._scene_state = None
+
+            self.dirty_rects = []
+            self._previous_rects = []
+
+            self.full_redraws_count = 0
+            self.partial_redraws_count = 0
+
+    def setup_references(self):
+        from src.game_clock import GameClock
+        from src.managers.core.mouse_manager import MouseManager
+        from src.managers.core.frame_profiler_manager import FrameProfilerManager
+        from src.managers.gameplay.map_manager import MapManager
+        from src.managers.gameplay.player_manager import PlayerManager
+        from src.managers.gameplay.viewport_manager import ViewportManager
+        from src.managers.gameplay.lighting_manager import LightingManager
+        from src.managers.core.render_scale_manager import RenderScaleManager
+        from src.managers.gameplay.npcs_manager import NpcsManager
+        from src.managers.gameplay.interactive_objects_manager import InteractiveObjectsManager
+        from src.managers.gameplay.quotes_manager import QuotesManager
+        from src.managers.ui.interface_manager import InterfaceManager
+
+        self.game_clock = GameClock.get_instance()
+        self.mouse_manager = MouseManager.get_instance()
+        self.frame_profiler_manager = FrameProfilerManager.get_instance()
+        self.map_manager = MapManager.get_instance()
+        self.player_manager = PlayerManager.get_instance()
+        self.viewport_manager = ViewportManager.get_instance()
+        self.lighting_manager = LightingManager.get_instance()
+        self.render_scale_manager = RenderScaleManager.get_instance()
+        self.npcs_manager = NpcsManager.get_instance()
+        self.interactive_objects_manager = InteractiveObjectsManager.get_instance()
+        self.quotes_manager = QuotesManager.get_instance()
+        self.interface_manager = InterfaceManager.get_instance()
+
+    def request_full_redraw(self) -> None:
+        self._is_full_redraw_requested = True
+
+    def switch_enabled(self) -> None:
+        self.is_enabled = not self.is_enabled
+        self.request_full_redraw()
+
+    def get_scene_state(self) -> tuple:
+        return (
+            self.map_manager.map_id,
+            # camera follows the rendered player, it can move between simulation steps
+            int(self.viewport_manager.offset_x),
+            int(self.viewport_manager.offset_y),
+            self.lighting_manager.lighting_state,
+            self.interface_manager.is_interface_visible,
+            self.player_manager.is_dead,
+            self.player_manager.is_immune,
+            self.game_clock.is_game_paused
+        )
+
+    def collect_rects(self) -> list:
+        rects = []
+        rects.extend(self.player_manager.get_dirty_rects())
+        rects.extend(self.npcs_manager.get_dirty_rects())
+        rects.extend(self.interactive_objects_manager.get_dirty_rects())
+        rects.extend(self.quotes_manager.get_dirty_rects())
+        rects.extend(self.interface_manager.get_dirty_rects())
+        rects.extend(self.frame_profiler_manager.get_dirty_rects())
+        rects.extend(self.mouse_manager.get_dirty_rects())
+        return [rect.clip(self.screen_rect) for rect in rects if rect.colliderect(self.screen_rect)]
+
+    def is_full_redraw_needed(self, scene_state) -> bool:
+        return (not self.is_enabled
+                or self._is_full_redraw_requested
+                # scaled world is upscaled to the whole screen every frame
+                or self.render_scale_manager.is_scaled
+                or scene_state != self._scene_state
+                # input can open windows, show tooltips and move the cursor anywhere
+                or self.interface_manager.is_input_received
+                or self.interface_manager.is_hovered)
+
+    @staticmethod
+    def merge_overlapping_rects(rects) -> list:
+        # rects are joined until none of them overlap, so no pixel is drawn in two passes
+        merged_rects = []
+        for rect in rects:
+            if not rect:
+                continue
+            rect = rect.copy()
+            overlapping_rect_index = rect.collidelist(merged_rects)
+            while overlapping_rect_index != -1:
+                rect.union_ip(merged_rects.pop(overlapping_rect_index))
+                overlapping_rect_index = rect.collidelist(merged_rects)
+            merged_rects.append(rect)
+        return merged_rects
+
+    @staticmethod
+    def get_union_waste(first_rect, second_rect) -> int:
+        union_rect = first_rect.union(second_rect)
+        return (union_rect.width * union_rect.height
+                - first_rect.width * first_rect.height
+                - second_rect.width * second_rect.height)
+
+    def get_clip_rects(self, rects) -> list:
+        clip_rects = self.merge_overlapping_rects(rects)
+        if len(clip_rects) > self.MAX_DIRTY_RECTS:
+            return [clip_rects[0].unionall(clip_rects[1:])]
+        while len(clip_rects) > self.MAX_CLIP_RECTS:
+            # the pair whose bounding rect adds the least area that did not change is joined
+            first_rect, second_rect = min(
+                combinations(clip_rects, 2),
+                key=lambda rects_pair: self.get_union_waste(*rects_pair)
+            )
+            clip_rects.remove(first_rect)
+            clip_rects.remove(second_rect)
+            clip_rects = self.merge_overlapping_rects(clip_rects + [first_rect.union(second_rect)])
+        return clip_rects
+
+    def prepare_frame(self) -> None:
+        # called after the world update and before drawing, decides which parts of the screen are redrawn
+        scene_state = self.get_scene_state()
+        current_rects = self.collect_rects() if self.is_enabled else []
+
+        self.is_full_redraw = self.is_full_redraw_needed(scene_state)
+        if not self.is_full_redraw:
+            # previous rects have to be redrawn too, to erase what moved away from them,
+            # overlapping ones are merged and each of the merged rects is drawn and sent to the display on its own
+            self.dirty_rects = self.get_clip_rects(current_rects + self._previous_rects)
+
+        self._scene_state = scene_state
+        self._is_full_redraw_requested = False
+        self._previous_rects = current_rects
+
+        if self.is_full_redraw:
+            self.full_redraws_count += 1
+            self.dirty_rects = [self.screen_rect]
+        else:
+            self.partial_redraws_count += 1
+
+    def get_clip_passes(self):
+        # draws inside the loop are repeated once per dirty rect, clipped to it,
+        # everything outside the dirty rects keeps the pixels of the previous frame
+        if self.is_full_redraw:
+            self.game_surface.set_clip(None)
+            yield self.screen_rect
+            return
+        for dirty_rect in self.dirty_rects:
+            self.game_surface.set_clip(dirty_rect)
+            yield dirty_rect
+
+    def present(self) -> None:
+        self.game_surface.set_clip(None)
+        if self.is_full_redraw:
+            if self.render_scale_manager.is_scaled:
+                self.render_scale_manager.present_world()
+            self.screen_surface.blit(self.game_surface, (0, 0))
+            pygame.display.flip()
+        elif self.dirty_rects:
+            for dirty_rect in self.dirty_rects:
+                self.screen_surface.blit(self.game_surface, dirty_rect, dirty_rect)
+            pygame.display.update(self.dirty_rects)
+
+    def get_statistics_message(self) -> str:
+        frames_count = self.full_redraws_count + self.partial_redraws_count
+        partial_redraws_percent = (100 * self.partial_redraws_count / frames_count) if frames_count else 0
+        return (f'Dirty rects rendering: {"on" if self.is_enabled else "off"}, '
+                f'partial redraws: {self.partial_redraws_count}/{frames_count} ({partial_redraws_percent:.0f}%)')
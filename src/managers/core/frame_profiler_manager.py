@@ -0,0 +1,278 @@
+import csv
+import json
+import os
+import time
+from collections import deque
+
+import pygame
+
+from src.colors import WHITE, BLACK, LIGHT_GRAY, LIGHT_GREEN, LIGHT_BLUE, SEA_BLUE, YELLOW, ORANGE, PURPLE, \
+    LIGHT_RED, GRAY_GREEN
+from src.enums.frame_phase_type import FramePhaseType
+from src.enums.frame_section_type import FrameSectionType
+from src.fonts import FONT_MONOSPACE_COURIER_16
+
+
+class FrameSection:
+
+    def __init__(self, frame_profiler_manager, frame_section_type):
+        self.frame_profiler_manager = frame_profiler_manager
+        self.frame_section_type = frame_section_type
+        self.start_time = 0.0
+
+    def __enter__(self):
+        self.start_time = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.frame_profiler_manager.add_section_timing(
+            self.frame_section_type,
+            time.perf_counter() - self.start_time
+        )
+        return False
+
+
+class FrameProfilerManager:
+    _instance = None
+
+    # rolling window the percentiles are computed over, 5 seconds at 60 fps
+    WINDOW_SIZE = 300
+    PERCENTILES = (50, 95, 99)
+
+    PHASE_COLORS = {
+        FramePhaseType.INPUT: LIGHT_GRAY,
+        FramePhaseType.PLAYER: LIGHT_GREEN,
+        FramePhaseType.PATHFINDING: SEA_BLUE,
+        FramePhaseType.AI: LIGHT_RED,
+        FramePhaseType.WORLD: GRAY_GREEN,
+        FramePhaseType.DRAW_MAP: LIGHT_BLUE,
+        FramePhaseType.DRAW_ENTITIES: YELLOW,
+        FramePhaseType.DRAW_UI: ORANGE,
+        FramePhaseType.PRESENT: PURPLE
+    }
+
+    OVERLAY_FONT = FONT_MONOSPACE_COURIER_16
+    OVERLAY_MARGIN = 10
+    OVERLAY_TOP = 40
+    OVERLAY_BAR_WIDTH = 2
+    OVERLAY_BARS_COUNT = 150
+    OVERLAY_HEIGHT = 120
+    OVERLAY_PIXELS_PER_MS = 4
+    OVERLAY_BACKGROUND_ALPHA = 180
+    # legend text is rerendered only that often, percentiles do not change much between frames
+    OVERLAY_LEGEND_REFRESH_INTERVAL = 30
+    # 60 fps frame budget line
+    FRAME_BUDGET_MS = 1_000 / 60
+
+    @classmethod
+    def get_instance(cls):
+        return cls._instance
+
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self, game_surface):
+        if not hasattr(self, 'initialized'):
+            self.initialized = True
+
+            self.game_surface = game_surface
+
+            self.frame_nr = 0
+            self.frame_start_time = 0.0
+            self.frame_timings = deque(maxlen=self.WINDOW_SIZE)
+            self.phase_timings = {
+                frame_phase_type: deque(maxlen=self.WINDOW_SIZE) for frame_phase_type in FramePhaseType
+            }
+            self.section_timings = {
+                frame_section_type: deque(maxlen=self.WINDOW_SIZE) for frame_section_type in FrameSectionType
+            }
+            self.frame_sections = {
+                frame_section_type: FrameSection(self, frame_section_type) for frame_section_type in FrameSectionType
+            }
+
+            # timings of the frame in progress, sections that did not run are 0
+            self.current_phase_timings = dict.fromkeys(FramePhaseType, 0.0)
+            self.current_section_timings = dict.fromkeys(FrameSectionType, 0.0)
+
+            self.records_path = None
+            self.records_file = None
+            self.records_writer = None
+
+            self.is_overlay_visible = False
+            self.overlay_width = self.OVERLAY_BARS_COUNT * self.OVERLAY_BAR_WIDTH
+            self.overlay_x = self.game_surface.get_width() - self.overlay_width - self.OVERLAY_MARGIN
+            self.overlay_background = pygame.Surface((self.overlay_width, self.OVERLAY_HEIGHT), pygame.SRCALPHA)
+            self.overlay_background.fill((*BLACK, self.OVERLAY_BACKGROUND_ALPHA))
+            self.overlay_legend_texts = []
+            self.overlay_rect = pygame.Rect(self.overlay_x, self.OVERLAY_TOP, self.overlay_width, self.OVERLAY_HEIGHT)
+
+    def begin_frame(self) -> None:
+        self.frame_start_time = time.perf_counter()
+        for frame_phase_type in self.current_phase_timings:
+            self.current_phase_timings[frame_phase_type] = 0.0
+        for frame_section_type in self.current_section_timings:
+            self.current_section_timings[frame_section_type] = 0.0
+
+    def add_phase_timing(self, frame_phase_type, timing) -> None:
+        # simulation phases can run several times in one frame
+        self.current_phase_timings[frame_phase_type] += timing
+
+    def add_section_timing(self, frame_section_type, timing) -> None:
+        self.current_section_timings[frame_section_type] += timing
+
+    def measure(self, frame_section_type) -> FrameSection:
+        return self.frame_sections[frame_section_type]
+
+    def end_frame(self, delta_time) -> None:
+        self.frame_timings.append(time.perf_counter() - self.frame_start_time)
+        for frame_phase_type, timing in self.current_phase_timings.items():
+            self.phase_timings[frame_phase_type].append(timing)
+        for frame_section_type, timing in self.current_section_timings.items():
+            self.section_timings[frame_section_type].append(timing)
+
+        if self.records_writer is not None:
+            self.write_record(delta_time)
+
+        self.frame_nr += 1
+
+    @staticmethod
+    def get_percentile(sorted_timings, percentile) -> float:
+        # nearest rank, no interpolation needed for a few hundred samples
+        index = min(len(sorted_timings) - 1, (len(sorted_timings) * percentile) // 100)
+        return sorted_timings[index]
+
+    def get_percentiles(self, timings) -> dict:
+        if not timings:
+            return dict.fromkeys(self.PERCENTILES, 0.0)
+        sorted_timings = sorted(timings)
+        return {percentile: self.get_percentile(sorted_timings, percentile) for percentile in self.PERCENTILES}
+
+    @staticmethod
+    def format_percentiles(percentiles) -> str:
+        return ' '.join(f'p{percentile}: {timing * 1_000:.2f}' for percentile, timing in percentiles.items())
+
+    def get_summary_lines(self) -> list:
+        lines = [f'Frame (ms) {self.format_percentiles(self.get_percentiles(self.frame_timings))}']
+        for frame_phase_type, timings in self.phase_timings.items():
+            lines.append(f'{frame_phase_type} {self.format_percentiles(self.get_percentiles(timings))}')
+        slowest_sections = sorted(
+            self.section_timings.items(),
+            key=lambda section_timings: self.get_percentiles(section_timings[1])[95],
+            reverse=True
+        )[:3]
+        lines.append('Slowest sections: ' + ', '.join(
+            f'{frame_section_type} {self.get_percentiles(timings)[95] * 1_000:.2f}'
+            for frame_section_type, timings in slowest_sections
+        ))
+        return lines
+
+    @property
+    def is_recording(self) -> bool:
+        return self.records_writer is not None
+
+    def get_record_fields(self) -> list:
+        return ['frame', 'delta_time_ms', 'frame_ms', *FramePhaseType, *FrameSectionType]
+
+    def start_recording(self, records_path) -> None:
+        # records format follows the file extension, csv or jsonl
+        extension = os.path.splitext(records_path)[1].lower()
+        if extension not in ('.csv', '.jsonl'):
+            raise ValueError(f'Unsupported frame records format: {extension}')
+
+        self.stop_recording()
+        self.records_path = records_path
+        self.records_file = open(records_path, 'wt', encoding='utf-8', newline='')
+        if extension == '.csv':
+            csv_writer = csv.DictWriter(self.records_file, fieldnames=self.get_record_fields())
+            csv_writer.writeheader()
+            self.records_writer = csv_writer.writerow
+        else:
+            self.records_writer = lambda record: self.records_file.write(json.dumps(record) + '\n')
+
+    def stop_recording(self) -> None:
+        if self.records_file is not None:
+            self.records_file.close()
+        self.records_file = None
+        self.records_writer = None
+
+    def write_record(self, delta_time) -> None:
+        record = {
+            'frame': self.frame_nr,
+            'delta_time_ms': round(delta_time * 1_000, 4),
+            'frame_ms': round(self.frame_timings[-1] * 1_000, 4)
+        }
+        for frame_phase_type, timing in self.current_phase_timings.items():
+            record[frame_phase_type.value] = round(timing * 1_000, 4)
+        for frame_section_type, timing in self.current_section_timings.items():
+            record[frame_section_type.value] = round(timing * 1_000, 4)
+        self.records_writer(record)
+
+    def switch_show_overlay(self) -> None:
+        self.is_overlay_visible = not self.is_overlay_visible
+        self.overlay_legend_texts = []
+
+    def get_dirty_rects(self) -> list:
+        return [self.overlay_rect] if self.is_overlay_visible else []
+
+    def update_overlay_legend(self) -> None:
+        self.overlay_legend_texts = [
+            self.OVERLAY_FONT.render(
+                f'frame {self.format_percentiles(self.get_percentiles(self.frame_timings))}',
+                True,
+                WHITE,
+                BLACK
+            )
+        ]
+        for frame_phase_type, color in self.PHASE_COLORS.items():
+            self.overlay_legend_texts.append(
+                self.OVERLAY_FONT.render(
+                    f'{frame_phase_type} {self.format_percentiles(self.get_percentiles(self.phase_timings[frame_phase_type]))}',
+                    True,
+                    color,
+                    BLACK
+                )
+            )
+
+    def draw_overlay(self) -> None:
+        if not self.is_overlay_visible:
+            return
+
+        overlay_bottom = self.OVERLAY_TOP + self.OVERLAY_HEIGHT
+        self.game_surface.blit(self.overlay_background, (self.overlay_x, self.OVERLAY_TOP))
+
+        # one stacked bar per frame, newest on the right
+        frames_count = min(len(self.frame_timings), self.OVERLAY_BARS_COUNT)
+        first_frame_index = len(self.frame_timings) - frames_count
+        bar_x = self.overlay_x + self.overlay_width - (frames_count * self.OVERLAY_BAR_WIDTH)
+        for frame_index in range(first_frame_index, len(self.frame_timings)):
+            bar_y = overlay_bottom
+            for frame_phase_type, color in self.PHASE_COLORS.items():
+                bar_height = self.phase_timings[frame_phase_type][frame_index] * 1_000 * self.OVERLAY_PIXELS_PER_MS
+                bar_height = min(int(bar_height), bar_y - self.OVERLAY_TOP)
+                if bar_height > 0:
+                    bar_y -= bar_height
+                    self.game_surface.fill(color, (bar_x, bar_y, self.OVERLAY_BAR_WIDTH, bar_height))
+            bar_x += self.OVERLAY_BAR_WIDTH
+
+        frame_budget_y = overlay_bottom - int(self.FRAME_BUDGET_MS * self.OVERLAY_PIXELS_PER_MS)
+        if frame_budget_y > self.OVERLAY_TOP:
+            pygame.draw.line(
+                self.game_surface,
+                WHITE,
+                (self.overlay_x, frame_budget_y),
+                (self.overlay_x + self.overlay_width, frame_budget_y)
+            )
+
+        if not self.overlay_legend_texts or self.frame_nr % self.OVERLAY_LEGEND_REFRESH_INTERVAL == 0:
+            self.update_overlay_legend()
+        self.overlay_rect = pygame.Rect(self.overlay_x, self.OVERLAY_TOP, self.overlay_width, self.OVERLAY_HEIGHT)
+        legend_y = overlay_bottom + self.OVERLAY_MARGIN
+        for legend_text in self.overlay_legend_texts:
+            legend_rect = self.game_surface.blit(
+                legend_text,
+                (self.game_surface.get_width() - legend_text.get_width() - self.OVERLAY_MARGIN, legend_y)
+            )
+            self.overlay_rect.union_ip(legend_rect)
+            legend_y += legend_text.get_height()
@@ -0,0 +1,105 @@
+import json
+import os
+
+from src.paths import DIR_DATABASE_JOURNALS
+
+
+class JournalManager:
+    _instance = None
+
+    SEGMENT_FILE_EXTENSION = '.journal'
+
+    @classmethod
+    def get_instance(cls):
+        return cls._instance
+
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self, character_id):
+        if not hasattr(self, 'initialized'):
+            self.initialized = True
+
+            self.journal_directory = os.path.join(DIR_DATABASE_JOURNALS, str(character_id))
+
+            # changes journaled after the last save, replayed over the database state while loading the character
+            self.recovered_records = self.read_records()
+            segments_nrs = self.get_segments_nrs()
+            self.segment_nr = (segments_nrs[-1] + 1) if segments_nrs else 0
+            self.segment_file = None
+
+            # off until the save manager starts, headless runs never write the journal
+            self.is_enabled = False
+            self.records_count = 0
+
+    def get_segment_path(self, segment_nr) -> str:
+        return os.path.join(self.journal_directory, f'{segment_nr:08d}{self.SEGMENT_FILE_EXTENSION}')
+
+    def get_segments_nrs(self) -> list[int]:
+        if not os.path.isdir(self.journal_directory):
+            return []
+        return sorted(
+            int(file_name.removesuffix(self.SEGMENT_FILE_EXTENSION))
+            for file_name in os.listdir(self.journal_directory)
+            if file_name.endswith(self.SEGMENT_FILE_EXTENSION)
+        )
+
+    def read_records(self) -> list[tuple[str, dict]]:
+        records = []
+        for segment_nr in self.get_segments_nrs():
+            with open(self.get_segment_path(segment_nr), encoding='utf-8') as segment_file:
+                for line in segment_file:
+                    try:
+                        record_type, values = json.loads(line)
+                    except ValueError:
+                        # line cut off by a crash in the middle of writing it
+                        continue
+                    records.append((record_type, values))
+        return records
+
+    def get_recovered_values(self, record_type) -> dict:
+        # records hold new values, not deltas, so the latest value of every key wins
+        recovered_values = {}
+        for recovered_record_type, values in self.recovered_records:
+            if recovered_record_type == record_type:
+                recovered_values.update(values)
+        return recovered_values
+
+    def append(self, record_type, values) -> None:
+        # flushed to the os right away, a crash of the game does not lose it
+        if not self.is_enabled:
+            return
+        if self.segment_file is None:
+            os.makedirs(self.journal_directory, exist_ok=True)
+            self.segment_file = open(self.get_segment_path(self.segment_nr), 'a', encoding='utf-8')
+        self.segment_file.write(json.dumps((record_type, values)) + '\n')
+        self.segment_file.flush()
+        self.records_count += 1
+
+    def rotate(self) -> int:
+        # called when the state is snapshotted, returns the last segment the snapshot covers
+        if self.segment_file is not None:
+            self.segment_file.close()
+            self.segment_file = None
+        covered_segment_nr = self.segment_nr
+        self.segment_nr += 1
+        return covered_segment_nr
+
+    def compact(self, covered_segment_nr) -> None:
+        # called once the snapshot is in the database, segments it covers are not needed anymore
+        for segment_nr in self.get_segments_nrs():
+            if segment_nr <= covered_segment_nr:
+                os.remove(self.get_segment_path(segment_nr))
+
+    def clear(self) -> None:
+        self.is_enabled = False
+        self.compact(self.rotate())
+        self.recovered_records = []
+
+    def close(self) -> None:
+        self.is_enabled = False
+        if self.segment_file is not None:
+            self.segment_file.close()
+            self.segment_file = None
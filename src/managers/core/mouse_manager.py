@@ -2,7 +2,7 @@ import os
 
 import pygame
 
-from src.common_utils import remove_filename_extension
+from src.common_utils import remove_filename_extension, load_image
 from src.enums.cursor_type import CursorType
 from src.paths import DIR_ASSETS_CURSORS
 
@@ -56,10 +56,13 @@ class MouseManager:
     def _load_cursors(self) -> None:
         cursors_names = os.listdir(DIR_ASSETS_CURSORS)
         for cursor_name in cursors_names:
-            cursor = pygame.image.load(os.path.join(DIR_ASSETS_CURSORS, cursor_name)).convert_alpha()
+            cursor = load_image(os.path.join(DIR_ASSETS_CURSORS, cursor_name)).convert_alpha()
             cursor = pygame.transform.scale(cursor, (self.CURSOR_SIZE, self.CURSOR_SIZE))
             self._cursors[remove_filename_extension(cursor_name)] = cursor
 
+    def get_dirty_rects(self) -> list:
+        return [self._cursor_rect.copy()]
+
     def draw_cursor(self, cursor_name) -> None:
         cursor_name = self._cursors[cursor_name] if cursor_name in self._cursors else self._cursors[CursorType.POINT]
         mouse_x, mouse_y = pygame.mouse.get_pos()
@@ -0,0 +1,174 @@
+import pygame
+
+from config import RENDER_SCALE, MIN_RENDER_SCALE, RENDER_SCALE_SMOOTH, ADAPTIVE_RENDER_SCALE, TARGET_FRAME_TIME
+from src.colors import BLACK
+
+
+class RenderScaleManager:
+    _instance = None
+
+    RENDER_SCALE_STEP = 0.1
+    # adaptive scale follows a moving average of the frame time, not single spikes
+    FRAME_TIME_SMOOTHING = 0.1
+    SCALE_DOWN_FRAME_TIME_RATIO = 1.05
+    SCALE_UP_FRAME_TIME_RATIO = 0.75
+    # gives the average time to settle after the scale changes
+    SCALE_CHANGE_COOLDOWN_FRAMES = 60
+
+    @classmethod
+    def get_instance(cls):
+        return cls._instance
+
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self, game_surface, screen_surface):
+        if not hasattr(self, 'initialized'):
+            self.initialized = True
+
+            self.game_surface = game_surface
+            self.screen_surface = screen_surface
+
+            self.map_manager = None
+            self.dirty_rects_manager = None
+
+            self.max_render_scale = min(1.0, RENDER_SCALE)
+            self.min_render_scale = min(MIN_RENDER_SCALE, self.max_render_scale)
+            self.is_smooth = RENDER_SCALE_SMOOTH
+            self.is_adaptive = ADAPTIVE_RENDER_SCALE
+            self.target_frame_time = TARGET_FRAME_TIME
+
+            # at full scale the world is drawn straight to the game surface
+            self.render_scale = 1.0
+            self.world_surface = game_surface
+            # assets scaled to the current render scale
+            self.scaled_surfaces = {}
+
+            self.average_frame_time = None
+            self.frames_since_scale_change = 0
+            self.scale_changes_count = 0
+
+            self.set_render_scale(self.max_render_scale)
+
+    def setup_references(self):
+        from src.managers.gameplay.map_manager import MapManager
+        from src.managers.core.dirty_rects_manager import DirtyRectsManager
+
+        self.map_manager = MapManager.get_instance()
+        self.dirty_rects_manager = DirtyRectsManager.get_instance()
+
+    @property
+    def is_scaled(self) -> bool:
+        return self.world_surface is not self.game_surface
+
+    def set_render_scale(self, render_scale) -> None:
+        render_scale = round(min(self.max_render_scale, max(self.min_render_scale, render_scale)), 2)
+        if render_scale == self.render_scale:
+            return
+
+        self.render_scale = render_scale
+        if render_scale == 1.0:
+            self.world_surface = self.game_surface
+        else:
+            screen_width, screen_height = self.game_surface.get_size()
+            # same pixel format as the display, so the upscale can write straight into it
+            self.world_surface = pygame.Surface(
+                (int(screen_width * render_scale), int(screen_height * render_scale)),
+                0,
+                self.screen_surface
+            )
+        self.scaled_surfaces.clear()
+        self.frames_since_scale_change = 0
+
+        if self.map_manager is not None:
+            self.map_manager.set_render_scale(render_scale)
+        if self.dirty_rects_manager is not None:
+            self.dirty_rects_manager.request_full_redraw()
+
+    def switch_adaptive(self) -> None:
+        self.is_adaptive = not self.is_adaptive
+        self.average_frame_time = None
+        if not self.is_adaptive:
+            self.set_render_scale(self.max_render_scale)
+
+    def get_scaled_surface(self, surface) -> pygame.Surface:
+        scaled_surface = self.scaled_surfaces.get(surface)
+        if scaled_surface is None:
+            width, height = surface.get_size()
+            scaled_size = (max(1, round(width * self.render_scale)), max(1, round(height * self.render_scale)))
+            if self.is_smooth:
+                scaled_surface = pygame.transform.smoothscale(surface, scaled_size)
+            else:
+                scaled_surface = pygame.transform.scale(surface, scaled_size)
+            self.scaled_surfaces[surface] = scaled_surface
+        return scaled_surface
+
+    def convert_screen_position_to_world_position(self, screen_position) -> (float, float):
+        screen_x, screen_y = screen_position
+        return screen_x * self.render_scale, screen_y * self.render_scale
+
+    def draw_world_surface(self, surface, screen_position) -> None:
+        if not self.is_scaled:
+            self.world_surface.blit(surface, screen_position)
+            return
+        self.world_surface.blit(
+            self.get_scaled_surface(surface),
+            self.convert_screen_position_to_world_position(screen_position)
+        )
+
+    def draw_world_surfaces(self, blit_sequence) -> None:
+        if not self.is_scaled:
+            self.world_surface.blits(blit_sequence, doreturn=False)
+            return
+        self.world_surface.blits(
+            [
+                (self.get_scaled_surface(surface), self.convert_screen_position_to_world_position(screen_position))
+                for surface, screen_position in blit_sequence
+            ],
+            doreturn=False
+        )
+
+    def clear_surfaces(self) -> None:
+        if not self.is_scaled:
+            self.game_surface.fill(BLACK)
+            return
+        self.world_surface.fill(BLACK)
+        # game surface only carries the native resolution interface drawn on top of the world
+        self.game_surface.fill((0, 0, 0, 0))
+
+    def present_world(self) -> None:
+        # the only full screen scaling in a frame
+        if self.is_smooth:
+            pygame.transform.smoothscale(self.world_surface, self.screen_surface.get_size(), self.screen_surface)
+        else:
+            pygame.transform.scale(self.world_surface, self.screen_surface.get_size(), self.screen_surface)
+
+    def adapt_render_scale(self, frame_time) -> None:
+        if not self.is_adaptive:
+            return
+
+        if self.average_frame_time is None:
+            self.average_frame_time = frame_time
+        else:
+            self.average_frame_time += self.FRAME_TIME_SMOOTHING * (frame_time - self.average_frame_time)
+
+        self.frames_since_scale_change += 1
+        if self.frames_since_scale_change < self.SCALE_CHANGE_COOLDOWN_FRAMES:
+            return
+
+        render_scale = self.render_scale
+        if self.average_frame_time > self.target_frame_time * self.SCALE_DOWN_FRAME_TIME_RATIO:
+            self.set_render_scale(render_scale - self.RENDER_SCALE_STEP)
+        elif self.average_frame_time < self.target_frame_time * self.SCALE_UP_FRAME_TIME_RATIO:
+            self.set_render_scale(render_scale + self.RENDER_SCALE_STEP)
+        if self.render_scale != render_scale:
+            self.scale_changes_count += 1
+
+    def get_statistics_message(self) -> str:
+        average_frame_time_in_ms = (self.average_frame_time or 0) * 1_000
+        return (f'Render scale: {self.render_scale:.2f} ({"adaptive" if self.is_adaptive else "fixed"}, '
+                f'{"smooth" if self.is_smooth else "nearest"}), '
+                f'frame time: {average_frame_time_in_ms:.1f}/{self.target_frame_time * 1_000:.1f} ms, '
+                f'scale changes: {self.scale_changes_count}, scaled assets: {len(self.scaled_surfaces)}')
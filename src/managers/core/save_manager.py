@@ -0,0 +1,189 @@
+import sqlite3
+import threading
+import time
+
+from config import AUTOSAVE_INTERVAL
+
+
+class SaveManager:
+    _instance = None
+
+    @classmethod
+    def get_instance(cls):
+        return cls._instance
+
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self, character_id):
+        if not hasattr(self, 'initialized'):
+            self.initialized = True
+
+            self.character_id = character_id
+
+            self.player_manager = None
+            self.inventory_manager = None
+            self.equipment_manager = None
+            self.journal_manager = None
+
+            self.autosave_interval = AUTOSAVE_INTERVAL
+            self.last_save_request_time = time.monotonic()
+
+            # state handed over to the writer most recently, only fields differing from it are saved again
+            self.saved_state = {}
+            # fields waiting for the writer, a newer value of a field replaces the older one
+            self.pending_state = {}
+            # journal segments covered by the pending state, removed once it is in the database
+            self.pending_journal_segment_nr = None
+            self.condition = threading.Condition()
+            self.writer_thread = None
+            self.is_writer_running = False
+            self.is_save_requested = False
+            self.is_writing = False
+            # off until started, headless runs never write the character
+            self.is_enabled = False
+
+            self.saves_count = 0
+            self.failed_saves_count = 0
+            self.saved_fields_count = 0
+            self.last_save_duration = 0.0
+
+    def setup_references(self):
+        from src.managers.gameplay.player_manager import PlayerManager
+        from src.managers.gameplay.inventory_manager import InventoryManager
+        from src.managers.gameplay.equipment_manager import EquipmentManager
+        from src.managers.core.journal_manager import JournalManager
+
+        self.player_manager = PlayerManager.get_instance()
+        self.inventory_manager = InventoryManager.get_instance()
+        self.equipment_manager = EquipmentManager.get_instance()
+        self.journal_manager = JournalManager.get_instance()
+
+    def get_state(self) -> dict:
+        return {
+            **self.player_manager.get_save_state(),
+            **self.inventory_manager.get_save_state(),
+            **self.equipment_manager.get_save_state()
+        }
+
+    def start(self) -> None:
+        # state just loaded from the database needs no saving
+        self.saved_state = self.get_state()
+        self.last_save_request_time = time.monotonic()
+        self.is_enabled = True
+        self.journal_manager.is_enabled = True
+        if self.journal_manager.recovered_records:
+            # replayed journal is not in the database yet, compacted into it right away
+            self.queue_save(dict(self.saved_state))
+        if self.writer_thread is not None and self.writer_thread.is_alive():
+            return
+        self.is_writer_running = True
+        self.writer_thread = threading.Thread(target=self.run_writer, name='save-writer', daemon=True)
+        self.writer_thread.start()
+
+    def update(self) -> None:
+        # called once per frame, on the main thread
+        if time.monotonic() - self.last_save_request_time >= self.autosave_interval:
+            self.request_save()
+
+    def get_dirty_state(self) -> dict:
+        state = self.get_state()
+        dirty_state = {
+            save_field: value
+            for save_field, value in state.items()
+            if value != self.saved_state.get(save_field)
+        }
+        self.saved_state = state
+        return dirty_state
+
+    def request_save(self) -> None:
+        # only snapshots the changed fields, the database is written on the writer thread
+        self.last_save_request_time = time.monotonic()
+        if not self.is_enabled:
+            return
+        dirty_state = self.get_dirty_state()
+        if dirty_state:
+            self.queue_save(dirty_state)
+
+    def queue_save(self, dirty_state) -> None:
+        # journal records written from now on are not covered by this snapshot
+        journal_segment_nr = self.journal_manager.rotate()
+        with self.condition:
+            self.pending_state.update(dirty_state)
+            self.pending_journal_segment_nr = journal_segment_nr
+            self.is_save_requested = True
+            self.condition.notify_all()
+
+    def run_writer(self) -> None:
+        from src.database_service import DatabaseService
+
+        while True:
+            with self.condition:
+                while self.is_writer_running and not self.is_save_requested:
+                    self.condition.wait()
+                if not self.is_save_requested:
+                    break
+                dirty_state, self.pending_state = self.pending_state, {}
+                journal_segment_nr, self.pending_journal_segment_nr = self.pending_journal_segment_nr, None
+                self.is_save_requested = False
+                self.is_writing = True
+
+            save_start_time = time.perf_counter()
+            try:
+                DatabaseService.save_character_state(self.character_id, dirty_state)
+            except sqlite3.Error as e:
+                print(f'Saving the game failed: {e}')
+                with self.condition:
+                    # retried with the next save, fields changed in the meantime keep their newer values
+                    for save_field, value in dirty_state.items():
+                        self.pending_state.setdefault(save_field, value)
+                    if self.pending_journal_segment_nr is None:
+                        self.pending_journal_segment_nr = journal_segment_nr
+                    self.failed_saves_count += 1
+            else:
+                self.saves_count += 1
+                self.saved_fields_count += len(dirty_state)
+                self.journal_manager.compact(journal_segment_nr)
+            self.last_save_duration = time.perf_counter() - save_start_time
+
+            with self.condition:
+                self.is_writing = False
+                self.condition.notify_all()
+
+    def discard(self) -> None:
+        # character is about to be deleted, nothing may be written for it anymore
+        self.is_enabled = False
+        with self.condition:
+            self.pending_state = {}
+            self.pending_journal_segment_nr = None
+            self.is_save_requested = False
+            while self.is_writing:
+                self.condition.wait()
+        self.journal_manager.clear()
+
+    def stop(self) -> None:
+        # final save when leaving the game, waits until the writer is done
+        if self.writer_thread is None:
+            return
+        self.request_save()
+        self.is_enabled = False
+        with self.condition:
+            self.is_writer_running = False
+            self.condition.notify_all()
+        self.writer_thread.join()
+        self.writer_thread = None
+        if not self.pending_state:
+            # everything journaled is in the database
+            self.journal_manager.compact(self.journal_manager.rotate())
+        self.journal_manager.close()
+
+    def get_statistics_message(self) -> str:
+        with self.condition:
+            pending_fields_count = len(self.pending_state)
+        return (f'Saves: {self.saves_count} ({self.failed_saves_count} failed), '
+                f'fields saved: {self.saved_fields_count}, pending: {pending_fields_count}, '
+                f'journal records: {self.journal_manager.records_count}, '
+                f'last save: {self.last_save_duration * 1_000:.1f} ms, '
+                f'autosave every {self.autosave_interval:g} s')
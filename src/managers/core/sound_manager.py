@@ -8,6 +8,8 @@ class SoundManager:
 
     _sounds = {}
 
+    _is_music_enabled = True
+
     @classmethod
     def get_instance(cls):
         return cls._instance
@@ -37,8 +39,15 @@ class SoundManager:
         else:
             pygame.mixer.music.unpause()
 
+    @classmethod
+    def disable_music(cls):
+        cls._is_music_enabled = False
+        pygame.mixer.music.stop()
+
     @staticmethod
     def play_soundtrack(soundtrack_path):
+        if not SoundManager._is_music_enabled:
+            return
         try:
             pygame.mixer.music.load(soundtrack_path)
             pygame.mixer.music.play(-1)
@@ -0,0 +1,74 @@
+import math
+import os
+
+import pygame
+
+from src.common_utils import remove_filename_extension, load_image
+from src.sprites.spritesheet_functions import extract_frames_from_spritesheet, get_spritesheet_frames_quantity
+
+
+class SpriteAtlasManager:
+    _instance = None
+
+    ATLAS_PAGE_COLUMNS = 8
+
+    @classmethod
+    def get_instance(cls):
+        return cls._instance
+
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if not hasattr(self, 'initialized'):
+            self.initialized = True
+
+    @staticmethod
+    def get_spritesheets_names(page_directory) -> list[str]:
+        return sorted(
+            file_name for file_name in os.listdir(page_directory)
+            if os.path.isfile(os.path.join(page_directory, file_name))
+        )
+
+    def get_frame_rect(self, frame_index, draw_size) -> pygame.Rect:
+        return pygame.Rect(
+            (frame_index % self.ATLAS_PAGE_COLUMNS) * draw_size,
+            (frame_index // self.ATLAS_PAGE_COLUMNS) * draw_size,
+            draw_size,
+            draw_size
+        )
+
+    def create_page(self, frames_count, draw_size) -> pygame.Surface:
+        columns = max(1, min(frames_count, self.ATLAS_PAGE_COLUMNS))
+        rows = max(1, math.ceil(frames_count / self.ATLAS_PAGE_COLUMNS))
+        return pygame.Surface((columns * draw_size, rows * draw_size), pygame.SRCALPHA)
+
+    def load_page(self, page_directory, draw_size) -> dict[str, list[pygame.Surface]]:
+        if not os.path.isdir(page_directory):
+            return {}
+
+        spritesheets = [
+            (
+                remove_filename_extension(spritesheet_name),
+                load_image(os.path.join(page_directory, spritesheet_name)).convert_alpha()
+            )
+            for spritesheet_name in self.get_spritesheets_names(page_directory)
+        ]
+        frames_count = sum(get_spritesheet_frames_quantity(spritesheet) for _, spritesheet in spritesheets)
+
+        # frames of every state are packed one after another and scaled straight into the page
+        page = self.create_page(frames_count, draw_size)
+        states = {}
+        frame_index = 0
+        for state, spritesheet in spritesheets:
+            state_frames_count = get_spritesheet_frames_quantity(spritesheet)
+            frames_surfaces = [
+                page.subsurface(self.get_frame_rect(frame_index + frame_nr, draw_size))
+                for frame_nr in range(state_frames_count)
+            ]
+            states[state] = extract_frames_from_spritesheet(spritesheet, draw_size, frames_surfaces)
+            frame_index += state_frames_count
+        # frames are subsurfaces, they keep the page alive
+        return states
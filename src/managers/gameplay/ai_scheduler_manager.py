@@ -0,0 +1,177 @@
+from src.colors import LIGHT_GREEN, YELLOW, LIGHT_GRAY, WHITE, BLACK
+from src.enums.npc_update_tier_type import NpcUpdateTierType
+from src.fonts import FONT_MONOSPACE_COURIER_16
+from src.managers.ui.text_cache_manager import render_text
+
+
+class AiSchedulerManager:
+    _instance = None
+
+    FULL_UPDATE_DISTANCE = 1000
+    WAKE_DISTANCE = 2000
+    # reduced tier npcs tick once per that many frames with the accumulated delta time
+    REDUCED_UPDATE_INTERVAL = 4
+
+    TIER_COLORS = {
+        NpcUpdateTierType.FULL: LIGHT_GREEN,
+        NpcUpdateTierType.REDUCED: YELLOW,
+        NpcUpdateTierType.DORMANT: LIGHT_GRAY
+    }
+
+    OVERLAY_FONT = FONT_MONOSPACE_COURIER_16
+    OVERLAY_COUNTER_X = 10
+    OVERLAY_COUNTER_Y = 120
+
+    @classmethod
+    def get_instance(cls):
+        return cls._instance
+
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self, game_surface):
+        if not hasattr(self, 'initialized'):
+            self.initialized = True
+
+            self.game_surface = game_surface
+
+            self.player_manager = None
+            self.map_manager = None
+            self.spatial_index_manager = None
+            self.viewport_manager = None
+
+            self.map_id = None
+            self.frame_nr = 0
+
+            self.npc_tiers = {}
+            self.scheduled_npc_updates = []
+            self._accumulated_delta_times = {}
+            # stable per npc offset so that reduced tier updates are spread over frames
+            self._update_slots = {}
+
+            self.npc_updates_count = 0
+            self.npcs_count = 0
+
+            self.is_debug_overlay_visible = False
+            self.counter_text_rect = None
+            self.tier_texts = {
+                tier: self.OVERLAY_FONT.render(tier, True, color, BLACK)
+                for tier, color in self.TIER_COLORS.items()
+            }
+
+    def setup_references(self):
+        from src.managers.gameplay.player_manager import PlayerManager
+        from src.managers.gameplay.map_manager import MapManager
+        from src.managers.gameplay.spatial_index_manager import SpatialIndexManager
+        from src.managers.gameplay.viewport_manager import ViewportManager
+
+        self.player_manager = PlayerManager.get_instance()
+        self.map_manager = MapManager.get_instance()
+        self.spatial_index_manager = SpatialIndexManager.get_instance()
+        self.viewport_manager = ViewportManager.get_instance()
+
+    def reset(self, map_id) -> None:
+        self.map_id = map_id
+        self.npc_tiers.clear()
+        self.scheduled_npc_updates = []
+        self._accumulated_delta_times.clear()
+        self._update_slots.clear()
+
+    @staticmethod
+    def is_npc_busy(npc) -> bool:
+        # chasing or walking back to spawn, must not freeze when the player runs away
+        return npc.is_activated or npc.is_moving_to_destination_row_and_column
+
+    def get_npc_update_tier(self, npc) -> NpcUpdateTierType:
+        if self.is_npc_busy(npc):
+            return NpcUpdateTierType.FULL
+        distance_to_player = npc.distance_to_player
+        if distance_to_player <= self.FULL_UPDATE_DISTANCE:
+            return NpcUpdateTierType.FULL
+        if distance_to_player <= self.WAKE_DISTANCE:
+            return NpcUpdateTierType.REDUCED
+        return NpcUpdateTierType.DORMANT
+
+    def is_npc_update_frame(self, npc) -> bool:
+        if npc not in self._update_slots:
+            self._update_slots[npc] = len(self._update_slots)
+        return (self.frame_nr + self._update_slots[npc]) % self.REDUCED_UPDATE_INTERVAL == 0
+
+    def schedule_npc_updates(self, npcs, delta_time) -> None:
+        if self.map_id != self.map_manager.map_id:
+            self.reset(self.map_manager.map_id)
+        self.frame_nr += 1
+
+        player_x, player_y = self.player_manager.position
+        awake_npcs = self.spatial_index_manager.get_npcs_index(self.map_id).query_radius(
+            player_x,
+            player_y,
+            self.WAKE_DISTANCE
+        )
+        awake_npcs_ids = {id(npc) for npc in awake_npcs}
+        for npc in self.npc_tiers:
+            if id(npc) not in awake_npcs_ids and self.is_npc_busy(npc):
+                awake_npcs.append(npc)
+
+        npc_tiers = {}
+        scheduled_npc_updates = []
+        for npc in awake_npcs:
+            tier = self.get_npc_update_tier(npc)
+            if tier == NpcUpdateTierType.DORMANT:
+                continue
+            npc_tiers[npc] = tier
+            npc_delta_time = self._accumulated_delta_times.pop(npc, 0.0) + delta_time
+            if tier == NpcUpdateTierType.FULL or self.is_npc_update_frame(npc):
+                scheduled_npc_updates.append((npc, npc_delta_time))
+            else:
+                self._accumulated_delta_times[npc] = npc_delta_time
+
+        # dormant npcs do not catch up on the time they spent asleep
+        for npc in self.npc_tiers:
+            if npc not in npc_tiers:
+                self._accumulated_delta_times.pop(npc, None)
+
+        self.npc_tiers = npc_tiers
+        self.scheduled_npc_updates = scheduled_npc_updates
+        self.npc_updates_count = len(scheduled_npc_updates)
+        self.npcs_count = len(npcs)
+
+    def get_npc_tier(self, npc) -> NpcUpdateTierType:
+        return self.npc_tiers.get(npc, NpcUpdateTierType.DORMANT)
+
+    def switch_show_debug_overlay(self) -> None:
+        self.is_debug_overlay_visible = not self.is_debug_overlay_visible
+
+    def get_dirty_rects(self) -> list:
+        if self.is_debug_overlay_visible and self.counter_text_rect is not None:
+            return [self.counter_text_rect]
+        return []
+
+    def draw_debug_overlay(self, npcs) -> None:
+        if not self.is_debug_overlay_visible:
+            return
+
+        for npc in npcs:
+            if not npc.is_visible:
+                continue
+            tier_text = self.tier_texts[self.get_npc_tier(npc)]
+            npc_screen_x, npc_screen_y = self.viewport_manager.convert_map_position_to_screen_position(*npc.render_position)
+            self.game_surface.blit(
+                tier_text,
+                (
+                    npc_screen_x - (tier_text.get_width() // 2),
+                    npc_screen_y + (npc.draw_size // 2)
+                )
+            )
+
+        counter_text = render_text(
+            self.OVERLAY_FONT,
+            f'NPC updates: {self.npc_updates_count}/{self.npcs_count} per frame',
+            True,
+            WHITE,
+            BLACK
+        )
+        self.counter_text_rect = counter_text.get_rect(topleft=(self.OVERLAY_COUNTER_X, self.OVERLAY_COUNTER_Y))
+        self.game_surface.blit(counter_text, self.counter_text_rect)
@@ -4,7 +4,7 @@ from typing import override
 import pygame
 
 from src.colors import WHITE
-from src.common_utils import remove_filename_extension
+from src.common_utils import remove_filename_extension, load_image
 from src.interface.interface_constants import BORDER_WIDTH, LOWER_UI_BAR_HEIGHT, XP_BAR_HEIGHT, WINDOW_DEFAULT_STRIPE_HEIGHT
 from src.interface.window import Window
 from src.paths import DIR_ASSETS_PORTRAITS
@@ -46,7 +46,7 @@ class ConversationManager(Window):
     def load_portraits(cls):
         portraits_names = os.listdir(DIR_ASSETS_PORTRAITS)
         for portrait_name in portraits_names:
-            portrait_image = pygame.image.load(os.path.join(DIR_ASSETS_PORTRAITS, portrait_name)).convert_alpha()
+            portrait_image = load_image(os.path.join(DIR_ASSETS_PORTRAITS, portrait_name)).convert_alpha()
             portrait_image = pygame.transform.scale(
                 portrait_image,
                 (
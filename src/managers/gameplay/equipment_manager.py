@@ -1,8 +1,11 @@
 from database.game_database_table_columns_names import ItemsTable, CharacterEquipmentTable, EquipmentSlotsTable
 from src.enums.error_message_type import ErrorMessageType
+from src.enums.save_field_type import SaveFieldType
 from src.interface.item_tiles_grid import ItemTilesGrid
 from src.interface.window import Window
 from src.database_service import DatabaseService
+from src.game_catalog import GameCatalog
+from src.managers.core.journal_manager import JournalManager
 
 
 class EquipmentManager(Window):
@@ -44,6 +47,8 @@ class EquipmentManager(Window):
             self.error_messages_manager = None
 
             self.character_id = character_id
+            self.game_catalog = GameCatalog.get_instance()
+            self.journal_manager = JournalManager.get_instance()
 
             self.equipped_items = self.create_equipment_dict()
 
@@ -55,8 +60,7 @@ class EquipmentManager(Window):
                 1
             )
 
-            equipment_slots = DatabaseService.get_equipment_slots()
-            for equipment_slot in equipment_slots:
+            for equipment_slot in self.game_catalog.equipment_slots:
                 slot_id = equipment_slot[EquipmentSlotsTable.EQUIPMENT_SLOT_ID]
                 slot_name = equipment_slot[EquipmentSlotsTable.EQUIPMENT_SLOT_NAME]
                 self.equipment_item_tiles_grid.set_tile_name(slot_id - 1, 0, slot_name)
@@ -77,11 +81,10 @@ class EquipmentManager(Window):
         character_equipped_items = DatabaseService.get_character_equipped_items(self.character_id)
 
         item_ids = [equipped_item[CharacterEquipmentTable.ITEM_ID] for equipped_item in character_equipped_items]
-        items = DatabaseService.get_items(item_ids)
+        items = self.game_catalog.get_items(item_ids)
 
         equipment_dict = {}
-        equipment_slots = DatabaseService.get_equipment_slots()
-        for equipment_slot in equipment_slots:
+        for equipment_slot in self.game_catalog.equipment_slots:
             equipment_dict[equipment_slot[EquipmentSlotsTable.EQUIPMENT_SLOT_ID]] = None
 
         for character_equipped_item in character_equipped_items:
@@ -96,8 +99,21 @@ class EquipmentManager(Window):
             slot_id = character_equipped_item[CharacterEquipmentTable.EQUIPMENT_SLOT_ID]
             equipment_dict[slot_id] = item_info
 
+        # slots journaled after the last save are replayed over the database rows, emptied slots are None
+        for slot_name, item_id in self.journal_manager.get_recovered_values(SaveFieldType.EQUIPMENT).items():
+            slot_id = self.game_catalog.get_equipment_slot_id(slot_name)
+            equipment_dict[slot_id] = None if item_id is None else self.game_catalog.get_item(item_id)
+
         return equipment_dict
 
+    def journal_equipment_slot(self, slot_id) -> None:
+        item_info = self.equipped_items[slot_id]
+        slot_name = self.game_catalog.equipment_slots_by_id[slot_id][EquipmentSlotsTable.EQUIPMENT_SLOT_NAME]
+        self.journal_manager.append(
+            SaveFieldType.EQUIPMENT,
+            {slot_name: None if item_info is None else item_info[ItemsTable.ITEM_ID]}
+        )
+
     def can_item_be_equipped(self, item_info):
         if self.player_manager.is_dead:
             self.error_messages_manager.push_message_to_queue(ErrorMessageType.YOU_ARE_DEAD)
@@ -126,12 +142,22 @@ class EquipmentManager(Window):
         for slot_id, item_info in self.equipped_items.items():
             self.equipment_item_tiles_grid.set_tile_item(slot_id - 1, 0, item_info, 1)
 
+    def get_save_state(self) -> dict:
+        return {
+            SaveFieldType.EQUIPMENT: {
+                slot_id: item_info[ItemsTable.ITEM_ID]
+                for slot_id, item_info in self.equipped_items.items()
+                if item_info is not None
+            }
+        }
+
     def equip_item(self, item_info) -> [str, int]:
         if self.can_item_be_equipped(item_info):
             slot = item_info[ItemsTable.EQUIPMENT_SLOT_ID]
             self.equipment_item_tiles_grid.set_tile_item(self.get_slot_item_tile_nr(slot), 0, item_info, 1)
             taken_off_item_info = self.equipped_items[slot]
             self.equipped_items[slot] = item_info
+            self.journal_equipment_slot(slot)
             return taken_off_item_info
         else:
             return item_info
@@ -25,14 +25,20 @@ class InteractiveObjectsManager:
             self.game_surface = game_surface
 
             self.map_manager = None
+            self.spatial_index_manager = None
+            self.world_snapshot = None
             self.current_map_id = None
 
             self.interactive_objects = {}
 
     def setup_references(self):
         from src.managers.gameplay.map_manager import MapManager
+        from src.managers.gameplay.spatial_index_manager import SpatialIndexManager
+        from src.world_snapshot import WorldSnapshot
 
         self.map_manager = MapManager.get_instance()
+        self.spatial_index_manager = SpatialIndexManager.get_instance()
+        self.world_snapshot = WorldSnapshot.get_instance()
 
     def update(self):
         self.load_interactive_objects()
@@ -41,35 +47,43 @@ class InteractiveObjectsManager:
         self.current_map_id = self.map_manager.map_id
         if self.current_map_id not in self.interactive_objects:
             self.interactive_objects[self.current_map_id] = []
-            objects_on_map = DatabaseService.get_objects_on_map(self.current_map_id)
-            object_on_map_ids = {object_on_map[MapObjectPositionsTable.OBJECT_ID] for object_on_map in objects_on_map}
-            loaded_objects = DatabaseService.get_objects_by_ids(object_on_map_ids)
-            object_types = DatabaseService.get_object_types()
+            objects_on_map = self.world_snapshot.get_map_objects(self.current_map_id)
+            if objects_on_map is None:
+                objects_on_map = DatabaseService.get_map_objects(self.current_map_id)
             for object_on_map in objects_on_map:
-                object_id = object_on_map[MapObjectPositionsTable.OBJECT_ID]
-                object_type = object_types[object_id]
-                object_type_name = object_type[ObjectTypesTable.OBJECT_TYPE_NAME]
-                object_type_data = DatabaseService.get_object_type_data(
-                    object_type[ObjectTypesTable.OBJECT_TYPE_TABLE_NAME],
-                    object_id
-                )
-                object_name = loaded_objects[object_id][ObjectsTable.OBJECT_NAME]
-                sprite_name = loaded_objects[object_id][ObjectsTable.SPRITE_NAME]
+                object_type_name = object_on_map[ObjectTypesTable.OBJECT_TYPE_NAME]
+                object_type_data = object_on_map['object_type_data']
+                object_name = object_on_map[ObjectsTable.OBJECT_NAME]
+                sprite_name = object_on_map[ObjectsTable.SPRITE_NAME]
                 if object_type_name == InteractiveObjectType.LOCATION_CHANGER:
-                    self.interactive_objects[self.current_map_id].append(
-                        LocationChanger(
-                            game_surface=self.game_surface,
-                            map_id=self.current_map_id,
-                            x=object_on_map[MapObjectPositionsTable.X],
-                            y=object_on_map[MapObjectPositionsTable.Y],
-                            destination_map_id=object_type_data[LocationChangersTable.DESTINATION_MAP_ID],
-                            destination_x=object_type_data[LocationChangersTable.DESTINATION_X],
-                            destination_y=object_type_data[LocationChangersTable.DESTINATION_Y],
-                            draw_size=CHARACTER_DRAW_SIZE,
-                            name=object_name,
-                            sprite_name=sprite_name
-                        )
+                    interactive_object = LocationChanger(
+                        game_surface=self.game_surface,
+                        map_id=self.current_map_id,
+                        x=object_on_map[MapObjectPositionsTable.X],
+                        y=object_on_map[MapObjectPositionsTable.Y],
+                        destination_map_id=object_type_data[LocationChangersTable.DESTINATION_MAP_ID],
+                        destination_x=object_type_data[LocationChangersTable.DESTINATION_X],
+                        destination_y=object_type_data[LocationChangersTable.DESTINATION_Y],
+                        draw_size=CHARACTER_DRAW_SIZE,
+                        name=object_name,
+                        sprite_name=sprite_name
                     )
+                    self.interactive_objects[self.current_map_id].append(interactive_object)
+                    self.spatial_index_manager.add_interactive_object(interactive_object)
+
+    def get_interactive_objects_in_range(self, position, distance):
+        x, y = position
+        return self.spatial_index_manager.get_interactive_objects_index(self.map_manager.map_id).query_radius(
+            x,
+            y,
+            distance
+        )
+
+    def get_dirty_rects(self) -> list:
+        return [
+            interactive_object.get_dirty_rect()
+            for interactive_object in self.interactive_objects[self.map_manager.map_id]
+        ]
 
     def draw_interactive_objects(self):
         for interactive_object in self.interactive_objects[self.map_manager.map_id]:
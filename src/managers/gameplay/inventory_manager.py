@@ -4,16 +4,21 @@ import pygame
 
 from database.game_database_table_columns_names import CharacterInventoryTable, ItemsTable
 from src.colors import WHITE
+from src.common_utils import load_image
 from src.database_service import DatabaseService
+from src.game_catalog import GameCatalog
 from src.enums.currency_type import CurrencyType
 from src.enums.error_message_type import ErrorMessageType
 from src.enums.rarity_type import RarityType
+from src.enums.save_field_type import SaveFieldType
 from src.fonts import FONT_ALICE_IN_WONDERLAND_18
 from src.interface.interface_constants import LOWER_UI_BAR_HEIGHT, XP_BAR_HEIGHT, WINDOW_DEFAULT_STRIPE_HEIGHT, \
     INTERFACE_TILE_SIZE
 from src.interface.item_tiles_grid import ItemTilesGrid
 from src.interface.window import Window
+from src.managers.core.journal_manager import JournalManager
 from src.managers.core.mouse_manager import MouseManager
+from src.managers.ui.text_cache_manager import render_text
 from src.paths import DIR_ASSETS_CURRENCIES
 
 
@@ -66,6 +71,8 @@ class InventoryManager(Window):
             )
 
             self.character_id = character_id
+            self.game_catalog = GameCatalog.get_instance()
+            self.journal_manager = JournalManager.get_instance()
 
             self.loot_manager = None
             self.player_manager = None
@@ -75,7 +82,10 @@ class InventoryManager(Window):
             self.equipment_manager = None
             self.sound_manager = None
 
-            self.currencies = DatabaseService.get_character_currencies(character_id)
+            self.currencies = {
+                **DatabaseService.get_character_currencies(character_id),
+                **self.journal_manager.get_recovered_values(SaveFieldType.CURRENCIES)
+            }
             self.currency_font = FONT_ALICE_IN_WONDERLAND_18
             self.currency_icons = {}
 
@@ -117,21 +127,43 @@ class InventoryManager(Window):
         self.load_currency_icons()
 
     def create_inventory_dict(self):
-        character_inventory = DatabaseService.get_character_inventory(self.character_id)
-        item_ids = [inventory_entry[CharacterInventoryTable.ITEM_ID] for inventory_entry in character_inventory]
-        items = DatabaseService.get_items(item_ids)
+        character_inventory = {
+            inventory_entry[CharacterInventoryTable.SLOT_NR]: (
+                inventory_entry[CharacterInventoryTable.ITEM_ID],
+                inventory_entry[CharacterInventoryTable.ITEM_QUANTITY]
+            )
+            for inventory_entry in DatabaseService.get_character_inventory(self.character_id)
+        }
+        # slots journaled after the last save are replayed over the database rows, emptied slots are None
+        for slot_nr, slot in self.journal_manager.get_recovered_values(SaveFieldType.INVENTORY).items():
+            if slot is None:
+                character_inventory.pop(int(slot_nr), None)
+            else:
+                character_inventory[int(slot_nr)] = tuple(slot)
+
+        item_ids = [item_id for item_id, _ in character_inventory.values()]
+        items = self.game_catalog.get_items(item_ids)
         inventory_dict = {}
-        for inventory_entry in character_inventory:
+        for slot_nr, (item_id, item_quantity) in character_inventory.items():
             for item_info in items:
-                if item_info[ItemsTable.ITEM_ID] == inventory_entry[CharacterInventoryTable.ITEM_ID]:
-                    inventory_dict[inventory_entry[CharacterInventoryTable.SLOT_NR]] = [item_info, inventory_entry[
-                        CharacterInventoryTable.ITEM_QUANTITY]]
+                if item_info[ItemsTable.ITEM_ID] == item_id:
+                    inventory_dict[slot_nr] = [item_info, item_quantity]
                     break
         return inventory_dict
 
+    def journal_inventory_slot(self, slot_nr) -> None:
+        slot = self.inventory.get(slot_nr)
+        self.journal_manager.append(
+            SaveFieldType.INVENTORY,
+            {slot_nr: None if slot is None else (slot[0][ItemsTable.ITEM_ID], slot[1])}
+        )
+
+    def journal_currency(self, currency_name) -> None:
+        self.journal_manager.append(SaveFieldType.CURRENCIES, {currency_name: self.currencies[currency_name]})
+
     def load_currency_icons(self):
         for currency_name, amount in self.currencies.items():
-            currency_icon = pygame.image.load(
+            currency_icon = load_image(
                 os.path.join(DIR_ASSETS_CURRENCIES, f'{currency_name}.png')
             ).convert_alpha()
             currency_icon = pygame.transform.scale(currency_icon, (self.CURRENCY_ICON_SIZE, self.CURRENCY_ICON_SIZE))
@@ -167,16 +199,30 @@ class InventoryManager(Window):
 
         for slot_to_clear in slots_to_clear:
             del self.inventory[slot_to_clear]
+            self.journal_inventory_slot(slot_to_clear)
 
     def add_gold(self, amount: int) -> None:
+        if not amount:
+            return
         self.currencies[CurrencyType.GOLD] += amount
+        self.journal_currency(CurrencyType.GOLD)
 
     def decrease_currency(self, currency_name, amount: int) -> None:
         self.currencies[currency_name] -= amount
+        self.journal_currency(currency_name)
 
     def get_currency(self, currency_name) -> int:
         return self.currencies[currency_name]
 
+    def get_save_state(self) -> dict:
+        return {
+            SaveFieldType.CURRENCIES: dict(self.currencies),
+            SaveFieldType.INVENTORY: {
+                slot_nr: (item_info[ItemsTable.ITEM_ID], item_quantity)
+                for slot_nr, (item_info, item_quantity) in self.inventory.items()
+            }
+        }
+
     def set_item_tiles_grid_items(self):
         self.item_tiles_grid.clear()
         for slot_nr, [item_info, item_quantity] in self.inventory.items():
@@ -194,9 +240,11 @@ class InventoryManager(Window):
                 if self.is_slot_occupied(slot_nr):
                     slot_nr = free_slot_nr
             self.inventory[slot_nr] = [item_info, item_quantity]
+            self.journal_inventory_slot(slot_nr)
 
     def remove_item_from_inventory(self, slot_nr: int) -> None:
         self.inventory.pop(slot_nr)
+        self.journal_inventory_slot(slot_nr)
 
     def handle_equip_item(self) -> bool:
         if self.equipment_manager.is_open:
@@ -248,6 +296,8 @@ class InventoryManager(Window):
             else:
                 self.inventory[clicked_slot_nr] = [self.held_item_info, self.held_item_quantity]
                 self.inventory.pop(self.held_item_slot_nr)
+            self.journal_inventory_slot(self.held_item_slot_nr)
+            self.journal_inventory_slot(clicked_slot_nr)
             self.held_item_info = None
             return True
         else:
@@ -322,8 +372,8 @@ class InventoryManager(Window):
         return False
 
     def draw_currency(self) -> None:
-        gold_text = self.currency_font.render(str(self.currencies[CurrencyType.GOLD]), False, WHITE)
-        eternal_ice_text = self.currency_font.render(str(self.currencies[CurrencyType.ETERNAL_ICE]), False, WHITE)
+        gold_text = render_text(self.currency_font, str(self.currencies[CurrencyType.GOLD]), False, WHITE)
+        eternal_ice_text = render_text(self.currency_font, str(self.currencies[CurrencyType.ETERNAL_ICE]), False, WHITE)
         gold_info_x = self.rect.x + self.GOLD_INFO_OFFSET_X
         eternal_ice_info_x = self.rect.x + (self.rect.width // 2) + self.ETERNAL_ICE_OFFSET_X
         currency_icon_y = (self.content_rect.y
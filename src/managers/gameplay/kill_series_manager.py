@@ -1,3 +1,5 @@
+import pygame
+
 from src.colors import RED, WHITE
 from src.enums.sound_type import SoundType
 from src.fonts import FONT_ALICE_IN_WONDERLAND_40
@@ -59,12 +61,22 @@ class KillSeriesManager:
             self.kill_series_text_x = 0
 
             from src.database_service import DatabaseService
-            self.kill_series_titles = DatabaseService.get_kill_series_titles()
+            from src.world_snapshot import WorldSnapshot
+            self.kill_series_titles = WorldSnapshot.get_instance().get_section('kill_series_titles')
+            if self.kill_series_titles is None:
+                self.kill_series_titles = DatabaseService.get_kill_series_titles()
             self.old_title = ''
             self.title_text = None
             self.title_text_x = 0
             self.title_text_y = self.kill_series_text_y - self.kills_and_title_font.get_height() - 10
 
+            self.kill_series_rect = pygame.Rect(
+                0,
+                self.title_text_y,
+                self.game_surface.get_width(),
+                self.remaining_time_bar.rect.bottom - self.title_text_y
+            )
+
     def setup_references(self):
         from src.managers.core.sound_manager import SoundManager
         from src.game_clock import GameClock
@@ -83,6 +95,9 @@ class KillSeriesManager:
     def kill_series(self):
         return self.kills
 
+    def get_dirty_rects(self) -> list:
+        return [self.kill_series_rect] if self.kills > 0 else []
+
     def refresh_kill_series(self) -> None:
         self.last_hit_time = self.game_clock.game_time
 
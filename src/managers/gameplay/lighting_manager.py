@@ -0,0 +1,180 @@
+import math
+
+import pygame
+
+from src.common_utils import normalize_value
+
+
+class LightingManager:
+    _instance = None
+
+    NIGHT_OVERLAY_ALPHA_MIN = 0
+    NIGHT_OVERLAY_ALPHA_MAX = 220
+    NIGHT_OVERLAY_ACCURACY = 0.2
+
+    # one light map pixel covers that many world surface pixels in each direction
+    LIGHT_MAP_CELL_SIZE = 8
+    # darkness grows with the squared distance from the light source
+    LIGHT_FALLOFF_EXPONENT = 2
+
+    @classmethod
+    def get_instance(cls):
+        return cls._instance
+
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self, game_surface):
+        if not hasattr(self, 'initialized'):
+            self.initialized = True
+
+            self.game_surface = game_surface
+
+            self.datetime_manager = None
+            self.map_manager = None
+            self.player_manager = None
+            self.viewport_manager = None
+            self.render_scale_manager = None
+            self.interactive_objects_manager = None
+
+            overlays_count = int(self.NIGHT_OVERLAY_ALPHA_MAX * self.NIGHT_OVERLAY_ACCURACY) + 1
+            self.night_overlay_alpha_step = self.NIGHT_OVERLAY_ALPHA_MAX / overlays_count
+
+            # single world sized overlay holding the brightness of every pixel, refilled when the night changes
+            self.night_overlay = None
+            # with lights on the screen the overlay is drawn small, with the lights cut out, and upscaled
+            self.light_map = None
+            self.light_sprites = {}
+
+            self.night_overlay_index = None
+            self.lights = ()
+            self._night_overlay_state = None
+
+    def setup_references(self):
+        from src.managers.gameplay.datetime_manager import DatetimeManager
+        from src.managers.gameplay.map_manager import MapManager
+        from src.managers.gameplay.player_manager import PlayerManager
+        from src.managers.gameplay.viewport_manager import ViewportManager
+        from src.managers.core.render_scale_manager import RenderScaleManager
+        from src.managers.gameplay.interactive_objects_manager import InteractiveObjectsManager
+
+        self.datetime_manager = DatetimeManager.get_instance()
+        self.map_manager = MapManager.get_instance()
+        self.player_manager = PlayerManager.get_instance()
+        self.viewport_manager = ViewportManager.get_instance()
+        self.render_scale_manager = RenderScaleManager.get_instance()
+        self.interactive_objects_manager = InteractiveObjectsManager.get_instance()
+
+    @property
+    def night_overlay_alpha(self):
+        if self.datetime_manager.is_first_half_of_night:
+            return 0 + normalize_value(
+                value=self.datetime_manager.second,
+                min_val=self.datetime_manager.NIGHT_START_TIME_IN_SECONDS,
+                max_val=self.datetime_manager.SECONDS_PER_DAY - 1,
+                new_min=self.NIGHT_OVERLAY_ALPHA_MIN,
+                new_max=self.NIGHT_OVERLAY_ALPHA_MAX
+            )
+        elif self.datetime_manager.is_second_half_of_night:
+            return self.NIGHT_OVERLAY_ALPHA_MAX - normalize_value(
+                value=self.datetime_manager.second,
+                min_val=0,
+                max_val=self.datetime_manager.DAY_START_TIME_IN_SECONDS - 1,
+                new_min=self.NIGHT_OVERLAY_ALPHA_MIN,
+                new_max=self.NIGHT_OVERLAY_ALPHA_MAX
+            )
+
+    def get_night_overlay_index(self) -> int | None:
+        if self.datetime_manager.is_day_now:
+            return None
+        return int(int(self.night_overlay_alpha) * self.NIGHT_OVERLAY_ACCURACY)
+
+    def get_light_sources(self) -> list:
+        map_id = self.map_manager.map_id
+        light_sources = [self.player_manager]
+        for portal in (self.player_manager.portal_to_town, self.player_manager.portal_in_town):
+            if portal is not None and portal.map_id == map_id:
+                light_sources.append(portal)
+        light_sources.extend(self.interactive_objects_manager.interactive_objects.get(map_id, []))
+        return [light_source for light_source in light_sources if light_source.LIGHT_RADIUS]
+
+    def get_light(self, light_source) -> tuple | None:
+        # light map position and radius, None when the light does not reach the screen
+        light_radius = light_source.LIGHT_RADIUS
+        light_x, light_y = light_source.render_position
+        if not self.viewport_manager.is_area_visible(light_x, light_y, 2 * light_radius, 2 * light_radius):
+            return None
+        world_x, world_y = self.render_scale_manager.convert_screen_position_to_world_position(
+            self.viewport_manager.convert_map_position_to_screen_position(light_x, light_y)
+        )
+        return (
+            int(world_x // self.LIGHT_MAP_CELL_SIZE),
+            int(world_y // self.LIGHT_MAP_CELL_SIZE),
+            max(1, math.ceil(light_radius * self.render_scale_manager.render_scale / self.LIGHT_MAP_CELL_SIZE))
+        )
+
+    def update(self) -> None:
+        # called once per frame after the camera moves, the state decides whether the screen has to be redrawn
+        self.night_overlay_index = self.get_night_overlay_index()
+        if self.night_overlay_index is None:
+            self.lights = ()
+            return
+        lights = (self.get_light(light_source) for light_source in self.get_light_sources())
+        self.lights = tuple(light for light in lights if light is not None)
+
+    @property
+    def lighting_state(self) -> tuple:
+        return self.night_overlay_index, self.lights
+
+    def get_light_sprite(self, radius) -> pygame.Surface:
+        light_sprite = self.light_sprites.get(radius)
+        if light_sprite is None:
+            # blended with the maximum, so overlapping lights never darken each other
+            light_sprite = pygame.Surface((2 * radius, 2 * radius))
+            for y in range(2 * radius):
+                for x in range(2 * radius):
+                    distance = math.hypot(x + 0.5 - radius, y + 0.5 - radius) / radius
+                    brightness = int(255 * (1 - (min(1.0, distance) ** self.LIGHT_FALLOFF_EXPONENT)))
+                    light_sprite.set_at((x, y), (brightness, brightness, brightness))
+            self.light_sprites[radius] = light_sprite
+        return light_sprite
+
+    def update_night_overlay(self, brightness) -> None:
+        world_size = self.render_scale_manager.world_surface.get_size()
+        night_overlay_state = (brightness, self.lights, world_size)
+        if night_overlay_state == self._night_overlay_state:
+            return
+        self._night_overlay_state = night_overlay_state
+
+        if self.night_overlay is None or self.night_overlay.get_size() != world_size:
+            self.night_overlay = pygame.Surface(world_size)
+        if not self.lights:
+            self.night_overlay.fill((brightness, brightness, brightness))
+            return
+
+        world_width, world_height = world_size
+        light_map_size = (math.ceil(world_width / self.LIGHT_MAP_CELL_SIZE),
+                          math.ceil(world_height / self.LIGHT_MAP_CELL_SIZE))
+        if self.light_map is None or self.light_map.get_size() != light_map_size:
+            self.light_map = pygame.Surface(light_map_size)
+        self.light_map.fill((brightness, brightness, brightness))
+        self.light_map.blits(
+            [
+                (self.get_light_sprite(radius), (x - radius, y - radius), None, pygame.BLEND_RGB_MAX)
+                for x, y, radius in self.lights
+            ],
+            doreturn=False
+        )
+        pygame.transform.smoothscale(self.light_map, world_size, self.night_overlay)
+
+    def draw_night_overlay(self) -> None:
+        if self.night_overlay_index is None:
+            return
+
+        # multiplying by the brightness darkens like black drawn with the night alpha, but blends faster
+        brightness = 255 - int(self.night_overlay_index * self.night_overlay_alpha_step)
+        # rebuilt only when the darkness or a light on the screen changes
+        self.update_night_overlay(brightness)
+        self.render_scale_manager.world_surface.blit(self.night_overlay, (0, 0), special_flags=pygame.BLEND_RGB_MULT)
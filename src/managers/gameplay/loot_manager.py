@@ -1,3 +1,4 @@
+import itertools
 import os
 import random
 
@@ -5,8 +6,7 @@ import pygame
 
 from database.game_database_table_columns_names import ItemsTable
 from src.colors import BLACK, WHITE, RARITY_COLORS
-from src.common_utils import euclidean_distance
-from src.database_service import DatabaseService
+from src.common_utils import euclidean_distance, load_image
 from src.entities.character import INTERACTION_DISTANCE
 from src.enums.chat_message_color_type import ChatMessageColorType
 from src.enums.rarity_type import RarityType
@@ -15,7 +15,9 @@ from src.interface.interface_constants import BORDER_WIDTH
 from src.keybindings import KEY_SWITCH_SHOW_LOOT_NAMES
 from src.managers.core.mouse_manager import MouseManager
 from src.managers.gameplay.map_manager import MAP_COLLISION_TILE
+from src.models.loot import Loot
 from src.paths import PATH_ICON_LOOT, DIR_ASSETS_LOOT_GOLD
+from src.spatial_hash import SpatialHash
 
 
 class LootManager:
@@ -67,10 +69,15 @@ class LootManager:
             self.map_manager = None
             self.sound_manager = None
             self.chat_manager = None
+            self.game_catalog = None
+            self.spatial_index_manager = None
+            self.dirty_rects_manager = None
+            self.viewport_manager = None
+            self.render_scale_manager = None
 
             self.current_map_id = None
 
-            self.loot_icon = pygame.image.load(PATH_ICON_LOOT).convert_alpha()
+            self.loot_icon = load_image(PATH_ICON_LOOT).convert_alpha()
             self.loot_icon = pygame.transform.scale(self.loot_icon, (self.LOOT_ICON_SIZE, self.LOOT_ICON_SIZE))
 
             self.gold_icons = self.load_gold_icons()
@@ -81,6 +88,11 @@ class LootManager:
 
             self.draw_loot_names = True
 
+            # (name, rarity, is hovered) -> label surface shared by all loot records
+            self.loot_labels = {}
+            self.loot_counter = itertools.count()
+            self.loot_reach = self.LOOT_ICON_SIZE
+
             self.glow_surfaces = {}
             for rarity in RarityType:
                 glow_surface = pygame.Surface((self.LOOT_ICON_SIZE, self.LOOT_ICON_SIZE), pygame.SRCALPHA)
@@ -94,18 +106,28 @@ class LootManager:
         from src.managers.ui.chat_manager import ChatManager
         from src.managers.gameplay.map_manager import MapManager
         from src.managers.core.sound_manager import SoundManager
-
+        from src.managers.gameplay.spatial_index_manager import SpatialIndexManager
+        from src.managers.core.dirty_rects_manager import DirtyRectsManager
+        from src.managers.gameplay.viewport_manager import ViewportManager
+        from src.managers.core.render_scale_manager import RenderScaleManager
+        from src.game_catalog import GameCatalog
+
+        self.spatial_index_manager = SpatialIndexManager.get_instance()
+        self.dirty_rects_manager = DirtyRectsManager.get_instance()
+        self.viewport_manager = ViewportManager.get_instance()
+        self.render_scale_manager = RenderScaleManager.get_instance()
         self.player_manager = PlayerManager.get_instance()
         self.map_manager = MapManager.get_instance()
         self.sound_manager = SoundManager.get_instance()
         self.chat_manager = ChatManager.get_instance()
+        self.game_catalog = GameCatalog.get_instance()
 
     def load_gold_icons(self):
         gold_icons = []
         gold_icon_names = os.listdir(DIR_ASSETS_LOOT_GOLD)
         for gold_icon_name in gold_icon_names:
             gold_icon_path = os.path.join(DIR_ASSETS_LOOT_GOLD, gold_icon_name)
-            gold_icon = pygame.image.load(gold_icon_path).convert_alpha()
+            gold_icon = load_image(gold_icon_path).convert_alpha()
             gold_icon = pygame.transform.scale(gold_icon, (self.LOOT_ICON_SIZE, self.LOOT_ICON_SIZE))
             gold_icons.append(gold_icon)
         return gold_icons
@@ -124,68 +146,188 @@ class LootManager:
         if self.current_map_id not in self.gold:
             self.gold[self.current_map_id] = []
 
-    def is_loot_hovered(self, loot_position_on_screen, loot_name):
-        loot_screen_x, loot_screen_y = loot_position_on_screen
-        if self.draw_loot_names:
-            loot_name_text_width, loot_name_text_height = self.LOOT_NAME_FONT.size(loot_name)
-            loot_name_x = (loot_screen_x
-                           - (loot_name_text_width // 2)
-                           - self.LOOT_NAME_PADDING_X)
-            loot_name_y = (loot_screen_y
-                           - self.LOOT_NAME_OFFSET_Y
-                           - loot_name_text_height)
-            loot_name_rect = pygame.Rect(
-                loot_name_x,
-                loot_name_y,
-                loot_name_text_width + (2 * self.LOOT_NAME_PADDING_X),
-                loot_name_text_height
-            )
-            return loot_name_rect.collidepoint(pygame.mouse.get_pos())
+    def get_items_index(self) -> SpatialHash:
+        return self.spatial_index_manager.get_items_index(self.current_map_id)
+
+    def get_gold_index(self) -> SpatialHash:
+        return self.spatial_index_manager.get_gold_index(self.current_map_id)
+
+    def render_loot_label(self, loot_name, rarity_name, is_hovered) -> pygame.Surface:
+        if is_hovered:
+            text_color = BLACK
+            background_color = RARITY_COLORS[rarity_name]
         else:
-            loot_rect = pygame.Rect(
-                loot_screen_x - (self.LOOT_ICON_SIZE // 2),
-                loot_screen_y - (self.LOOT_ICON_SIZE // 2),
-                2 * (self.LOOT_ICON_SIZE // 2),
-                2 * (self.LOOT_ICON_SIZE // 2)
-            )
-            return loot_rect.collidepoint(pygame.mouse.get_pos())
+            text_color = RARITY_COLORS[rarity_name]
+            background_color = WHITE
+
+        loot_name_text = self.LOOT_NAME_FONT.render(loot_name, True, text_color)
+        loot_name_rect = pygame.Rect(
+            0,
+            0,
+            loot_name_text.get_width() + (2 * self.LOOT_NAME_PADDING_X),
+            loot_name_text.get_height()
+        )
+
+        # rounded corners stay transparent
+        loot_label = pygame.Surface(loot_name_rect.size, pygame.SRCALPHA)
 
-    def is_loot_clicked(self, loot_position_on_screen, loot_name) -> bool:
-        return MouseManager.is_left_clicked() and self.is_loot_hovered(loot_position_on_screen, loot_name)
+        # draw background
+        pygame.draw.rect(
+            loot_label,
+            background_color,
+            loot_name_rect,
+            border_radius=10
+        )
+
+        # draw black border
+        pygame.draw.rect(
+            loot_label,
+            BLACK,
+            loot_name_rect,
+            width=BORDER_WIDTH,
+            border_radius=10
+        )
+
+        loot_label.blit(loot_name_text, (self.LOOT_NAME_PADDING_X, 0))
+        return loot_label
+
+    def get_loot_label(self, loot_name, rarity_name, is_hovered) -> pygame.Surface:
+        key = (loot_name, rarity_name, is_hovered)
+        loot_label = self.loot_labels.get(key)
+        if loot_label is None:
+            loot_label = self.render_loot_label(loot_name, rarity_name, is_hovered)
+            self.loot_labels[key] = loot_label
+        return loot_label
+
+    def create_loot(self, loot_name, loot_position, loot_icon, rarity_name, item_info=None, quantity=1) -> Loot:
+        label = self.get_loot_label(loot_name, rarity_name, False)
+        label_width, label_height = label.get_size()
+        label_offset = (
+            -((label_width - (2 * self.LOOT_NAME_PADDING_X)) // 2) - self.LOOT_NAME_PADDING_X,
+            -self.LOOT_NAME_OFFSET_Y - label_height
+        )
+        loot = Loot(
+            loot_nr=next(self.loot_counter),
+            name=loot_name,
+            position=loot_position,
+            icon=loot_icon,
+            label=label,
+            hovered_label=self.get_loot_label(loot_name, rarity_name, True),
+            label_offset=label_offset,
+            glow=self.glow_surfaces[rarity_name] if item_info is not None else None,
+            item_info=item_info,
+            quantity=quantity
+        )
+        # how far from its position the loot can be drawn or hovered, widens every spatial query
+        self.loot_reach = max(
+            self.loot_reach,
+            label_width,
+            self.LOOT_NAME_OFFSET_Y + label_height,
+            self.LOOT_ICON_SIZE
+        )
+        return loot
+
+    def get_visible_loot(self, loot_index) -> list[Loot]:
+        visible_map_left, visible_map_top, visible_map_width, visible_map_height = (
+            self.viewport_manager.get_visible_map_rect()
+        )
+        visible_loot = loot_index.query_rect(
+            visible_map_left - self.loot_reach,
+            visible_map_top - self.loot_reach,
+            visible_map_width + (2 * self.loot_reach),
+            visible_map_height + (2 * self.loot_reach)
+        )
+        visible_loot.sort(key=lambda loot: loot.loot_nr)
+        return visible_loot
+
+    def get_hovered_loot_in_index(self, loot_index) -> list[Loot]:
+        mouse_x, mouse_y = self.map_manager.convert_screen_position_to_map_position()
+        hovered_loot = loot_index.query_rect(
+            mouse_x - self.loot_reach,
+            mouse_y - self.loot_reach,
+            2 * self.loot_reach,
+            2 * self.loot_reach,
+            lambda loot: loot.get_hit_rect(self.draw_loot_names).collidepoint(mouse_x, mouse_y)
+        )
+        hovered_loot.sort(key=lambda loot: loot.loot_nr)
+        return hovered_loot
+
+    def get_hovered_loot(self) -> Loot or None:
+        for loot_index in (self.get_items_index(), self.get_gold_index()):
+            hovered_loot = self.get_hovered_loot_in_index(loot_index)
+            if hovered_loot:
+                return hovered_loot[0]
+        return None
 
     def is_loot_in_range(self, player_x, player_y, loot_x, loot_y) -> bool:
         return euclidean_distance((player_x, player_y), (loot_x, loot_y)) <= self.LOOT_PICK_UP_DISTANCE
 
-    def pick_item_up(self, player_position) -> tuple[dict, tuple[int, int]] or None:
+    def get_clicked_loot_in_range(self, loot_index, player_position) -> Loot or None:
+        if not MouseManager.is_left_clicked():
+            return None
         player_x, player_y = player_position
-        for loot_index, loot in enumerate(self.items[self.current_map_id]):
-            item_info, item_quantity, item_position = loot
-            item_x, item_y = item_position
-            item_position_on_screen = self.map_manager.convert_map_position_to_screen_position(item_x, item_y)
-            if self.is_loot_in_range(player_x, player_y, item_x, item_y) and \
-                    self.is_loot_clicked(item_position_on_screen, item_info[ItemsTable.ITEM_NAME]):
-                del self.items[self.current_map_id][loot_index]
-                return (item_info, item_quantity), item_position
+        for loot in self.get_hovered_loot_in_index(loot_index):
+            if self.is_loot_in_range(player_x, player_y, loot.x, loot.y):
+                return loot
         return None
 
+    def add_item(self, item_info, item_quantity, item_position) -> None:
+        item_rarity = self.game_catalog.get_rarity_name(item_info[ItemsTable.RARITY_ID])
+        loot = self.create_loot(
+            loot_name=item_info[ItemsTable.ITEM_NAME],
+            loot_position=item_position,
+            loot_icon=self.loot_icon,
+            rarity_name=item_rarity,
+            item_info=item_info,
+            quantity=item_quantity
+        )
+        self.items[self.current_map_id].append(loot)
+        self.get_items_index().insert(loot, loot.x, loot.y)
+        # loot changes rarely and its names can be wider than any tracked rect
+        self.dirty_rects_manager.request_full_redraw()
+
+    def add_gold(self, gold_quantity, gold_position) -> None:
+        gold = self.create_loot(
+            loot_name=f'{gold_quantity} gold',
+            loot_position=gold_position,
+            loot_icon=self.get_gold_icon(gold_quantity),
+            rarity_name=RarityType.COMMON,
+            quantity=gold_quantity
+        )
+        self.gold[self.current_map_id].append(gold)
+        self.get_gold_index().insert(gold, gold.x, gold.y)
+        self.dirty_rects_manager.request_full_redraw()
+
+    def pick_item_up(self, player_position) -> tuple[dict, tuple[int, int]] or None:
+        loot = self.get_clicked_loot_in_range(self.get_items_index(), player_position)
+        if loot is None:
+            return None
+        self.remove_item(loot)
+        return (loot.item_info, loot.quantity), loot.position
+
     def pick_gold_up(self, player_position):
-        player_x, player_y = player_position
-        for gold_index, gold in enumerate(self.gold[self.current_map_id]):
-            gold_quantity, gold_position = gold
-            gold_x, gold_y = gold_position
-            gold_position_on_screen = self.map_manager.convert_map_position_to_screen_position(gold_x, gold_y)
-            if self.is_loot_in_range(player_x, player_y, gold_x, gold_y) and \
-                    self.is_loot_clicked(gold_position_on_screen, f'{gold_quantity} gold'):
-                del self.gold[self.current_map_id][gold_index]
-                return gold_quantity, gold_position
-        return None
+        gold = self.get_clicked_loot_in_range(self.get_gold_index(), player_position)
+        if gold is None:
+            return None
+        self.remove_gold(gold)
+        return gold.quantity, gold.position
+
+    def remove_item(self, loot) -> None:
+        self.items[self.current_map_id].remove(loot)
+        self.get_items_index().remove(loot)
+        self.dirty_rects_manager.request_full_redraw()
+
+    def remove_gold(self, gold) -> None:
+        self.gold[self.current_map_id].remove(gold)
+        self.get_gold_index().remove(gold)
+        self.dirty_rects_manager.request_full_redraw()
 
     def drop_loot(self, item_info, item_quantity, drop_position) -> None:
         item_position = (
             drop_position[0] + random.randint(0, MAP_COLLISION_TILE),
             drop_position[1] + random.randint(0, MAP_COLLISION_TILE)
         )
-        self.items[self.current_map_id].append((item_info, item_quantity, item_position))
+        self.add_item(item_info, item_quantity, item_position)
 
     @staticmethod
     def randomize_drop_position(drop_position) -> tuple[int, int] or None:
@@ -196,7 +338,7 @@ class LootManager:
 
     def generate_loot(self, drop_position, min_items=1, max_items=5) -> None:
         number_of_items = random.randint(min_items, max_items)
-        items = DatabaseService.get_random_items(number_of_items)
+        items = self.game_catalog.get_random_items(number_of_items)
         for item_info in items:
             if item_info[ItemsTable.RARITY_ID] in self.GENERATE_CHAT_MESSAGE_RARITIES:
                 self.chat_manager.push_message_to_chat(
@@ -204,7 +346,7 @@ class LootManager:
                     ChatMessageColorType.LEGENDARY_DROP
                 )
             item_position = self.randomize_drop_position(drop_position)
-            self.items[self.current_map_id].append([item_info, 1, item_position])
+            self.add_item(item_info, 1, item_position)
 
     def generate_gold(self, drop_position, npc_lvl, npc_rarity) -> None:
         gold_quantity = random.randint(
@@ -213,7 +355,7 @@ class LootManager:
         )
         gold_quantity += gold_quantity * self.NPC_RARITY_GOLD_BONUS.get(npc_rarity, 0)
         gold_position = self.randomize_drop_position(drop_position)
-        self.gold[self.current_map_id].append((gold_quantity, gold_position))
+        self.add_gold(gold_quantity, gold_position)
 
     def switch_show_names(self) -> None:
         self.draw_loot_names = not self.draw_loot_names
@@ -223,156 +365,44 @@ class LootManager:
             ChatMessageColorType.SYSTEM
         )
 
-    def _draw_item_glow(self, item_rarity, item_position_on_screen) -> None:
-
-        item_x, item_y = item_position_on_screen
-        self.game_surface.blit(
-            self.glow_surfaces[item_rarity],
-            (
-                item_x - (self.LOOT_ICON_SIZE // 2),
-                item_y - (self.LOOT_ICON_SIZE // 2))
-        )
-
-    def draw_loot_icon(self, item_position_on_screen) -> None:
-        item_x, item_y = item_position_on_screen
-        self.game_surface.blit(
-            self.loot_icon,
-            (
-                item_x - (self.LOOT_ICON_SIZE // 2),
-                item_y - (self.LOOT_ICON_SIZE // 2)
-            )
-        )
-
-    def draw_gold_icon(self, gold_position_on_screen, gold_icon) -> None:
-        gold_x, gold_y = gold_position_on_screen
-        self.game_surface.blit(
-            gold_icon,
-            (
-                gold_x - (self.LOOT_ICON_SIZE // 2),
-                gold_y - (self.LOOT_ICON_SIZE // 2)
-            )
-        )
-
-    def draw_loot_on_ground(self) -> None:
-        self.draw_items_on_ground()
-        self.draw_gold_on_ground()
-
-    def draw_items_on_ground(self) -> None:
-        for item_info, item_quantity, item_position in self.items[self.current_map_id]:
-            item_x, item_y = item_position
-            item_position_on_screen = self.map_manager.convert_map_position_to_screen_position(item_x, item_y)
-            item_rarity = DatabaseService.get_rarity_by_id(item_info[ItemsTable.RARITY_ID])
-            self._draw_item_glow(item_rarity, item_position_on_screen)
-            self.draw_loot_icon(item_position_on_screen)
-
     def get_gold_icon(self, gold_quantity):
         for icon_index, gold_quantity_range in enumerate(self.GOLD_QUANTITY_RANGES):
             if gold_quantity < gold_quantity_range:
                 return self.gold_icons[icon_index]
 
-    def draw_gold_on_ground(self) -> None:
-        for gold_quantity, gold_position in self.gold[self.current_map_id]:
-            gold_x, gold_y = gold_position
-            gold_position_on_screen = self.map_manager.convert_map_position_to_screen_position(gold_x, gold_y)
-            self.draw_gold_icon(gold_position_on_screen, self.get_gold_icon(gold_quantity))
-
-    def _draw_hovered_gold_name(self) -> bool:
-        for gold_quantity, gold_position in self.gold[self.current_map_id]:
-            gold_x, gold_y = gold_position
-            gold_name = f'{gold_quantity} gold'
-            gold_position_on_screen = self.map_manager.convert_map_position_to_screen_position(gold_x, gold_y)
-            if self.is_loot_hovered(gold_position_on_screen, gold_name):
-                self._draw_loot_name(
-                    loot_name=gold_name,
-                    loot_position=gold_position,
-                    is_hovered=True
-                )
-                return True
-        return False
-
-    def _draw_hovered_item_name(self) -> bool:
-        for item_info, item_quantity, item_position in self.items[self.current_map_id]:
-            item_x, item_y = item_position
-            item_name_position_on_screen = self.map_manager.convert_map_position_to_screen_position(item_x, item_y)
-            if self.is_loot_hovered(item_name_position_on_screen, item_info[ItemsTable.ITEM_NAME]):
-                self._draw_loot_name(
-                    loot_name=item_info[ItemsTable.ITEM_NAME],
-                    loot_position=item_position,
-                    loot_rarity=item_info[ItemsTable.RARITY_ID],
-                    is_hovered=True
-                )
-                return True
-        return False
-
-    def _draw_hovered_loot_name(self) -> None:
-        if self._draw_hovered_item_name():
-            return
-        self._draw_hovered_gold_name()
-
-    def _draw_gold_name(self, gold_quantity, position, is_hovered=False) -> None:
-        pass
-
-    def _draw_loot_name(self, loot_name, loot_position, loot_rarity=RarityType.COMMON, is_hovered=False) -> None:
-        if is_hovered:
-            text_color = BLACK
-            background_color = RARITY_COLORS[DatabaseService.get_rarity_by_id(loot_rarity)]
-        else:
-            text_color = RARITY_COLORS[DatabaseService.get_rarity_by_id(loot_rarity)]
-            background_color = WHITE
-
-        loot_name_text = self.LOOT_NAME_FONT.render(loot_name, True, text_color)
-        loot_x, loot_y = loot_position
-        loot_screen_x, loot_screen_y = self.map_manager.convert_map_position_to_screen_position(loot_x, loot_y)
-        loot_name_x = loot_screen_x - (loot_name_text.get_width() // 2) - self.LOOT_NAME_PADDING_X
-        loot_name_y = loot_screen_y - self.LOOT_NAME_OFFSET_Y - loot_name_text.get_height()
-
-        loot_name_rect = pygame.Rect(
-            loot_name_x,
-            loot_name_y,
-            loot_name_text.get_width() + (2 * self.LOOT_NAME_PADDING_X),
-            loot_name_text.get_height()
-        )
-
-        # draw background
-        pygame.draw.rect(
-            self.game_surface,
-            background_color,
-            loot_name_rect,
-            border_radius=10
-        )
-
-        # draw black border
-        pygame.draw.rect(
-            self.game_surface,
-            BLACK,
-            loot_name_rect,
-            width=BORDER_WIDTH,
-            border_radius=10
+    @staticmethod
+    def get_screen_position(map_position, camera_offset) -> tuple[float, float]:
+        return map_position[0] + camera_offset[0], map_position[1] + camera_offset[1]
+
+    def draw_loot_on_ground(self, visible_items, visible_gold, camera_offset) -> None:
+        blit_sequence = []
+        for item in visible_items:
+            item_position_on_screen = self.get_screen_position(item.icon_position, camera_offset)
+            blit_sequence.append((item.glow, item_position_on_screen))
+            blit_sequence.append((item.icon, item_position_on_screen))
+        for gold in visible_gold:
+            blit_sequence.append((gold.icon, self.get_screen_position(gold.icon_position, camera_offset)))
+        self.render_scale_manager.draw_world_surfaces(blit_sequence)
+
+    def draw_loot_labels(self, visible_loot, camera_offset) -> None:
+        self.game_surface.blits(
+            [(loot.label, self.get_screen_position(loot.label_position, camera_offset)) for loot in visible_loot],
+            doreturn=False
         )
 
-        self.game_surface.blit(loot_name_text, (loot_name_x + self.LOOT_NAME_PADDING_X, loot_name_y))
-
-    def _draw_loot_names(self) -> None:
-        self._draw_items_names()
-        self.draw_gold_names()
-
-    def draw_gold_names(self) -> None:
-        for gold_quantity, gold_position in self.gold[self.current_map_id]:
-            self._draw_loot_name(
-                loot_name=f'{gold_quantity} gold',
-                loot_position=gold_position
-            )
-
-    def _draw_items_names(self) -> None:
-        for item_info, item_quantity, item_position in self.items[self.current_map_id]:
-            self._draw_loot_name(
-                loot_name=item_info[ItemsTable.ITEM_NAME],
-                loot_position=item_position,
-                loot_rarity=item_info[ItemsTable.RARITY_ID]
+    def draw_hovered_loot_label(self, camera_offset) -> None:
+        hovered_loot = self.get_hovered_loot()
+        if hovered_loot is not None:
+            self.game_surface.blit(
+                hovered_loot.hovered_label,
+                self.get_screen_position(hovered_loot.label_position, camera_offset)
             )
 
     def draw_loot(self) -> None:
-        self.draw_loot_on_ground()
+        camera_offset = self.viewport_manager.offset
+        visible_items = self.get_visible_loot(self.get_items_index())
+        visible_gold = self.get_visible_loot(self.get_gold_index())
+        self.draw_loot_on_ground(visible_items, visible_gold, camera_offset)
         if self.draw_loot_names:
-            self._draw_loot_names()
-        self._draw_hovered_loot_name()
+            self.draw_loot_labels(visible_items + visible_gold, camera_offset)
+        self.draw_hovered_loot_label(camera_offset)
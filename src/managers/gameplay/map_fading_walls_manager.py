@@ -1,6 +1,7 @@
 import pygame
 
 from database.game_database_table_columns_names import MapFadingWallPositionsTable, MapFadingWallsTable
+from src.common_utils import load_image
 from src.database_service import DatabaseService
 
 
@@ -19,7 +20,7 @@ class MapFadingWall:
             height
         )
         self.alpha = 255
-        self.image = pygame.image.load(image_path).convert_alpha()
+        self.image = load_image(image_path).convert_alpha()
         self.image = pygame.transform.scale(self.image, (width, height))
 
     def is_colliding(self, position):
@@ -4,11 +4,13 @@ from database.game_database_table_columns_names import NpcsTable, MapNpcPosition
 from src.colors import GREEN, RED, WHITE
 from src.entities.character import CHARACTER_DRAW_SIZE
 from src.entities.npcs.npc import Npc
+from src.entities.npcs.npcs_store import NpcsStore
 from src.enums.character_attribute_type import CharacterAttributeType
 from src.enums.chat_message_color_type import ChatMessageColorType
 from src.fonts import FONT_ARIAL_16
 from src.interface.bar import Bar
 from src.keybindings import KEY_SWITCH_SHOW_FRIENDLY_NPC_MINI_HP_BARS, KEY_SWITCH_SHOW_HOSTILE_NPC_MINI_HP_BARS
+from src.managers.ui.text_cache_manager import render_text
 
 
 class NpcsManager:
@@ -42,8 +44,15 @@ class NpcsManager:
             self.chat_manager = None
             self.player_manager = None
             self.loot_manager = None
+            self.game_catalog = None
+            self.spatial_index_manager = None
+            self.ai_scheduler_manager = None
+            self.game_clock = None
+            self.world_snapshot = None
 
             self.npcs = {}
+            # map_id -> NpcsStore, empty when numpy is not installed
+            self.npcs_stores = {}
 
             self.hp_bar_x = (self.game_surface.get_width() // 2) - (self.NPC_HP_BAR_WIDTH // 2)
             self.hp_bar_y = self.NPC_HP_BAR_Y
@@ -62,13 +71,25 @@ class NpcsManager:
             self.are_friendly_npc_mini_hp_bar_visible = False
 
             self.hovered_npc = None
+            # npc -> (draw state, dirty rect) from the last time the dirty rects were collected
+            self._npcs_draw_states = {}
 
     def setup_references(self):
         from src.managers.gameplay.map_manager import MapManager
         from src.managers.ui.chat_manager import ChatManager
         from src.managers.gameplay.loot_manager import LootManager
         from src.managers.gameplay.player_manager import PlayerManager
-
+        from src.managers.gameplay.spatial_index_manager import SpatialIndexManager
+        from src.managers.gameplay.ai_scheduler_manager import AiSchedulerManager
+        from src.game_catalog import GameCatalog
+        from src.game_clock import GameClock
+        from src.world_snapshot import WorldSnapshot
+
+        self.world_snapshot = WorldSnapshot.get_instance()
+        self.game_catalog = GameCatalog.get_instance()
+        self.game_clock = GameClock.get_instance()
+        self.spatial_index_manager = SpatialIndexManager.get_instance()
+        self.ai_scheduler_manager = AiSchedulerManager.get_instance()
         self.map_manager = MapManager.get_instance()
         self.chat_manager = ChatManager.get_instance()
         self.player_manager = PlayerManager.get_instance()
@@ -82,40 +103,69 @@ class NpcsManager:
         if current_map_id not in self.npcs:
             self.npcs[current_map_id] = []
             from src.database_service import DatabaseService
-            npc_positions_on_map = DatabaseService.get_map_npc_positions(current_map_id)
-            npc_ids = {npc[NpcsTable.NPC_ID] for npc in npc_positions_on_map}
-            loaded_npcs = DatabaseService.get_npcs_by_ids(npc_ids)
-            for npc_position_on_map in npc_positions_on_map:
-                npc_id = npc_position_on_map[NpcsTable.NPC_ID]
-                npc_data = None
-                for npc in loaded_npcs:
-                    if npc[NpcsTable.NPC_ID] == npc_id:
-                        npc_data = npc
-                        break
-
-                npc_attributes = DatabaseService.get_npc_attributes(npc_id)
-                npc_roles_names = DatabaseService.get_npc_roles_names(npc_id)
-
-                self.npcs[current_map_id].append(
-                    Npc(
-                        game_surface=self.game_surface,
+            npcs_data = self.world_snapshot.get_map_npcs(current_map_id)
+            if npcs_data is None:
+                npcs_data = DatabaseService.get_map_npcs(current_map_id)
+            for npc_data in npcs_data:
+                self.add_npc(
+                    self.create_npc(
                         map_id=current_map_id,
-                        x=npc_position_on_map[MapNpcPositionsTable.X],
-                        y=npc_position_on_map[MapNpcPositionsTable.Y],
-                        draw_size=CHARACTER_DRAW_SIZE,
-                        sprite_name=npc_data[NpcsTable.SPRITE_NAME],
-                        name=npc_data[NpcsTable.NPC_NAME],
-                        attributes=npc_attributes,
-                        faction=npc_data[NpcsTable.FACTION_ID],
-                        rarity=DatabaseService.get_rarity_by_id(npc_data[NpcsTable.RARITY_ID]),
-                        lvl=npc_data[NpcsTable.LVL],
-                        roles_names=npc_roles_names,
-                        status=npc_data[NpcsTable.STATUS_ID]
+                        npc_data=npc_data,
+                        x=npc_data[MapNpcPositionsTable.X],
+                        y=npc_data[MapNpcPositionsTable.Y],
+                        attributes=npc_data['attributes'],
+                        roles_names=npc_data['roles_names']
                     )
                 )
 
+            self.build_npcs_store(current_map_id)
+
+    def create_npc(self, map_id, npc_data, x, y, attributes, roles_names, status=None) -> Npc:
+        return Npc(
+            game_surface=self.game_surface,
+            map_id=map_id,
+            x=x,
+            y=y,
+            draw_size=CHARACTER_DRAW_SIZE,
+            sprite_name=npc_data[NpcsTable.SPRITE_NAME],
+            name=npc_data[NpcsTable.NPC_NAME],
+            attributes=attributes,
+            faction=npc_data[NpcsTable.FACTION_ID],
+            rarity=self.game_catalog.get_rarity_name(npc_data[NpcsTable.RARITY_ID]),
+            lvl=npc_data[NpcsTable.LVL],
+            roles_names=roles_names,
+            status=npc_data[NpcsTable.STATUS_ID] if status is None else status
+        )
+
+    def add_npc(self, npc) -> None:
+        self.npcs.setdefault(npc.map_id, []).append(npc)
+        self.spatial_index_manager.add_npc(npc)
+
+    def build_npcs_store(self, map_id) -> None:
+        # has to be rebuilt after adding npcs to an already loaded map
+        if NpcsStore.is_available():
+            self.npcs_stores[map_id] = NpcsStore(
+                self.npcs[map_id],
+                activation_distance_hysteresis=Npc.ACTIVATION_DISTANCE_HYSTERESIS,
+                attack_cooldown=Npc.ATTACK_COOLDOWN_IN_SECONDS,
+                respawn_time=Npc.RESPAWN_TIME_IN_SECONDS
+            )
+
+    def update_npcs_store(self) -> None:
+        npcs_store = self.npcs_stores.get(self.map_manager.map_id)
+        if npcs_store is not None:
+            npcs_store.update(
+                self.player_manager.position,
+                not (self.player_manager.is_dead or self.player_manager.is_immune),
+                self.game_clock.game_time
+            )
+
+    def schedule_updates(self, delta_time) -> None:
+        self.update_npcs_store()
+        self.ai_scheduler_manager.schedule_npc_updates(self.npcs[self.map_manager.map_id], delta_time)
+
     def handle_events(self) -> bool:
-        for npc in self.npcs[self.map_manager.map_id]:
+        for npc, _ in self.ai_scheduler_manager.scheduled_npc_updates:
             if npc.handle_event():
                 return True
         return False
@@ -124,9 +174,10 @@ class NpcsManager:
         for npc in self.npcs[self.map_manager.map_id]:
             npc.reset()
 
-    def perform_actions(self, delta_time) -> None:
-        for npc in self.npcs[self.map_manager.map_id]:
-            npc.perform_actions(delta_time)
+    def perform_actions(self) -> None:
+        # every npc gets the time passed since its own last update
+        for npc, npc_delta_time in self.ai_scheduler_manager.scheduled_npc_updates:
+            npc.perform_actions(npc_delta_time)
 
     def switch_show_hostile_npc_mini_hp_bars(self) -> None:
         self.are_hostile_npc_mini_hp_bar_visible = not self.are_hostile_npc_mini_hp_bar_visible
@@ -144,6 +195,9 @@ class NpcsManager:
             ChatMessageColorType.SYSTEM
         )
 
+    def switch_show_update_tiers(self) -> None:
+        self.ai_scheduler_manager.switch_show_debug_overlay()
+
     def draw_npc_info(self, npc):
         if not npc.is_dead and npc.is_hovered:
             npc_name_text_x = (self.game_surface.get_width() // 2) - (npc.name_text.get_width() // 2)
@@ -179,7 +233,7 @@ class NpcsManager:
             self.npc_hp_bar.draw(npc_hp, npc_max_hp)
 
             # draw hp text
-            npc_hp_text = self.npc_hp_font.render(f'{npc_hp} / {npc_max_hp}', True, WHITE)
+            npc_hp_text = render_text(self.npc_hp_font, f'{npc_hp} / {npc_max_hp}', True, WHITE)
             npc_hp_text_x = (self.hp_bar_x
                              + (self.NPC_HP_BAR_WIDTH // 2)
                              - (npc_hp_text.get_width() // 2))
@@ -192,17 +246,67 @@ class NpcsManager:
         if self.hovered_npc is not None:
             self.draw_npc_info(self.hovered_npc)
 
+    def get_npcs_at_position(self, position):
+        map_x, map_y = position
+        return self.spatial_index_manager.get_npcs_index(self.map_manager.map_id).query_point(
+            map_x,
+            map_y,
+            CHARACTER_DRAW_SIZE
+        )
+
+    def get_hovered_npcs(self):
+        return self.get_npcs_at_position(self.map_manager.convert_screen_position_to_map_position())
+
     def get_hovered_npc_info(self):
-        for npc in self.npcs[self.map_manager.map_id]:
-            if not npc.is_dead and npc.is_hovered:
+        for npc in self.get_hovered_npcs():
+            if not npc.is_dead:
                 self.hovered_npc = npc
                 return npc.get_cursor_name()
         self.hovered_npc = None
         return None
 
+    def get_hovered_npc_info_rect(self) -> pygame.Rect:
+        return pygame.Rect(
+            0,
+            self.NPC_NAME_Y,
+            self.game_surface.get_width(),
+            self.hp_bar_y + self.NPC_HP_BAR_HEIGHT - self.NPC_NAME_Y
+        )
+
+    def get_dirty_rects(self) -> list:
+        # npcs drawn the same as in the previous frame are left out
+        dirty_rects = []
+        npcs_draw_states = {}
+        for npc in self.npcs[self.map_manager.map_id]:
+            if not npc.is_visible:
+                continue
+            # animation steps due in this frame are taken now, drawing them later changes nothing
+            npc.update_animation()
+            npc_draw_state = npc.get_draw_state()
+            if self.ai_scheduler_manager.is_debug_overlay_visible:
+                # update tier is shown under the npc
+                npc_draw_state = (*npc_draw_state, self.ai_scheduler_manager.get_npc_tier(npc))
+            npc_dirty_rect = npc.get_dirty_rect()
+            npcs_draw_states[npc] = (npc_draw_state, npc_dirty_rect)
+            previous_draw_state = self._npcs_draw_states.pop(npc, None)
+            if previous_draw_state is None or previous_draw_state[0] != npc_draw_state:
+                dirty_rects.append(npc_dirty_rect)
+        # whatever is left was removed or went off the screen, it is erased where it was drawn last
+        dirty_rects.extend(npc_dirty_rect for _, npc_dirty_rect in self._npcs_draw_states.values())
+        self._npcs_draw_states = npcs_draw_states
+        if self.hovered_npc is not None:
+            dirty_rects.append(self.get_hovered_npc_info_rect())
+        dirty_rects.extend(self.ai_scheduler_manager.get_dirty_rects())
+        return dirty_rects
+
     def draw_npcs(self) -> None:
         for npc in self.npcs[self.map_manager.map_id]:
             npc.draw()
+            if not npc.is_visible:
+                continue
             if ((self.are_friendly_npc_mini_hp_bar_visible and not self.player_manager.is_enemy(npc))
                     or (self.are_hostile_npc_mini_hp_bar_visible and self.player_manager.is_enemy(npc))):
                 npc.draw_mini_hp_bar()
+
+    def draw_update_tiers(self) -> None:
+        self.ai_scheduler_manager.draw_debug_overlay(self.npcs[self.map_manager.map_id])
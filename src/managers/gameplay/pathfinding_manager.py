@@ -0,0 +1,147 @@
+import heapq
+from collections import OrderedDict
+
+from config import PATH_REQUESTS_PER_FRAME
+from src.common_utils import euclidean_distance
+from src.pathfinding.a_star import a_star
+from src.pathfinding.collision_grid import CollisionGrid
+from src.pathfinding.flow_field import FlowField
+
+
+class PathfindingManager:
+    _instance = None
+
+    # fields returned to NPCs following the flow field, current field included
+    FLOW_FIELD_PATH_LENGTH = 3
+
+    PATH_CACHE_SIZE = 1024
+
+    @classmethod
+    def get_instance(cls):
+        return cls._instance
+
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if not hasattr(self, 'initialized'):
+            self.initialized = True
+
+            self.player_manager = None
+
+            self.grid = None
+            self.grid_version = 0
+
+            self.player_flow_field = None
+            self._player_flow_field_goal = None
+
+            self.path_requests_per_frame = PATH_REQUESTS_PER_FRAME
+            self._path_requests_this_frame = 0
+            # requester -> destination field, only the latest request of each requester is kept
+            self._pending_path_requests = {}
+            self._path_cache = OrderedDict()
+
+            self.cache_hits_count = 0
+            self.replans_count = 0
+            self.deferred_requests_count = 0
+
+    def setup_references(self):
+        from src.managers.gameplay.player_manager import PlayerManager
+
+        self.player_manager = PlayerManager.get_instance()
+
+    def load_grid(self, collisions_grid) -> None:
+        self.grid = CollisionGrid(collisions_grid)
+        self.grid_version += 1
+        self.player_flow_field = FlowField(self.grid)
+        self._player_flow_field_goal = None
+        self._pending_path_requests.clear()
+        self._path_cache.clear()
+
+    def update_player_flow_field(self) -> None:
+        player_field = (self.player_manager.row, self.player_manager.column)
+        if player_field != self._player_flow_field_goal:
+            self.player_flow_field.compute(*player_field)
+            self._player_flow_field_goal = player_field
+
+    def _get_cached_path(self, key):
+        if key in self._path_cache:
+            self._path_cache.move_to_end(key)
+            self.cache_hits_count += 1
+            return True, self._path_cache[key]
+        return False, None
+
+    def _compute_path(self, key):
+        (start_row, start_column), (destination_row, destination_column), _ = key
+        path = a_star(self.grid, start_row, start_column, destination_row, destination_column)
+        if path is not None:
+            path = tuple(path)
+        self.replans_count += 1
+        self._path_requests_this_frame += 1
+
+        self._path_cache[key] = path
+        if len(self._path_cache) > self.PATH_CACHE_SIZE:
+            self._path_cache.popitem(last=False)
+        return path
+
+    def find_path(self, start_row: int, start_column: int, destination_row: int, destination_column: int):
+        if self.grid is None:
+            return None
+        key = ((start_row, start_column), (destination_row, destination_column), self.grid_version)
+        is_cached, path = self._get_cached_path(key)
+        if not is_cached:
+            path = self._compute_path(key)
+        return list(path) if path is not None else None
+
+    @property
+    def is_budget_exhausted(self) -> bool:
+        return self._path_requests_this_frame >= self.path_requests_per_frame
+
+    def request_path(self, requester, destination_row: int, destination_column: int) -> bool:
+        # returns False when the request was deferred, requester keeps its stale path until then
+        if self.grid is None:
+            return False
+        key = ((requester.row, requester.column), (destination_row, destination_column), self.grid_version)
+        is_cached, path = self._get_cached_path(key)
+        if not is_cached:
+            if self.is_budget_exhausted:
+                self._pending_path_requests[requester] = (destination_row, destination_column)
+                self.deferred_requests_count += 1
+                return False
+            path = self._compute_path(key)
+
+        self._pending_path_requests.pop(requester, None)
+        requester.apply_path(list(path) if path is not None else None, (destination_row, destination_column))
+        return True
+
+    def get_path_request_priority(self, requester) -> float:
+        return euclidean_distance(requester.position, self.player_manager.position)
+
+    def process_path_requests(self) -> None:
+        self._path_requests_this_frame = 0
+        if not self._pending_path_requests:
+            return
+
+        nearest_requesters = heapq.nsmallest(
+            self.path_requests_per_frame,
+            self._pending_path_requests,
+            key=self.get_path_request_priority
+        )
+        for requester in nearest_requesters:
+            destination_row, destination_column = self._pending_path_requests.pop(requester)
+            if requester.is_dead or requester.map_id != self.player_manager.map_id:
+                continue
+            self.request_path(requester, destination_row, destination_column)
+
+    def get_statistics_message(self) -> str:
+        return (f'Pathfinding: cache hits: {self.cache_hits_count}, replans: {self.replans_count}, '
+                f'deferred: {self.deferred_requests_count}, pending: {len(self._pending_path_requests)}, '
+                f'budget: {self.path_requests_per_frame}/frame')
+
+    def get_path_to_player(self, row: int, column: int):
+        if self.grid is None:
+            return None
+        self.update_player_flow_field()
+        return self.player_flow_field.get_path(row, column, self.FLOW_FIELD_PATH_LENGTH)
@@ -9,9 +9,11 @@ from src.enums.character_attribute_type import CharacterAttributeType
 from src.enums.character_status_type import CharacterStatusType
 from src.enums.chat_message_color_type import ChatMessageColorType
 from src.enums.move_direction_type import MoveDirection
+from src.enums.save_field_type import SaveFieldType
 from src.enums.sound_type import SoundType
 from src.enums.sprite_state import SpriteState
 from src.interface.bar import Bar
+from src.interface.item_tile import ItemTile
 from src.managers.core.mouse_manager import MouseManager
 from src.managers.gameplay.map_manager import TOWN_MAP_ID
 from src.spells.town_portal_spell import OpenPortalToTownSpell
@@ -33,6 +35,8 @@ class PlayerManager(Character):
     CASTING_BAR_HEIGHT = 10
     CASTING_BAR_OFFSET_Y = 20
 
+    LIGHT_RADIUS = 250
+
     @classmethod
     def get_instance(cls):
         return cls._instance
@@ -65,14 +69,28 @@ class PlayerManager(Character):
             self.interactive_objects_manager = None
 
             from src.database_service import DatabaseService
+            from src.game_catalog import GameCatalog
+            from src.managers.core.journal_manager import JournalManager
+
+            self.journal_manager = JournalManager.get_instance()
 
-            self.character_data = DatabaseService.get_character_data(self._character_id)
+            # changes journaled after the last save are replayed over the database state
+            self.character_data = {
+                **DatabaseService.get_character_data(self._character_id),
+                **self.journal_manager.get_recovered_values(SaveFieldType.PROGRESS)
+            }
             self.is_hardcore = self.character_data[CharactersTable.IS_HARDCORE]
             self._xp = self.character_data[CharactersTable.XP]
 
-            character_position = DatabaseService.get_character_position(self._character_id)
-            attributes = DatabaseService.get_character_attributes(self._character_id)
-            faction = DatabaseService.get_faction_name(self.character_data[CharactersTable.FACTION_ID])
+            character_position = {
+                **DatabaseService.get_character_position(self._character_id),
+                **self.journal_manager.get_recovered_values(SaveFieldType.POSITION)
+            }
+            attributes = {
+                **DatabaseService.get_character_attributes(self._character_id),
+                **self.journal_manager.get_recovered_values(SaveFieldType.ATTRIBUTES)
+            }
+            faction = GameCatalog.get_instance().get_faction_name(self.character_data[CharactersTable.FACTION_ID])
 
             super().__init__(
                 game_surface=game_surface,
@@ -178,6 +196,24 @@ class PlayerManager(Character):
     def required_xp(self) -> int:
         return self._lvl * self.XP_PER_LEVEL
 
+    def journal_position(self) -> None:
+        self.journal_manager.append(
+            SaveFieldType.POSITION,
+            {
+                CharacterPositionsTable.MAP_ID: self.map_id,
+                CharacterPositionsTable.X: int(self.x),
+                CharacterPositionsTable.Y: int(self.y)
+            }
+        )
+
+    def get_save_state(self) -> dict:
+        # copies, compared with the previous save to find the changed fields
+        return {
+            SaveFieldType.PROGRESS: (self._lvl, int(self._xp)),
+            SaveFieldType.POSITION: (self.map_id, int(self.x), int(self.y)),
+            SaveFieldType.ATTRIBUTES: dict(self.attributes)
+        }
+
     def resurrect_in_town(self):
         self.fully_regenerate()
         self.portal_to_town.final_action()
@@ -213,9 +249,18 @@ class PlayerManager(Character):
             self.increase_stamina(self.attributes[CharacterAttributeType.STAMINA_REGENERATION_RATE])
 
     def increase_xp(self, amount) -> None:
+        if not amount:
+            return
         self._xp += amount
         if self._xp >= self.required_xp:
             self.handle_level_up()
+        self.journal_manager.append(
+            SaveFieldType.PROGRESS,
+            {
+                CharactersTable.LVL: self._lvl,
+                CharactersTable.XP: self._xp
+            }
+        )
 
     def add_gold(self, amount: int) -> None:
         self.inventory_manager.add_gold(amount)
@@ -235,10 +280,21 @@ class PlayerManager(Character):
         self.attributes[CharacterAttributeType.MAX_HP] += self.HP_PER_LVL
         self.attributes[CharacterAttributeType.MAX_MANA] += self.MANA_PER_LVL
         self.attributes[CharacterAttributeType.MAX_STAMINA] += self.STAMINA_PER_LVL
+        self.journal_manager.append(
+            SaveFieldType.ATTRIBUTES,
+            {
+                attribute_name: self.attributes[attribute_name]
+                for attribute_name in (CharacterAttributeType.MAX_HP,
+                                       CharacterAttributeType.MAX_MANA,
+                                       CharacterAttributeType.MAX_STAMINA)
+            }
+        )
         self._xp = remaining_xp
         self.fully_regenerate()
         self.sound_manager.play_sound(SoundType.LEVEL_UP)
         self.interface_manager.set_level_text()
+        # required level lines of tooltips change color
+        ItemTile.clear_tooltip_cards()
 
     def increase_stamina(self, delta: int) -> None:
         if delta == -1:
@@ -333,7 +389,9 @@ class PlayerManager(Character):
         return False
 
     def handle_attack_npc(self) -> bool:
-        for npc in self.npcs_manager.npcs[self.map_manager.map_id]:
+        if not MouseManager.is_left_clicked():
+            return False
+        for npc in self.npcs_manager.get_hovered_npcs():
             if npc.is_clicked:
                 if self.perform_attack(npc):
                     self.kill_series_manager.refresh_kill_series()
@@ -364,14 +422,22 @@ class PlayerManager(Character):
             return False
 
     def handle_interact_with_npc(self) -> bool:
-        for npc in self.npcs_manager.npcs[self._map_id]:
+        if not MouseManager.is_left_clicked():
+            return False
+        for npc in self.npcs_manager.get_hovered_npcs():
             if npc.is_clicked and not self.is_enemy(npc) and self.is_target_in_interaction_distance(npc):
                 npc.interact()
                 return True
         return False
 
     def handle_interact_with_object(self) -> bool:
-        for interactive_object in self.interactive_objects_manager.interactive_objects[self._map_id]:
+        if not MouseManager.is_left_clicked():
+            return False
+        interactive_objects_in_range = self.interactive_objects_manager.get_interactive_objects_in_range(
+            self.position,
+            self.interaction_distance
+        )
+        for interactive_object in interactive_objects_in_range:
             if (interactive_object.is_clicked
                     and interactive_object.is_active
                     and self.is_target_in_interaction_distance(interactive_object)):
@@ -399,6 +465,13 @@ class PlayerManager(Character):
         if self.portal_in_town:
             self.portal_in_town.draw()
 
+    def get_dirty_rects(self) -> list:
+        dirty_rects = [self.get_dirty_rect(), self.casting_bar.rect]
+        for portal in (self.portal_to_town, self.portal_in_town):
+            if portal is not None and portal.map_id == self.map_manager.map_id:
+                dirty_rects.append(portal.get_dirty_rect())
+        return dirty_rects
+
     def draw_player(self) -> None:
         self.draw_portals()
         self.spells_handler.draw_casting_animation()
@@ -1,5 +1,6 @@
 import pygame.image
 
+from src.common_utils import load_image
 from src.enums.character_attribute_type import CharacterAttributeType
 from src.enums.error_message_type import ErrorMessageType
 from src.interface.button import Button
@@ -37,7 +38,7 @@ class PotionsManager:
             self.hp_potion_last_use_time = float('-inf')
             self.mana_potion_last_use_time = float('-inf')
 
-            self.hp_potion_image = pygame.image.load(PATH_IMAGE_HP_POTION).convert_alpha()
+            self.hp_potion_image = load_image(PATH_IMAGE_HP_POTION).convert_alpha()
             self.hp_potion_image = pygame.transform.scale(
                 self.hp_potion_image,
                 (
@@ -55,7 +56,7 @@ class PotionsManager:
                 is_ready_check=self._is_hp_potion_ready
             )
 
-            self.mana_potion_image = pygame.image.load(PATH_IMAGE_MANA_POTION).convert_alpha()
+            self.mana_potion_image = load_image(PATH_IMAGE_MANA_POTION).convert_alpha()
             self.mana_potion_image = pygame.transform.scale(
                 self.mana_potion_image,
                 (
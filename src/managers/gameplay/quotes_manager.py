@@ -22,6 +22,7 @@ class Quote:
     QUOTE_FONT = FONT_MONOSPACE_COURIER_16
 
     game_clock = None
+    viewport_manager = None
 
     def __init__(self, game_surface, speaker_reference, speaker_draw_size, quote):
         self.game_surface = game_surface
@@ -36,8 +37,10 @@ class Quote:
     @classmethod
     def setup_references(cls):
         from src.game_clock import GameClock
+        from src.managers.gameplay.viewport_manager import ViewportManager
 
         cls.game_clock = GameClock.get_instance()
+        cls.viewport_manager = ViewportManager.get_instance()
 
     def is_quote_time_over(self):
         return self.speaker_reference.is_dead or (
@@ -54,21 +57,35 @@ class Quote:
             quote_lines.append(cls.QUOTE_FONT.render(quote_chunk, False, quote_color))
         return quote_lines
 
-    def draw(self) -> None:
+    def get_quote_window_rect(self) -> pygame.Rect:
         quote_window_width = (max(quote_line.get_width() for quote_line in self.quote_lines)
                               + (2 * self.QUOTE_WINDOW_TEXT_PADDING_X))
         quote_window_height = self.QUOTE_FONT.get_height() * len(self.quote_lines)
 
-        quote_window_x = (self.speaker_reference.x
+        speaker_x, speaker_y = self.speaker_reference.render_position
+        quote_window_x = (speaker_x
                           - (self.speaker_draw_size // 2)
                           - ((quote_window_width - self.speaker_draw_size) // 2))
-        quote_window_y = (self.speaker_reference.y
+        quote_window_y = (speaker_y
                           - (self.speaker_draw_size // 2)
                           - quote_window_height)
 
-        quote_window_screen_x, quote_window_screen_y = self.speaker_reference.map_manager.convert_map_position_to_screen_position(
+        quote_window_screen_x, quote_window_screen_y = self.viewport_manager.convert_map_position_to_screen_position(
             quote_window_x, quote_window_y
         )
+        return pygame.Rect(quote_window_screen_x, quote_window_screen_y, quote_window_width, quote_window_height)
+
+    def get_dirty_rect(self) -> pygame.Rect:
+        # text lines are drawn with spacing, so the last one can stick out of the window
+        quote_window_rect = self.get_quote_window_rect()
+        return quote_window_rect.inflate(0, 2 * self.QUOTE_LINES_OFFSET_Y * len(self.quote_lines))
+
+    def draw(self) -> None:
+        if not self.viewport_manager.is_screen_rect_visible(self.get_dirty_rect()):
+            return
+        quote_window_rect = self.get_quote_window_rect()
+        quote_window_screen_x, quote_window_screen_y = quote_window_rect.topleft
+        quote_window_width, quote_window_height = quote_window_rect.size
 
         # draw quote window background
         pygame.draw.rect(
@@ -160,6 +177,9 @@ class QuotesManager:
             )
             self._quotes_queue.append(quote_entry)
 
+    def get_dirty_rects(self) -> list:
+        return [quote.get_dirty_rect() for quote in self._quotes_queue]
+
     def draw_quotes(self) -> None:
         quotes_to_delete = []
         for quote in self._quotes_queue:
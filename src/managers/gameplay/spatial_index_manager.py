@@ -0,0 +1,56 @@
+from src.managers.gameplay.map_manager import MAP_COLLISION_TILE
+from src.spatial_hash import SpatialHash
+
+
+class SpatialIndexManager:
+    _instance = None
+
+    CELL_SIZE = MAP_COLLISION_TILE
+
+    @classmethod
+    def get_instance(cls):
+        return cls._instance
+
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if not hasattr(self, 'initialized'):
+            self.initialized = True
+
+            # map_id -> SpatialHash
+            self.npcs_indexes = {}
+            self.interactive_objects_indexes = {}
+            self.items_indexes = {}
+            self.gold_indexes = {}
+
+    def _get_index(self, indexes, map_id) -> SpatialHash:
+        if map_id not in indexes:
+            indexes[map_id] = SpatialHash(self.CELL_SIZE)
+        return indexes[map_id]
+
+    def get_npcs_index(self, map_id) -> SpatialHash:
+        return self._get_index(self.npcs_indexes, map_id)
+
+    def get_interactive_objects_index(self, map_id) -> SpatialHash:
+        return self._get_index(self.interactive_objects_indexes, map_id)
+
+    def get_items_index(self, map_id) -> SpatialHash:
+        return self._get_index(self.items_indexes, map_id)
+
+    def get_gold_index(self, map_id) -> SpatialHash:
+        return self._get_index(self.gold_indexes, map_id)
+
+    @staticmethod
+    def add_entity(spatial_hash, entity) -> None:
+        # entity keeps the reference so that it can move itself between cells
+        entity.spatial_hash = spatial_hash
+        spatial_hash.insert(entity, entity.x, entity.y)
+
+    def add_npc(self, npc) -> None:
+        self.add_entity(self.get_npcs_index(npc.map_id), npc)
+
+    def add_interactive_object(self, interactive_object) -> None:
+        self.add_entity(self.get_interactive_objects_index(interactive_object.map_id), interactive_object)
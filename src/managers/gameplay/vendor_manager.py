@@ -1,6 +1,5 @@
 from database.game_database_table_columns_names import ItemsTable
 from src.colors import WHITE, BLACK
-from src.database_service import DatabaseService
 from src.enums.error_message_type import ErrorMessageType
 from src.fonts import FONT_ALICE_IN_WONDERLAND_18
 from src.interface.button import Button
@@ -35,6 +34,7 @@ class VendorManager(Window):
     error_messages_manager = None
     items_database_manager = None
     loot_manager = None
+    game_catalog = None
 
     @classmethod
     def get_instance(cls):
@@ -87,12 +87,14 @@ class VendorManager(Window):
         from src.managers.gameplay.loot_manager import LootManager
         from src.managers.ui.item_icons_manager import ItemIconsManager
         from src.managers.ui.error_messages_manager import ErrorMessagesManager
+        from src.game_catalog import GameCatalog
 
         self.player_manager = PlayerManager.get_instance()
         self.inventory_manager = InventoryManager.get_instance()
         self.error_messages_manager = ErrorMessagesManager.get_instance()
         self.items_database_manager = ItemIconsManager.get_instance()
         self.loot_manager = LootManager.get_instance()
+        self.game_catalog = GameCatalog.get_instance()
 
     def set_data(self):
         sell_all_junk_button = Button(
@@ -161,7 +163,7 @@ class VendorManager(Window):
                 self.inventory_manager.decrease_currency(CurrencyType.GOLD, value)
                 self.inventory_manager.add_item_to_inventory(item_info, item_quantity)
                 self.vendor_reference.items.pop(clicked_slot_nr)
-                self.vendor_reference.items.append([DatabaseService.get_random_items(1)[0], 1])
+                self.vendor_reference.items.append([self.game_catalog.get_random_items(1)[0], 1])
                 self.vendor_items_tiles_grid.set_items(self.vendor_reference.get_items())
 
     @property
@@ -0,0 +1,74 @@
+import pygame
+
+
+class ViewportManager:
+    _instance = None
+
+    @classmethod
+    def get_instance(cls):
+        return cls._instance
+
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self, game_surface):
+        if not hasattr(self, 'initialized'):
+            self.initialized = True
+
+            self.game_surface = game_surface
+            self.screen_rect = game_surface.get_rect()
+
+            self.player_manager = None
+
+            # screen position of the map origin
+            self.offset_x = 0
+            self.offset_y = 0
+
+            # visible part of the map in map coordinates
+            self.left = 0
+            self.top = 0
+            self.right = 0
+            self.bottom = 0
+
+    def setup_references(self):
+        from src.managers.gameplay.player_manager import PlayerManager
+
+        self.player_manager = PlayerManager.get_instance()
+
+    def update(self) -> None:
+        # camera follows the rendered player, computed once per frame before anything in the world is drawn
+        player_x, player_y = self.player_manager.render_position
+        screen_width, screen_height = self.screen_rect.size
+        self.offset_x = 0 - player_x + (screen_width // 2)
+        self.offset_y = 0 - player_y + (screen_height // 2)
+        self.left = -self.offset_x
+        self.top = -self.offset_y
+        self.right = self.left + screen_width
+        self.bottom = self.top + screen_height
+
+    @property
+    def offset(self) -> tuple[float, float]:
+        return self.offset_x, self.offset_y
+
+    def get_visible_map_rect(self) -> tuple[float, float, int, int]:
+        return self.left, self.top, self.screen_rect.width, self.screen_rect.height
+
+    def convert_map_position_to_screen_position(self, x, y) -> tuple[float, float]:
+        return x + self.offset_x, y + self.offset_y
+
+    def convert_screen_position_to_map_position(self, x, y) -> tuple[float, float]:
+        return x - self.offset_x, y - self.offset_y
+
+    def is_area_visible(self, x, y, width, height) -> bool:
+        # area of the given size centered on the map position
+        half_width = width / 2
+        half_height = height / 2
+        return (x + half_width > self.left
+                and x - half_width < self.right
+                and y + half_height > self.top
+                and y - half_height < self.bottom)
+
+    def is_screen_rect_visible(self, screen_rect) -> bool:
+        return self.screen_rect.colliderect(screen_rect)
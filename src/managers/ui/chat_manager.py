@@ -8,6 +8,7 @@ from src.inappropriate_content_filter import InappropriateContentFilter
 from src.interface.input_box import InputBox
 from src.interface.interface_constants import LOWER_UI_BAR_HEIGHT, XP_BAR_HEIGHT
 from src.interface.scrollable_window import ScrollableWindow
+from src.managers.ui.text_cache_manager import render_text
 
 
 class ChatManager(ScrollableWindow):
@@ -185,7 +186,7 @@ class ChatManager(ScrollableWindow):
         for message_index in range(first_message_index, last_message_index):
             message_color = self.messages[message_index][0]
             message_content = self.messages[message_index][1]
-            rendered_message = self.message_font.render(message_content, False, message_color.value)
+            rendered_message = render_text(self.message_font, message_content, False, message_color.value)
             self.rendered_messages.append(rendered_message)
 
     def draw_chat_messages(self):
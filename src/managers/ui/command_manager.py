@@ -1,3 +1,4 @@
+from config import PERF_RECORDS_PATH
 from src.common_utils import quit_game
 from src.enums.chat_message_color_type import ChatMessageColorType
 from src.enums.command_type import CommandType
@@ -44,6 +45,12 @@ class CommandManager:
             self.map_manager = None
             self.datetime_manager = None
             self.game_clock = None
+            self.pathfinding_manager = None
+            self.frame_profiler_manager = None
+            self.dirty_rects_manager = None
+            self.text_cache_manager = None
+            self.render_scale_manager = None
+            self.save_manager = None
 
             self.commands = {}
 
@@ -52,6 +59,12 @@ class CommandManager:
         from src.managers.gameplay.datetime_manager import DatetimeManager
         from src.managers.gameplay.map_manager import MapManager
         from src.managers.gameplay.player_manager import PlayerManager
+        from src.managers.gameplay.pathfinding_manager import PathfindingManager
+        from src.managers.core.frame_profiler_manager import FrameProfilerManager
+        from src.managers.core.dirty_rects_manager import DirtyRectsManager
+        from src.managers.ui.text_cache_manager import TextCacheManager
+        from src.managers.core.render_scale_manager import RenderScaleManager
+        from src.managers.core.save_manager import SaveManager
         from src.game_clock import GameClock
 
         self.game_clock = GameClock.get_instance()
@@ -59,11 +72,25 @@ class CommandManager:
         self.player_manager = PlayerManager.get_instance()
         self.map_manager = MapManager.get_instance()
         self.datetime_manager = DatetimeManager.get_instance()
+        self.pathfinding_manager = PathfindingManager.get_instance()
+        self.frame_profiler_manager = FrameProfilerManager.get_instance()
+        self.dirty_rects_manager = DirtyRectsManager.get_instance()
+        self.text_cache_manager = TextCacheManager.get_instance()
+        self.render_scale_manager = RenderScaleManager.get_instance()
+        self.save_manager = SaveManager.get_instance()
 
     def set_commands(self):
         self.add_command(CommandType.QUIT, quit_game)
         self.add_command(CommandType.GAME_TIME, self.send_game_time_message)
         self.add_command(CommandType.POSITION, self.send_player_position_message)
+        self.add_command(CommandType.PATHFINDING, self.send_pathfinding_statistics_message)
+        self.add_command(CommandType.PERF, self.send_perf_summary_message)
+        self.add_command(CommandType.PERF_RECORD, self.start_perf_recording)
+        self.add_command(CommandType.PERF_STOP, self.stop_perf_recording)
+        self.add_command(CommandType.DIRTY_RECTS, self.switch_dirty_rects_rendering)
+        self.add_command(CommandType.TEXT_CACHE, self.send_text_cache_statistics_message)
+        self.add_command(CommandType.RENDER_SCALE, self.switch_adaptive_render_scale)
+        self.add_command(CommandType.SAVE, self.save_game)
 
     def add_command(self, command_name: str, action: callable, args=None, kwargs=None) -> None:
         self.commands[command_name] = Command(action, args, kwargs)
@@ -99,3 +126,57 @@ class CommandManager:
                     ''',
             ChatMessageColorType.SYSTEM
         )
+
+    def send_pathfinding_statistics_message(self):
+        self.chat_manager.push_message_to_chat(
+            self.pathfinding_manager.get_statistics_message(),
+            ChatMessageColorType.SYSTEM
+        )
+
+    def send_perf_summary_message(self):
+        # chat wraps messages into lines on its own, every summary line is pushed separately
+        for line in self.frame_profiler_manager.get_summary_lines():
+            self.chat_manager.push_message_to_chat(line, ChatMessageColorType.SYSTEM)
+
+    def start_perf_recording(self):
+        self.frame_profiler_manager.start_recording(PERF_RECORDS_PATH)
+        self.chat_manager.push_message_to_chat(
+            f'Recording frame timings to {PERF_RECORDS_PATH}',
+            ChatMessageColorType.SYSTEM
+        )
+
+    def stop_perf_recording(self):
+        if not self.frame_profiler_manager.is_recording:
+            return
+        self.frame_profiler_manager.stop_recording()
+        self.chat_manager.push_message_to_chat(
+            f'Frame timings saved to {self.frame_profiler_manager.records_path}',
+            ChatMessageColorType.SYSTEM
+        )
+
+    def switch_dirty_rects_rendering(self):
+        self.dirty_rects_manager.switch_enabled()
+        self.chat_manager.push_message_to_chat(
+            self.dirty_rects_manager.get_statistics_message(),
+            ChatMessageColorType.SYSTEM
+        )
+
+    def send_text_cache_statistics_message(self):
+        self.chat_manager.push_message_to_chat(
+            self.text_cache_manager.get_statistics_message(),
+            ChatMessageColorType.SYSTEM
+        )
+
+    def switch_adaptive_render_scale(self):
+        self.render_scale_manager.switch_adaptive()
+        self.chat_manager.push_message_to_chat(
+            self.render_scale_manager.get_statistics_message(),
+            ChatMessageColorType.SYSTEM
+        )
+
+    def save_game(self):
+        self.save_manager.request_save()
+        self.chat_manager.push_message_to_chat(
+            self.save_manager.get_statistics_message(),
+            ChatMessageColorType.SYSTEM
+        )
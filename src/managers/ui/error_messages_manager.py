@@ -1,3 +1,5 @@
+import pygame
+
 from src.colors import LIGHT_RED
 from src.fonts import FONT_ARIAL_26
 
@@ -31,6 +33,13 @@ class ErrorMessagesManager:
             self.message_font = FONT_ARIAL_26
             self.messages = []
 
+            self.messages_rect = pygame.Rect(
+                0,
+                self.POSITION_Y,
+                self.game_surface.get_width(),
+                self.MESSAGES_BUFFER_SIZE * (self.message_font.get_height() + self.MESSAGES_OFFSET_Y)
+            )
+
     def setup_references(self):
         from src.game_clock import GameClock
 
@@ -41,6 +50,9 @@ class ErrorMessagesManager:
             self.messages.pop(self.MESSAGES_BUFFER_SIZE - 1)
         self.messages.insert(0, [message, self.game_clock.game_time])
 
+    def get_dirty_rects(self) -> list:
+        return [self.messages_rect] if self.messages else []
+
     def draw_error_messages(self):
         messages_to_remove = []
         for message_nr, message in enumerate(self.messages):
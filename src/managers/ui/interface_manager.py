@@ -1,7 +1,7 @@
 import pygame
 
 from src.colors import PURPLE, GREEN, BLUE, RED, GRAY_GREEN, BLACK, WHITE, GRAY
-from src.common_utils import quit_game, get_fps_rate
+from src.common_utils import quit_game, get_fps_rate, load_image
 from src.enums.character_attribute_type import CharacterAttributeType
 from src.fonts import FONT_ALICE_IN_WONDERLAND_16, FONT_MONOSPACE_COURIER_16, \
     FONT_ALICE_IN_WONDERLAND_18, FONT_ALICE_IN_WONDERLAND_36
@@ -14,11 +14,13 @@ from src.interface.interface_constants import LOWER_UI_BAR_HEIGHT, OPEN_MENU_BUT
 from src.interface.label import Label
 from src.interface.menu_window import MenuWindow
 from src.keybindings import KEY_SWITCH_SHOW_INTERFACE, KEY_SWITCH_SHOW_FPS_RATE, KEY_USE_MANA_POTION, KEY_USE_HP_POTION, \
+    KEY_SWITCH_SHOW_NPC_UPDATE_TIERS, KEY_SWITCH_SHOW_FRAME_PROFILER, \
     KEY_SWITCH_OPEN_INVENTORY, KEY_SWITCH_OPEN_EQUIPMENT, KEY_SWITCH_SHOW_LOOT_NAMES, \
     KEY_SWITCH_SHOW_HOSTILE_NPC_MINI_HP_BARS, \
     KEY_SWITCH_SHOW_FRIENDLY_NPC_MINI_HP_BARS, KEY_SWITCH_OPEN_CHAT, KEY_SWITCH_OPEN_CHAT_INPUT_BOX
 from src.paths import PATH_IMAGE_INVENTORY, PATH_IMAGE_EQUIPMENT, PATH_IMAGE_TOWN_PORTAL, PATH_IMAGE_SUN, \
     PATH_IMAGE_MOON
+from src.managers.ui.text_cache_manager import render_text
 from src.renderers.kill_series_renderer import KillSeriesRenderer
 
 
@@ -57,6 +59,7 @@ class InterfaceManager:
             self.equipment_manager = None
             self.chat_manager = None
             self.npcs_manager = None
+            self.frame_profiler_manager = None
             self.sound_manager = None
             self.potions_manager = None
             self.error_messages_manager = None
@@ -64,6 +67,7 @@ class InterfaceManager:
             self.vendor_manager = None
             self.conversation_manager = None
             self.kill_series_manager = None
+            self.save_manager = None
             self.choice_window = None
             self.kill_series_renderer = KillSeriesRenderer(game_surface)
 
@@ -73,7 +77,11 @@ class InterfaceManager:
             self._quit_to_desktop = False
 
             self._is_interface_visible = True
+            self.is_input_received = False
             self._is_fps_rate_visible = False
+            # what the bars and the datetime showed when the dirty rects were collected last time
+            self._lower_ui_bar_state = None
+            self._datetime_state = None
 
             self.fps_rate_y = self.game_surface.get_height() - (LOWER_UI_BAR_HEIGHT // 2)
 
@@ -174,10 +182,10 @@ class InterfaceManager:
 
             self.font = FONT_ALICE_IN_WONDERLAND_18
 
-            self.sun_icon = pygame.image.load(PATH_IMAGE_SUN).convert_alpha()
+            self.sun_icon = load_image(PATH_IMAGE_SUN).convert_alpha()
             self.sun_icon = pygame.transform.scale(self.sun_icon, (self.ICON_SIZE, self.ICON_SIZE))
 
-            self.moon_icon = pygame.image.load(PATH_IMAGE_MOON).convert_alpha()
+            self.moon_icon = load_image(PATH_IMAGE_MOON).convert_alpha()
             self.moon_icon = pygame.transform.scale(self.moon_icon, (self.ICON_SIZE, self.ICON_SIZE))
 
             self.icon_rect = pygame.Rect(
@@ -233,10 +241,13 @@ class InterfaceManager:
         from src.managers.gameplay.loot_manager import LootManager
         from src.managers.gameplay.map_manager import MapManager
         from src.managers.gameplay.npcs_manager import NpcsManager
+        from src.managers.core.frame_profiler_manager import FrameProfilerManager
         from src.managers.gameplay.player_manager import PlayerManager
         from src.managers.gameplay.potions_manager import PotionsManager
         from src.managers.core.sound_manager import SoundManager
         from src.managers.gameplay.vendor_manager import VendorManager
+        from src.managers.gameplay.kill_series_manager import KillSeriesManager
+        from src.managers.core.save_manager import SaveManager
         from src.game_clock import GameClock
         from src.interface.choice_window import ChoiceWindow
 
@@ -249,12 +260,15 @@ class InterfaceManager:
         self.equipment_manager = EquipmentManager.get_instance()
         self.chat_manager = ChatManager.get_instance()
         self.npcs_manager = NpcsManager.get_instance()
+        self.frame_profiler_manager = FrameProfilerManager.get_instance()
         self.sound_manager = SoundManager.get_instance()
         self.potions_manager = PotionsManager.get_instance()
         self.error_messages_manager = ErrorMessagesManager.get_instance()
         self.loot_manager = LootManager.get_instance()
         self.vendor_manager = VendorManager.get_instance()
         self.conversation_manager = ConversationManager.get_instance()
+        self.kill_series_manager = KillSeriesManager.get_instance()
+        self.save_manager = SaveManager.get_instance()
         self.kill_series_renderer.setup_references()
 
     def set_data(self):
@@ -263,7 +277,7 @@ class InterfaceManager:
         LOWER_UI_BAR_BUTTONS_OFFSET = 25
         lower_ui_bar_middle_y = self.game_surface.get_height() - (LOWER_UI_BAR_HEIGHT // 2)
 
-        inventory_open_button_image = pygame.image.load(PATH_IMAGE_INVENTORY).convert_alpha()
+        inventory_open_button_image = load_image(PATH_IMAGE_INVENTORY).convert_alpha()
         inventory_open_button_image = pygame.transform.scale(
             inventory_open_button_image,
             (OPEN_BUTTON_SIZE, OPEN_BUTTON_SIZE)
@@ -278,7 +292,7 @@ class InterfaceManager:
         )
         self.buttons.append(backpack_button)
 
-        equipment_open_button_image = pygame.image.load(PATH_IMAGE_EQUIPMENT).convert_alpha()
+        equipment_open_button_image = load_image(PATH_IMAGE_EQUIPMENT).convert_alpha()
         equipment_open_button_image = pygame.transform.scale(
             equipment_open_button_image,
             (OPEN_BUTTON_SIZE, OPEN_BUTTON_SIZE)
@@ -296,7 +310,7 @@ class InterfaceManager:
         )
         self.buttons.append(equipment_button)
 
-        town_portal_open_button_image = pygame.image.load(PATH_IMAGE_TOWN_PORTAL).convert_alpha()
+        town_portal_open_button_image = load_image(PATH_IMAGE_TOWN_PORTAL).convert_alpha()
         town_portal_open_button_image = pygame.transform.scale(
             town_portal_open_button_image,
             (OPEN_BUTTON_SIZE, OPEN_BUTTON_SIZE)
@@ -324,12 +338,16 @@ class InterfaceManager:
     def switch_show_interface(self) -> None:
         self._is_interface_visible = not self._is_interface_visible
 
+    @property
+    def is_interface_visible(self) -> bool:
+        return self._is_interface_visible
+
     def switch_show_fps_rate(self):
         self._is_fps_rate_visible = not self._is_fps_rate_visible
 
     def save_game(self) -> None:
-        # TODO add autosave
-        pass
+        # changes are also saved on an interval and on map change, this saves them right away
+        self.save_manager.request_save()
 
     def open_choice_window(self, message, callback):
         if not self.choice_window.is_open:
@@ -337,7 +355,9 @@ class InterfaceManager:
 
     def handle_events(self) -> [bool, bool]:
         handled_keyboard, handled_mouse, hovered = False, False, False
-        for event in pygame.event.get():
+        events = pygame.event.get()
+        self.is_input_received = len(events) > 0
+        for event in events:
             if event.type == pygame.QUIT:
                 quit_game()
             if event.type == pygame.MOUSEBUTTONDOWN:
@@ -399,6 +419,14 @@ class InterfaceManager:
             self.switch_show_fps_rate()
             return True
 
+        if keys[KEY_SWITCH_SHOW_NPC_UPDATE_TIERS]:
+            self.npcs_manager.switch_show_update_tiers()
+            return True
+
+        if keys[KEY_SWITCH_SHOW_FRAME_PROFILER]:
+            self.frame_profiler_manager.switch_show_overlay()
+            return True
+
         if not self._is_interface_visible:
             if keys[pygame.K_ESCAPE]:
                 self.switch_show_interface()
@@ -469,6 +497,7 @@ class InterfaceManager:
     def delete_character(self):
         from src.database_service import DatabaseService
 
+        self.save_manager.discard()
         DatabaseService.delete_character(self.player_manager.character_id)
         self.quit_game()
 
@@ -601,7 +630,7 @@ class InterfaceManager:
 
     def draw_fps_rate(self, delta_time) -> None:
         if self._is_fps_rate_visible:
-            fps_rate_text = FONT_MONOSPACE_COURIER_16.render(f'FPS: {get_fps_rate(delta_time)}', True, WHITE)
+            fps_rate_text = render_text(FONT_MONOSPACE_COURIER_16, f'FPS: {get_fps_rate(delta_time)}', True, WHITE)
             self.game_surface.blit(
                 fps_rate_text,
                 (
@@ -631,7 +660,7 @@ class InterfaceManager:
         self.game_surface.blit(icon, (self.ICON_X, self.ICON_Y))
 
         self.datetime_label.draw()
-        self.datetime_text = self.font.render(self.datetime_manager.formatted_datetime, False, BLACK)
+        self.datetime_text = render_text(self.font, self.datetime_manager.formatted_datetime, False, BLACK)
         self.game_surface.blit(
             self.datetime_text,
             (self.datetime_x + self.DATETIME_TEXT_PADDING_X, self.datetime_y)
@@ -655,6 +684,50 @@ class InterfaceManager:
             self.player_manager.get_attribute(CharacterAttributeType.MAX_STAMINA)
         )
 
+    def get_lower_ui_bar_state(self) -> tuple:
+        return (
+            self.player_manager.lvl,
+            self.player_manager.xp,
+            self.player_manager.required_xp,
+            self.player_manager.get_attribute(CharacterAttributeType.HP),
+            self.player_manager.get_attribute(CharacterAttributeType.MAX_HP),
+            self.player_manager.get_attribute(CharacterAttributeType.MANA),
+            self.player_manager.get_attribute(CharacterAttributeType.MAX_MANA),
+            self.player_manager.get_attribute(CharacterAttributeType.STAMINA),
+            self.player_manager.get_attribute(CharacterAttributeType.MAX_STAMINA)
+        )
+
+    def get_dirty_rects(self) -> list:
+        # parts of the interface that can change without any input
+        if not self._is_interface_visible:
+            return []
+        dirty_rects = []
+        # bars and the datetime are redrawn only when what they show changes, fps rate changes every frame
+        lower_ui_bar_state = self.get_lower_ui_bar_state()
+        if self._is_fps_rate_visible or lower_ui_bar_state != self._lower_ui_bar_state:
+            dirty_rects.append(self.xp_bar.rect.union(self.lower_ui_bar_rect))
+        self._lower_ui_bar_state = lower_ui_bar_state
+        datetime_state = (self.datetime_manager.is_day_now, self.datetime_manager.formatted_datetime)
+        if datetime_state != self._datetime_state:
+            dirty_rects.append(self.icon_rect.union(self.datetime_label.rect))
+        self._datetime_state = datetime_state
+        dirty_rects.extend(self.kill_series_manager.get_dirty_rects())
+        dirty_rects.extend(self.error_messages_manager.get_dirty_rects())
+        for window in (
+                self.inventory_manager,
+                self.equipment_manager,
+                self.chat_manager,
+                self.menu_window,
+                self.menu_window.controls_window,
+                self.menu_window.whatsnew_window,
+                self.choice_window,
+                self.vendor_manager,
+                self.conversation_manager
+        ):
+            if window.is_open:
+                dirty_rects.append(window.rect)
+        return dirty_rects
+
     def draw_interface(self) -> None:
         if self._is_interface_visible:
             if self.player_manager.is_dead:
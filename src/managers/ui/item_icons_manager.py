@@ -2,6 +2,7 @@ import os
 
 import pygame
 
+from src.common_utils import load_image
 from src.interface.interface_constants import INTERFACE_TILE_SIZE
 from src.paths import PATH_IMAGE_EMPTY_ITEM_SLOT, DIR_ASSETS_ITEM_ICONS
 
@@ -22,7 +23,7 @@ class ItemIconsManager:
         if not hasattr(self, 'initialized'):
             self.initialized = True
 
-            self.empty_item_slot_icon = pygame.image.load(PATH_IMAGE_EMPTY_ITEM_SLOT).convert_alpha()
+            self.empty_item_slot_icon = load_image(PATH_IMAGE_EMPTY_ITEM_SLOT).convert_alpha()
             self.empty_item_slot_icon = pygame.transform.scale(
                 self.empty_item_slot_icon,
                 (
@@ -41,7 +42,7 @@ class ItemIconsManager:
             icon_names = os.listdir(os.path.join(DIR_ASSETS_ITEM_ICONS, directory_name))
             for icon_name in icon_names:
                 icon_path = os.path.join(DIR_ASSETS_ITEM_ICONS, directory_name, icon_name)
-                item_icon = pygame.image.load(icon_path).convert_alpha()
+                item_icon = load_image(icon_path).convert_alpha()
                 item_icon = pygame.transform.scale(item_icon, (INTERFACE_TILE_SIZE, INTERFACE_TILE_SIZE))
                 item_icons[os.path.join(directory_name, icon_name)] = item_icon
         return item_icons
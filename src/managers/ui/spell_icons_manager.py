@@ -2,6 +2,7 @@ import os
 
 import pygame
 
+from src.common_utils import load_image
 from src.interface.interface_constants import INTERFACE_TILE_SIZE
 from src.paths import PATH_IMAGE_EMPTY_SPELL_SLOT, DIR_ASSETS_SPELL_ICONS
 
@@ -22,7 +23,7 @@ class SpellIconsManager:
         if not hasattr(self, 'initialized'):
             self.initialized = True
 
-            self.empty_spell_slot_icon = pygame.image.load(PATH_IMAGE_EMPTY_SPELL_SLOT).convert_alpha()
+            self.empty_spell_slot_icon = load_image(PATH_IMAGE_EMPTY_SPELL_SLOT).convert_alpha()
             self.empty_spell_slot_icon = pygame.transform.scale(
                 self.empty_spell_slot_icon,
                 (
@@ -41,7 +42,7 @@ class SpellIconsManager:
             icon_names = os.listdir(os.path.join(DIR_ASSETS_SPELL_ICONS, directory_name))
             for icon_name in icon_names:
                 icon_path = os.path.join(DIR_ASSETS_SPELL_ICONS, directory_name, icon_name)
-                spell_icon = pygame.image.load(icon_path).convert_alpha()
+                spell_icon = load_image(icon_path).convert_alpha()
                 spell_icon = pygame.transform.scale(spell_icon, (INTERFACE_TILE_SIZE, INTERFACE_TILE_SIZE))
                 spell_icons[os.path.join(directory_name, icon_name)] = spell_icon
         return spell_icons
@@ -0,0 +1,69 @@
+from collections import OrderedDict
+
+import pygame
+
+
+class TextCacheManager:
+    _instance = None
+
+    MAX_CACHED_BYTES = 16 * 1024 * 1024
+
+    @classmethod
+    def get_instance(cls):
+        return cls._instance
+
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self, max_cached_bytes=MAX_CACHED_BYTES):
+        if not hasattr(self, 'initialized'):
+            self.initialized = True
+
+            self.max_cached_bytes = max_cached_bytes
+            # least recently used texts first
+            self.rendered_texts = OrderedDict()
+            self.cached_bytes = 0
+
+            self.hits_count = 0
+            self.misses_count = 0
+            self.evictions_count = 0
+
+    @staticmethod
+    def get_surface_bytes(surface) -> int:
+        return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+    def render(self, font, text, antialias, color, background=None) -> pygame.Surface:
+        key = (font, text, antialias, tuple(color), None if background is None else tuple(background))
+        rendered_text = self.rendered_texts.get(key)
+        if rendered_text is not None:
+            self.rendered_texts.move_to_end(key)
+            self.hits_count += 1
+            return rendered_text
+
+        self.misses_count += 1
+        rendered_text = font.render(text, antialias, color, background)
+        self.rendered_texts[key] = rendered_text
+        self.cached_bytes += self.get_surface_bytes(rendered_text)
+        while self.cached_bytes > self.max_cached_bytes and len(self.rendered_texts) > 1:
+            _, evicted_text = self.rendered_texts.popitem(last=False)
+            self.cached_bytes -= self.get_surface_bytes(evicted_text)
+            self.evictions_count += 1
+        return rendered_text
+
+    def clear(self) -> None:
+        self.rendered_texts.clear()
+        self.cached_bytes = 0
+
+    def get_statistics_message(self) -> str:
+        requests_count = self.hits_count + self.misses_count
+        hit_rate_percent = (100 * self.hits_count / requests_count) if requests_count else 0
+        return (f'Text cache: hits: {self.hits_count}, misses: {self.misses_count} ({hit_rate_percent:.0f}% hit rate), '
+                f'evictions: {self.evictions_count}, texts: {len(self.rendered_texts)}, '
+                f'size: {self.cached_bytes / 1024:.0f}/{self.max_cached_bytes / 1024:.0f} KiB')
+
+
+def render_text(font, text, antialias, color, background=None) -> pygame.Surface:
+    # rendered surfaces are shared, callers must not draw on them or change their alpha
+    return TextCacheManager.get_instance().render(font, text, antialias, color, background)
@@ -0,0 +1,34 @@
+import pygame
+
+
+class Loot:
+
+    def __init__(self, loot_nr, name, position, icon, label, hovered_label, label_offset,
+                 glow=None, item_info=None, quantity=1):
+        # loot_nr keeps the drawing order of overlapping loot stable
+        self.loot_nr = loot_nr
+        self.name = name
+        self.position = position
+        self.x, self.y = position
+        self.item_info = item_info
+        self.quantity = quantity
+
+        self.icon = icon
+        # shared by every loot of the same rarity, gold has none
+        self.glow = glow
+        # pre-rendered and shared by every loot with the same name and rarity
+        self.label = label
+        self.hovered_label = hovered_label
+
+        # map positions of the top left corners
+        icon_width, icon_height = icon.get_size()
+        self.icon_position = (self.x - (icon_width // 2), self.y - (icon_height // 2))
+        label_offset_x, label_offset_y = label_offset
+        self.label_position = (self.x + label_offset_x, self.y + label_offset_y)
+
+        # map space rects used for hit testing
+        self.rect = pygame.Rect(self.icon_position, icon.get_size())
+        self.label_rect = pygame.Rect(self.label_position, label.get_size())
+
+    def get_hit_rect(self, is_label_shown) -> pygame.Rect:
+        return self.label_rect if is_label_shown else self.rect
@@ -0,0 +1,71 @@
+import heapq
+from array import array
+from collections import deque
+
+NO_FIELD = -1
+
+
+def find_nearest_free_field(grid, row: int, column: int):
+    if not grid.is_inside(row, column):
+        row = min(max(row, 0), grid.rows - 1)
+        column = min(max(column, 0), grid.columns - 1)
+
+    start_index = grid.to_index(row, column)
+    visited = bytearray(grid.size)
+    visited[start_index] = 1
+    queue = deque([start_index])
+    while queue:
+        index = queue.popleft()
+        if grid.fields[index] == grid.FREE:
+            return grid.to_field(index)
+        for neighbor_index in grid.get_neighbor_indexes(index):
+            if not visited[neighbor_index]:
+                visited[neighbor_index] = 1
+                queue.append(neighbor_index)
+    return None
+
+
+def a_star(grid, start_row: int, start_column: int, destination_row: int, destination_column: int):
+    if grid.size == 0 or not grid.is_inside(start_row, start_column):
+        return None
+
+    destination_field = find_nearest_free_field(grid, destination_row, destination_column)
+    if destination_field is None:
+        return None
+
+    columns = grid.columns
+    free_neighbor_indexes = grid.free_neighbor_indexes
+    destination_row, destination_column = destination_field
+    start_index = grid.to_index(start_row, start_column)
+    destination_index = grid.to_index(destination_row, destination_column)
+
+    came_from = array('i', [NO_FIELD]) * grid.size
+    g_costs = array('i', [-1]) * grid.size
+    g_costs[start_index] = 0
+
+    open_set = [(0, 0, start_index)]
+    while open_set:
+        _, g_cost, index = heapq.heappop(open_set)
+        if index == destination_index:
+            path = []
+            while index != NO_FIELD:
+                path.append(divmod(index, columns))
+                index = came_from[index]
+            path.reverse()
+            return path
+
+        if g_cost > g_costs[index]:
+            continue
+
+        tentative_g_cost = g_cost + 1
+        for neighbor_index in free_neighbor_indexes[index]:
+            neighbor_g_cost = g_costs[neighbor_index]
+            if neighbor_g_cost == -1 or tentative_g_cost < neighbor_g_cost:
+                g_costs[neighbor_index] = tentative_g_cost
+                came_from[neighbor_index] = index
+                neighbor_row, neighbor_column = divmod(neighbor_index, columns)
+                f_cost = (tentative_g_cost
+                          + abs(neighbor_row - destination_row)
+                          + abs(neighbor_column - destination_column))
+                heapq.heappush(open_set, (f_cost, tentative_g_cost, neighbor_index))
+    return None
@@ -0,0 +1,50 @@
+class CollisionGrid:
+    BLOCKED = 1
+    FREE = 0
+
+    def __init__(self, collisions_grid):
+        self.rows = len(collisions_grid)
+        self.columns = len(collisions_grid[0]) if self.rows > 0 else 0
+        self.size = self.rows * self.columns
+
+        # one byte per field, row-major order
+        self.fields = bytearray(self.size)
+        for row_nr, row in enumerate(collisions_grid):
+            offset = row_nr * self.columns
+            for column_nr, is_collision in enumerate(row):
+                if is_collision:
+                    self.fields[offset + column_nr] = self.BLOCKED
+
+        # precomputed so that searches do not check bounds and collisions per step
+        self.free_neighbor_indexes = [
+            tuple(
+                neighbor_index for neighbor_index in self.get_neighbor_indexes(index)
+                if self.fields[neighbor_index] == self.FREE
+            )
+            for index in range(self.size)
+        ]
+
+    def is_inside(self, row: int, column: int) -> bool:
+        return 0 <= row < self.rows and 0 <= column < self.columns
+
+    def is_blocked(self, row: int, column: int) -> bool:
+        if not self.is_inside(row, column):
+            return True
+        return self.fields[row * self.columns + column] == self.BLOCKED
+
+    def to_index(self, row: int, column: int) -> int:
+        return row * self.columns + column
+
+    def to_field(self, index: int) -> (int, int):
+        return divmod(index, self.columns)
+
+    def get_neighbor_indexes(self, index: int):
+        row, column = divmod(index, self.columns)
+        if row > 0:
+            yield index - self.columns
+        if row < self.rows - 1:
+            yield index + self.columns
+        if column > 0:
+            yield index - 1
+        if column < self.columns - 1:
+            yield index + 1
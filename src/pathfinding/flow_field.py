@@ -0,0 +1,67 @@
+from array import array
+from collections import deque
+
+NO_FIELD = -1
+
+
+class FlowField:
+
+    def __init__(self, grid):
+        self.grid = grid
+        self.goal = None
+        # for every field: index of the next field on the shortest way to the goal
+        self.next_indexes = array('i', [NO_FIELD]) * grid.size
+        self.distances = array('i', [-1]) * grid.size
+
+    def compute(self, goal_row: int, goal_column: int) -> None:
+        grid = self.grid
+        self.goal = (goal_row, goal_column)
+        self.next_indexes = array('i', [NO_FIELD]) * grid.size
+        self.distances = array('i', [-1]) * grid.size
+        if not grid.is_inside(goal_row, goal_column):
+            return
+
+        free_neighbor_indexes = grid.free_neighbor_indexes
+        next_indexes = self.next_indexes
+        distances = self.distances
+
+        goal_index = grid.to_index(goal_row, goal_column)
+        distances[goal_index] = 0
+        queue = deque([goal_index])
+        while queue:
+            index = queue.popleft()
+            distance = distances[index] + 1
+            for neighbor_index in free_neighbor_indexes[index]:
+                if distances[neighbor_index] == -1:
+                    distances[neighbor_index] = distance
+                    next_indexes[neighbor_index] = index
+                    queue.append(neighbor_index)
+
+    def is_reachable(self, row: int, column: int) -> bool:
+        return self.grid.is_inside(row, column) and self.distances[self.grid.to_index(row, column)] != -1
+
+    def get_distance(self, row: int, column: int) -> int | None:
+        if not self.is_reachable(row, column):
+            return None
+        return self.distances[self.grid.to_index(row, column)]
+
+    def get_next_field(self, row: int, column: int):
+        if not self.is_reachable(row, column):
+            return None
+        next_index = self.next_indexes[self.grid.to_index(row, column)]
+        if next_index == NO_FIELD:
+            return None
+        return self.grid.to_field(next_index)
+
+    def get_path(self, row: int, column: int, length: int):
+        if not self.is_reachable(row, column):
+            return None
+
+        path = [(row, column)]
+        index = self.grid.to_index(row, column)
+        while len(path) < length:
+            index = self.next_indexes[index]
+            if index == NO_FIELD:
+                break
+            path.append(self.grid.to_field(index))
+        return path
@@ -9,6 +9,8 @@ DIR_DATABASE: str = os.path.join(PROJECT_ROOT, 'database')
 
 USERS_DATABASE_PATH: str = os.path.join(DIR_DATABASE, ACCOUNTS_DATABASE_NAME)
 GAME_DATABASE_PATH: str = os.path.join(DIR_DATABASE, GAME_DATABASE_NAME)
+DIR_DATABASE_JOURNALS: str = os.path.join(DIR_DATABASE, 'journals')
+PATH_WORLD_SNAPSHOT: str = os.path.join(DIR_DATABASE, 'world_snapshot.bin')
 
 DIR_DATA: str = 'data'
 DIR_DATABASE_DATA: str = os.path.join(DIR_DATABASE, DIR_DATA)
@@ -0,0 +1,109 @@
+import math
+from collections import OrderedDict
+
+import pygame
+
+
+class MapChunksRenderer:
+    # chunk size in source image pixels
+    CHUNK_SIZE = 128
+    # extra rings of chunks kept around the viewport, so small camera moves do not rescale anything
+    CACHE_MARGIN = 1
+
+    def __init__(self, source_image, scale, viewport_size, render_scale=1.0):
+        self._source_image = source_image
+        self.scale = scale
+        # world can be drawn to a smaller surface, chunks are scaled straight to its resolution
+        self.render_scale = render_scale
+
+        self.chunk_draw_size = self.CHUNK_SIZE * scale * render_scale
+        self.width = source_image.get_width() * scale
+        self.height = source_image.get_height() * scale
+        self.columns = math.ceil(source_image.get_width() / self.CHUNK_SIZE)
+        self.rows = math.ceil(source_image.get_height() / self.CHUNK_SIZE)
+
+        viewport_width, viewport_height = viewport_size
+        # viewport is given in native pixels, the visible chunks count does not depend on the render scale
+        visible_columns = math.ceil(viewport_width / (self.CHUNK_SIZE * scale)) + 1
+        visible_rows = math.ceil(viewport_height / (self.CHUNK_SIZE * scale)) + 1
+        self.capacity = (visible_columns + 2 * self.CACHE_MARGIN) * (visible_rows + 2 * self.CACHE_MARGIN)
+
+        self._chunks = OrderedDict()
+
+    @property
+    def size(self) -> [int, int]:
+        return self.width, self.height
+
+    @property
+    def cached_chunks_count(self) -> int:
+        return len(self._chunks)
+
+    def clear(self) -> None:
+        self._chunks.clear()
+
+    def set_render_scale(self, render_scale) -> None:
+        self.render_scale = render_scale
+        self.chunk_draw_size = self.CHUNK_SIZE * self.scale * render_scale
+        self.clear()
+
+    def get_draw_edge(self, source_edge) -> int:
+        # chunk edges are rounded the same way on both sides, so fractional scales leave no seams
+        return int(source_edge * self.scale * self.render_scale)
+
+    def get_chunk(self, column: int, row: int):
+        key = (column, row)
+        chunk = self._chunks.get(key)
+        if chunk is not None:
+            self._chunks.move_to_end(key)
+            return chunk
+
+        source_x = column * self.CHUNK_SIZE
+        source_y = row * self.CHUNK_SIZE
+        source_width = min(self.CHUNK_SIZE, self._source_image.get_width() - source_x)
+        source_height = min(self.CHUNK_SIZE, self._source_image.get_height() - source_y)
+        chunk = pygame.transform.scale(
+            self._source_image.subsurface((source_x, source_y, source_width, source_height)),
+            (
+                self.get_draw_edge(source_x + source_width) - self.get_draw_edge(source_x),
+                self.get_draw_edge(source_y + source_height) - self.get_draw_edge(source_y)
+            )
+        )
+
+        self._chunks[key] = chunk
+        if len(self._chunks) > self.capacity:
+            self._chunks.popitem(last=False)
+        return chunk
+
+    def get_source_fragment(self, x: int, y: int, width: int, height: int):
+        # rect is given in scaled map coordinates, fragment is cut from the unscaled source image
+        source_rect = pygame.Rect(
+            x // self.scale,
+            y // self.scale,
+            max(1, width // self.scale),
+            max(1, height // self.scale)
+        ).clip(self._source_image.get_rect())
+        if source_rect.width == 0 or source_rect.height == 0:
+            return None
+        return self._source_image.subsurface(source_rect)
+
+    def draw(self, surface, map_x: int, map_y: int) -> None:
+        # map_x, map_y - map position of the surface top left corner
+        surface_width, surface_height = surface.get_size()
+        first_column = max(0, int(map_x // self.chunk_draw_size))
+        last_column = min(self.columns - 1, int((map_x + surface_width) // self.chunk_draw_size))
+        first_row = max(0, int(map_y // self.chunk_draw_size))
+        last_row = min(self.rows - 1, int((map_y + surface_height) // self.chunk_draw_size))
+
+        blit_sequence = []
+        for row in range(first_row, last_row + 1):
+            for column in range(first_column, last_column + 1):
+                blit_sequence.append(
+                    (
+                        self.get_chunk(column, row),
+                        (
+                            self.get_draw_edge(column * self.CHUNK_SIZE) - map_x,
+                            self.get_draw_edge(row * self.CHUNK_SIZE) - map_y
+                        )
+                    )
+                )
+        surface.blits(blit_sequence, doreturn=False)
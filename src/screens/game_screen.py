@@ -1,33 +1,46 @@
 from typing import override
 
-import pygame
+import time
 
 from project_info import _PROJECT_NAME, _VERSION
-from src.colors import BLACK
 from src.common_utils import quit_game
-from src.entities.character import CHARACTER_DRAW_SIZE, Character
+from src.entities.character import Character
 from src.entities.entity import Entity
 from src.entities.entity_marker import EntityMarker
 from src.entities.npcs.npc import Npc
 from src.entities.npcs.npc_roles.vendor import Vendor
 from src.enums.chat_message_color_type import ChatMessageColorType
 from src.enums.cursor_type import CursorType
+from src.enums.frame_phase_type import FramePhaseType
+from src.enums.frame_section_type import FrameSectionType
 from src.enums.screen_type import ScreenType
+from src.game_catalog import GameCatalog
 from src.interface.choice_window import ChoiceWindow
 from src.interface.item_tile import ItemTile
 from src.interface.menu_window import MenuWindow
+from src.managers.core.dirty_rects_manager import DirtyRectsManager
+from src.managers.core.frame_profiler_manager import FrameProfilerManager
+from src.managers.core.journal_manager import JournalManager
+from src.managers.core.render_scale_manager import RenderScaleManager
+from src.managers.core.save_manager import SaveManager
 from src.managers.core.sound_manager import SoundManager
+from src.managers.core.sprite_atlas_manager import SpriteAtlasManager
+from src.managers.gameplay.ai_scheduler_manager import AiSchedulerManager
 from src.managers.gameplay.conversation_manager import ConversationManager
 from src.managers.gameplay.datetime_manager import DatetimeManager
 from src.managers.gameplay.equipment_manager import EquipmentManager
 from src.managers.gameplay.interactive_objects_manager import InteractiveObjectsManager
 from src.managers.gameplay.inventory_manager import InventoryManager
 from src.managers.gameplay.kill_series_manager import KillSeriesManager
+from src.managers.gameplay.lighting_manager import LightingManager
 from src.managers.gameplay.loot_manager import LootManager
+from src.managers.gameplay.viewport_manager import ViewportManager
 from src.managers.gameplay.map_manager import MapManager
 from src.managers.gameplay.npcs_manager import NpcsManager
+from src.managers.gameplay.pathfinding_manager import PathfindingManager
 from src.managers.gameplay.player_manager import PlayerManager
 from src.managers.gameplay.potions_manager import PotionsManager
+from src.managers.gameplay.spatial_index_manager import SpatialIndexManager
 from src.managers.gameplay.quotes_manager import QuotesManager, Quote
 from src.managers.gameplay.vendor_manager import VendorManager
 from src.managers.ui.chat_manager import ChatManager
@@ -37,9 +50,7 @@ from src.managers.ui.interface_manager import InterfaceManager
 from src.managers.ui.item_icons_manager import ItemIconsManager
 from src.screens.screen import Screen
 from src.spells.spell import Spell
-from src.sprites.character_sprite import CharacterSprite
 from src.sprites.entity_sprite import EntitySprite
-from src.sprites.object_sprite import ObjectSprite
 
 
 class GameScreen(Screen):
@@ -48,12 +59,73 @@ class GameScreen(Screen):
     def __init__(self):
         super().__init__()
 
+        self.interface_manager = None
+        self.player_manager = None
+        self.map_manager = None
+        self.viewport_manager = None
+        self.lighting_manager = None
+        self.pathfinding_manager = None
+        self.loot_manager = None
+        self.datetime_manager = None
+        self.vendor_manager = None
+        self.npcs_manager = None
+        self.inventory_manager = None
+        self.quotes_manager = None
+        self.interactive_objects_manager = None
+        self.frame_profiler_manager = None
+        self.dirty_rects_manager = None
+        self.render_scale_manager = None
+        self.save_manager = None
+
+        self.cursor_type = CursorType.POINT
+        self.is_keyboard_handled = False
+        self.is_mouse_handled = False
+        self.is_interface_hovered = False
+
+        # input and rendering run once per frame, simulation phases in fixed steps between them
+        self.input_phases = (
+            (FramePhaseType.INPUT, self.handle_input),
+        )
+        self.simulation_phases = (
+            (FramePhaseType.PLAYER, self.update_player),
+            (FramePhaseType.PATHFINDING, self.update_pathfinding),
+            (FramePhaseType.AI, self.update_npcs),
+            (FramePhaseType.WORLD, self.update_world)
+        )
+        self.render_phases = (
+            (FramePhaseType.DRAW_MAP, self.draw_map),
+            (FramePhaseType.DRAW_ENTITIES, self.draw_entities),
+            (FramePhaseType.DRAW_UI, self.draw_ui),
+            (FramePhaseType.PRESENT, self.present)
+        )
+
     @override
     def enter(self):
+        self.setup()
+
+        while not self.interface_manager.is_game_over:
+            delta_time = self.game_clock.tick()
+            self.run_frame(delta_time)
+
+        self.frame_profiler_manager.stop_recording()
+        self.save_manager.stop()
+
+        if self.interface_manager.is_quit_to_desktop:
+            quit_game()
+
+        self.screen_manager.next_screen = ScreenType.LOGIN
+
+    def setup(self):
         account_name = self.accounts_manager.get_account_name()
         account_id = self.accounts_manager.get_account_id()
 
+        game_catalog = GameCatalog()
+        game_catalog.load()
+        # read before the character is loaded, its records are replayed over the database state
+        JournalManager(account_id)
+
         item_icons_manager = ItemIconsManager()
+        sprite_atlas_manager = SpriteAtlasManager()
         item_icons_manager.load_item_icons()
         ItemTile.setup_references()
         command_manager = CommandManager()
@@ -66,15 +138,24 @@ class GameScreen(Screen):
         inventory_manager = InventoryManager(self.game_surface, account_id)
         player_manager = PlayerManager(self.game_surface, account_id, account_name)
         map_manager = MapManager(self.game_surface)
+        viewport_manager = ViewportManager(self.game_surface)
+        lighting_manager = LightingManager(self.game_surface)
+        pathfinding_manager = PathfindingManager()
+        spatial_index_manager = SpatialIndexManager()
         loot_manager = LootManager(self.game_surface)
         datetime_manager = DatetimeManager()
         vendor_manager = VendorManager(self.game_surface)
         conversation_manager = ConversationManager(self.game_surface)
         npcs_manager = NpcsManager(self.game_surface)
+        ai_scheduler_manager = AiSchedulerManager(self.game_surface)
         potions_manager = PotionsManager(self.game_surface)
         interface_manager = InterfaceManager(self.game_surface, account_name)
         interactive_objects_manager = InteractiveObjectsManager(self.game_surface)
         choice_window = ChoiceWindow(self.game_surface)
+        frame_profiler_manager = FrameProfilerManager(self.game_surface)
+        dirty_rects_manager = DirtyRectsManager(self.game_surface, self.screen_surface)
+        render_scale_manager = RenderScaleManager(self.game_surface, self.screen_surface)
+        save_manager = SaveManager(account_id)
 
         MenuWindow.setup_references()
         EntitySprite.setup_references()
@@ -86,12 +167,16 @@ class GameScreen(Screen):
         player_manager.setup_references()
         potions_manager.setup_references()
         map_manager.setup_references()
+        viewport_manager.setup_references()
+        lighting_manager.setup_references()
+        pathfinding_manager.setup_references()
         equipment_manager.setup_references()
         inventory_manager.setup_references()
         vendor_manager.setup_references()
         chat_manager.setup_references()
         kill_series_manager.setup_references()
         npcs_manager.setup_references()
+        ai_scheduler_manager.setup_references()
         interface_manager.setup_references()
         interactive_objects_manager.setup_references()
         EntityMarker.setup_references()
@@ -101,6 +186,9 @@ class GameScreen(Screen):
         Quote.setup_references()
         ItemTile.setup_references()
         command_manager.setup_references()
+        dirty_rects_manager.setup_references()
+        render_scale_manager.setup_references()
+        save_manager.setup_references()
 
         map_manager.load_map(player_manager.map_id)
         datetime_manager.switch_day_night_soundtrack()
@@ -109,67 +197,147 @@ class GameScreen(Screen):
         EntityMarker.load_entity_markers()
         Npc.initialize_mini_hp_bars(self.game_surface)
         npcs_manager.update()
-        CharacterSprite.load_sprites(CHARACTER_DRAW_SIZE)
-        ObjectSprite.load_sprites(CHARACTER_DRAW_SIZE)
         command_manager.set_commands()
         interface_manager.set_data()
         interactive_objects_manager.update()
         player_manager.load_spells()
         interface_manager.set_level_text()
+        # mouse is matched against the camera before the first frame is drawn
+        viewport_manager.update()
+        if not self.game_context.is_headless:
+            save_manager.start()
 
         chat_manager.push_message_to_chat(self.WELCOME_MESSAGE, ChatMessageColorType.SYSTEM)
         chat_manager.switch_open()
 
-        while not interface_manager.is_game_over:
-            delta_time = self.game_clock.tick()
+        self.interface_manager = interface_manager
+        self.player_manager = player_manager
+        self.map_manager = map_manager
+        self.viewport_manager = viewport_manager
+        self.lighting_manager = lighting_manager
+        self.pathfinding_manager = pathfinding_manager
+        self.loot_manager = loot_manager
+        self.datetime_manager = datetime_manager
+        self.vendor_manager = vendor_manager
+        self.npcs_manager = npcs_manager
+        self.inventory_manager = inventory_manager
+        self.quotes_manager = quotes_manager
+        self.interactive_objects_manager = interactive_objects_manager
+        self.frame_profiler_manager = frame_profiler_manager
+        self.dirty_rects_manager = dirty_rects_manager
+        self.render_scale_manager = render_scale_manager
+        self.save_manager = save_manager
 
-            cursor_type = CursorType.POINT
+    def get_frame_phases(self, delta_time):
+        # yields (phase type, phase, phase delta time), the steps count is known only after the input is handled
+        frame_start_time = time.perf_counter()
+        for frame_phase_type, frame_phase in self.input_phases:
+            yield frame_phase_type, frame_phase, delta_time
+        for _ in range(self.game_clock.get_simulation_steps_count()):
+            self.game_clock.begin_simulation_step()
+            for frame_phase_type, frame_phase in self.simulation_phases:
+                yield frame_phase_type, frame_phase, self.game_clock.simulation_delta_time
+        for frame_phase_type, frame_phase in self.render_phases:
+            yield frame_phase_type, frame_phase, delta_time
+        # time spent waiting for the next tick does not count
+        self.render_scale_manager.adapt_render_scale(time.perf_counter() - frame_start_time)
 
-            is_keyboard_handled, is_mouse_handled, is_interface_hovered = interface_manager.handle_events()
+    def run_frame(self, delta_time) -> None:
+        self.frame_profiler_manager.begin_frame()
+        for frame_phase_type, frame_phase, phase_delta_time in self.get_frame_phases(delta_time):
+            phase_start_time = time.perf_counter()
+            frame_phase(phase_delta_time)
+            self.frame_profiler_manager.add_phase_timing(frame_phase_type, time.perf_counter() - phase_start_time)
+        self.frame_profiler_manager.end_frame(delta_time)
 
-            if not self.game_clock.is_game_paused:
-                if not player_manager.is_dead:
-
-                    player_manager.handle_spell_cast_finish()
-                    player_manager.handle_kill_series_end()
-                    player_manager.handle_regeneration()
-                    player_manager.handle_move(delta_time)
-
-                    if not is_mouse_handled:
-                        player_manager.handle_mouse_events()
-
-                    if vendor_manager.is_open and (inventory_manager.is_hovered or vendor_manager.is_hovered):
-                        cursor_type = CursorType.SELL
-                    if not interface_manager.is_hovered:
-                        cursor_type = npcs_manager.get_hovered_npc_info()
-
-                npcs_manager.handle_events()
-                npcs_manager.perform_actions(delta_time)
-                vendor_manager.handle_auto_close()
-                player_manager.handle_death()
-
-                datetime_manager.increment_time(delta_time)
-
-            self.game_surface.fill(BLACK)
-            map_manager.draw_map()
-            interactive_objects_manager.draw_interactive_objects()
-            loot_manager.draw_loot()
-            npcs_manager.draw_npcs()
-            player_manager.draw_player()
-            map_manager.draw_night_overlay()
-            if not self.game_clock.is_game_paused:
-                npcs_manager.draw_hovered_npc_info()
-            quotes_manager.draw_quotes()
-            interface_manager.draw_interface()
-            interface_manager.draw_fps_rate(delta_time)
-            self.mouse_manager.draw_cursor(cursor_type)
+    def handle_input(self, delta_time) -> None:
+        self.cursor_type = CursorType.POINT
+        self.is_keyboard_handled, self.is_mouse_handled, self.is_interface_hovered = (
+            self.interface_manager.handle_events()
+        )
 
-            self.screen_surface.blit(self.game_surface, (0, 0))
-            pygame.display.flip()
+        # clicks and the cursor are handled once per frame, frames without a simulation step must not lose them
+        if self.game_clock.is_game_paused or self.player_manager.is_dead:
+            return
 
-            self.game_clock.update()
+        if not self.is_mouse_handled:
+            self.player_manager.handle_mouse_events()
 
-        if interface_manager.is_quit_to_desktop:
-            quit_game()
+        if self.vendor_manager.is_open and (self.inventory_manager.is_hovered or self.vendor_manager.is_hovered):
+            self.cursor_type = CursorType.SELL
+        if not self.interface_manager.is_hovered:
+            self.cursor_type = self.npcs_manager.get_hovered_npc_info()
 
-        self.screen_manager.next_screen = ScreenType.LOGIN
+    def update_player(self, delta_time) -> None:
+        if self.game_clock.is_game_paused or self.player_manager.is_dead:
+            return
+
+        self.player_manager.handle_spell_cast_finish()
+        self.player_manager.handle_kill_series_end()
+        self.player_manager.handle_regeneration()
+        self.player_manager.handle_move(delta_time)
+
+    def update_pathfinding(self, delta_time) -> None:
+        if not self.game_clock.is_game_paused:
+            self.pathfinding_manager.process_path_requests()
+
+    def update_npcs(self, delta_time) -> None:
+        if not self.game_clock.is_game_paused:
+            self.npcs_manager.schedule_updates(delta_time)
+            self.npcs_manager.handle_events()
+            self.npcs_manager.perform_actions()
+
+    def update_world(self, delta_time) -> None:
+        if not self.game_clock.is_game_paused:
+            self.vendor_manager.handle_auto_close()
+            self.player_manager.handle_death()
+
+            self.datetime_manager.increment_time(delta_time)
+
+        self.save_manager.update()
+
+    def draw_map(self, delta_time) -> None:
+        self.viewport_manager.update()
+        self.lighting_manager.update()
+        # draws below are repeated for every dirty rect when only parts of the screen change
+        self.dirty_rects_manager.prepare_frame()
+        with self.frame_profiler_manager.measure(FrameSectionType.MAP):
+            for _ in self.dirty_rects_manager.get_clip_passes():
+                self.render_scale_manager.clear_surfaces()
+                self.map_manager.draw_map()
+
+    def draw_entities(self, delta_time) -> None:
+        frame_profiler_manager = self.frame_profiler_manager
+        for _ in self.dirty_rects_manager.get_clip_passes():
+            with frame_profiler_manager.measure(FrameSectionType.INTERACTIVE_OBJECTS):
+                self.interactive_objects_manager.draw_interactive_objects()
+            with frame_profiler_manager.measure(FrameSectionType.LOOT):
+                self.loot_manager.draw_loot()
+            with frame_profiler_manager.measure(FrameSectionType.NPCS):
+                self.npcs_manager.draw_npcs()
+            with frame_profiler_manager.measure(FrameSectionType.PLAYER_CHARACTER):
+                self.player_manager.draw_player()
+            with frame_profiler_manager.measure(FrameSectionType.NIGHT_OVERLAY):
+                self.lighting_manager.draw_night_overlay()
+
+    def draw_ui(self, delta_time) -> None:
+        frame_profiler_manager = self.frame_profiler_manager
+        for _ in self.dirty_rects_manager.get_clip_passes():
+            if not self.game_clock.is_game_paused:
+                with frame_profiler_manager.measure(FrameSectionType.HOVERED_NPC_INFO):
+                    self.npcs_manager.draw_hovered_npc_info()
+            with frame_profiler_manager.measure(FrameSectionType.NPC_UPDATE_TIERS):
+                self.npcs_manager.draw_update_tiers()
+            with frame_profiler_manager.measure(FrameSectionType.QUOTES):
+                self.quotes_manager.draw_quotes()
+            with frame_profiler_manager.measure(FrameSectionType.INTERFACE):
+                self.interface_manager.draw_interface()
+                self.interface_manager.draw_fps_rate(delta_time)
+            with frame_profiler_manager.measure(FrameSectionType.FRAME_PROFILER):
+                frame_profiler_manager.draw_overlay()
+            with frame_profiler_manager.measure(FrameSectionType.CURSOR):
+                self.mouse_manager.draw_cursor(self.cursor_type)
+
+    def present(self, delta_time) -> None:
+        with self.frame_profiler_manager.measure(FrameSectionType.FLIP):
+            self.dirty_rects_manager.present()
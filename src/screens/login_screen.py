@@ -3,7 +3,7 @@ from typing import override
 import pygame
 
 from src.colors import WHITE, BLACK
-from src.common_utils import quit_game
+from src.common_utils import quit_game, load_image
 from src.enums.cursor_type import CursorType
 from src.enums.screen_type import ScreenType
 from src.fonts import FONT_ALICE_IN_WONDERLAND_18, FONT_ARIAL_18
@@ -22,7 +22,7 @@ class LoginScreen(Screen):
 
     @override
     def enter(self):
-        start_screen_image = pygame.image.load(PATH_IMAGE_START_SCREEN).convert()
+        start_screen_image = load_image(PATH_IMAGE_START_SCREEN).convert()
         start_screen_image = pygame.transform.scale(
             start_screen_image,
             (
@@ -33,7 +33,7 @@ class LoginScreen(Screen):
         start_screen_image_x = (self.game_surface.get_width() // 2) - (start_screen_image.get_width() // 2)
         start_screen_image_position = (start_screen_image_x, 0)
 
-        name_image = pygame.image.load(PATH_IMAGE_NAME).convert_alpha()
+        name_image = load_image(PATH_IMAGE_NAME).convert_alpha()
         name_image = pygame.transform.scale(name_image, (200, 50))
         name_image_x = (self.game_surface.get_width() // 2) - (name_image.get_width() // 2)
         name_image_y = 50
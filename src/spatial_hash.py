@@ -0,0 +1,193 @@
+import heapq
+import math
+
+
+class SpatialHash:
+
+    def __init__(self, cell_size):
+        self.cell_size = cell_size
+        # bucket per (column, row) cell, items are keyed by id so unhashable loot entries work too
+        self._buckets = {}
+        self._entries = {}
+        # (first column, last column, first row, last row) ever occupied, not shrunk on removal
+        self._cells_bounds = None
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, item):
+        return id(item) in self._entries
+
+    def get_cell(self, x, y) -> (int, int):
+        return int(x // self.cell_size), int(y // self.cell_size)
+
+    def items(self):
+        return [item for item, _, _, _ in self._entries.values()]
+
+    def clear(self) -> None:
+        self._buckets.clear()
+        self._entries.clear()
+        self._cells_bounds = None
+
+    def _extend_cells_bounds(self, cell) -> None:
+        column, row = cell
+        if self._cells_bounds is None:
+            self._cells_bounds = (column, column, row, row)
+            return
+        first_column, last_column, first_row, last_row = self._cells_bounds
+        if not (first_column <= column <= last_column and first_row <= row <= last_row):
+            self._cells_bounds = (
+                min(first_column, column),
+                max(last_column, column),
+                min(first_row, row),
+                max(last_row, row)
+            )
+
+    def insert(self, item, x, y) -> None:
+        if id(item) in self._entries:
+            self.move(item, x, y)
+            return
+        cell = self.get_cell(x, y)
+        self._entries[id(item)] = (item, x, y, cell)
+        self._buckets.setdefault(cell, {})[id(item)] = item
+        self._extend_cells_bounds(cell)
+
+    def remove(self, item) -> None:
+        entry = self._entries.pop(id(item), None)
+        if entry is None:
+            return
+        cell = entry[3]
+        bucket = self._buckets[cell]
+        del bucket[id(item)]
+        if not bucket:
+            del self._buckets[cell]
+
+    def move(self, item, x, y) -> None:
+        entry = self._entries.get(id(item))
+        if entry is None:
+            self.insert(item, x, y)
+            return
+        old_cell = entry[3]
+        new_cell = self.get_cell(x, y)
+        self._entries[id(item)] = (item, x, y, new_cell)
+        if new_cell != old_cell:
+            old_bucket = self._buckets[old_cell]
+            del old_bucket[id(item)]
+            if not old_bucket:
+                del self._buckets[old_cell]
+            self._buckets.setdefault(new_cell, {})[id(item)] = item
+            self._extend_cells_bounds(new_cell)
+
+    def _iterate_cells(self, first_column, last_column, first_row, last_row):
+        for row in range(first_row, last_row + 1):
+            for column in range(first_column, last_column + 1):
+                bucket = self._buckets.get((column, row))
+                if bucket:
+                    yield from bucket.values()
+
+    def _iterate_items_in_rect(self, left, top, right, bottom):
+        first_column, first_row = self.get_cell(left, top)
+        last_column, last_row = self.get_cell(right, bottom)
+        cells_count = (last_column - first_column + 1) * (last_row - first_row + 1)
+        if cells_count > len(self._buckets):
+            # sparse index, cheaper to walk the occupied buckets only
+            for (column, row), bucket in list(self._buckets.items()):
+                if first_column <= column <= last_column and first_row <= row <= last_row:
+                    yield from bucket.values()
+        else:
+            yield from self._iterate_cells(first_column, last_column, first_row, last_row)
+
+    def get_position(self, item):
+        entry = self._entries[id(item)]
+        return entry[1], entry[2]
+
+    def query_rect(self, left, top, width, height, predicate=None):
+        found = []
+        for item in self._iterate_items_in_rect(left, top, left + width, top + height):
+            _, x, y, _ = self._entries[id(item)]
+            if left <= x <= left + width and top <= y <= top + height:
+                if predicate is None or predicate(item):
+                    found.append(item)
+        return found
+
+    def query_radius(self, x, y, radius, predicate=None):
+        found = []
+        radius_squared = radius * radius
+        for item in self._iterate_items_in_rect(x - radius, y - radius, x + radius, y + radius):
+            _, item_x, item_y, _ = self._entries[id(item)]
+            if (item_x - x) ** 2 + (item_y - y) ** 2 <= radius_squared:
+                if predicate is None or predicate(item):
+                    found.append(item)
+        return found
+
+    def query_nearest(self, x, y, k=1, max_radius=math.inf, predicate=None):
+        if not self._entries:
+            return []
+
+        center_column, center_row = self.get_cell(x, y)
+        # rings past the furthest occupied cell are empty
+        first_column, last_column, first_row, last_row = self._cells_bounds
+        max_ring = max(
+            center_column - first_column,
+            last_column - center_column,
+            center_row - first_row,
+            last_row - center_row,
+            0
+        )
+        if max_radius != math.inf:
+            max_ring = min(max_ring, int(max_radius // self.cell_size) + 1)
+
+        # (negative distance, id, item) max-heap of the k best candidates
+        best = []
+        for ring in range(max_ring + 1):
+            if len(best) == k:
+                # every item in this ring or further is at least that far away
+                ring_min_distance = (ring - 1) * self.cell_size
+                if ring_min_distance > -best[0][0]:
+                    break
+            for item in self._iterate_ring(center_column, center_row, ring):
+                _, item_x, item_y, _ = self._entries[id(item)]
+                distance = math.hypot(item_x - x, item_y - y)
+                if distance > max_radius:
+                    continue
+                if predicate is not None and not predicate(item):
+                    continue
+                if len(best) < k:
+                    heapq.heappush(best, (-distance, id(item), item))
+                elif distance < -best[0][0]:
+                    heapq.heapreplace(best, (-distance, id(item), item))
+
+        return [item for _, _, item in sorted(best, key=lambda entry: -entry[0])]
+
+    def _iterate_ring(self, center_column, center_row, ring):
+        if ring == 0:
+            bucket = self._buckets.get((center_column, center_row))
+            if bucket:
+                yield from bucket.values()
+            return
+
+        first_column = center_column - ring
+        last_column = center_column + ring
+        for column in range(first_column, last_column + 1):
+            for row in (center_row - ring, center_row + ring):
+                bucket = self._buckets.get((column, row))
+                if bucket:
+                    yield from bucket.values()
+        for row in range(center_row - ring + 1, center_row + ring):
+            for column in (first_column, last_column):
+                bucket = self._buckets.get((column, row))
+                if bucket:
+                    yield from bucket.values()
+
+    def query_point(self, x, y, hit_size, predicate=None):
+        # items are treated as hit_size squares centered on their position, like Entity.is_hovered
+        found = []
+        half_size = hit_size // 2
+        for item in self._iterate_items_in_rect(x - hit_size, y - hit_size, x + hit_size, y + hit_size):
+            _, item_x, item_y, _ = self._entries[id(item)]
+            left = item_x - half_size
+            top = item_y - half_size
+            if left <= x < left + hit_size and top <= y < top + hit_size:
+                if predicate is None or predicate(item):
+                    found.append(item)
+        return found
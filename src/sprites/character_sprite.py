@@ -1,14 +1,11 @@
 import os
 from typing import override
 
-import pygame
-
-from src.common_utils import remove_filename_extension
 from src.enums.move_direction_type import MoveDirection
 from src.enums.sprite_state import SpriteState
+from src.managers.core.sprite_atlas_manager import SpriteAtlasManager
 from src.paths import DIR_ASSETS_SPRITES_CHARACTERS
 from src.sprites.entity_sprite import EntitySprite
-from src.sprites.spritesheet_functions import extract_frames_from_spritesheet
 
 
 class CharacterSprite(EntitySprite):
@@ -23,20 +20,14 @@ class CharacterSprite(EntitySprite):
         self._current_direction = MoveDirection.DOWN
 
     @classmethod
-    def load_sprites(cls, draw_size):
-        sprites_names = os.listdir(DIR_ASSETS_SPRITES_CHARACTERS)
-        for sprite_name in sprites_names:
-            if sprite_name not in cls._states:
-                cls._states[sprite_name] = {}
-                sprites_directory = os.path.join(DIR_ASSETS_SPRITES_CHARACTERS, sprite_name)
-                for move_direction in MoveDirection:
-                    cls._states[sprite_name][move_direction] = {}
-                    direction_directory = os.path.join(sprites_directory, move_direction)
-                    states = os.listdir(direction_directory)
-                    for state in states:
-                        spritesheet = pygame.image.load(os.path.join(direction_directory, state)).convert_alpha()
-                        frames = extract_frames_from_spritesheet(spritesheet, draw_size)
-                        cls._states[sprite_name][move_direction][remove_filename_extension(state)] = frames
+    def load_sprite(cls, sprite_name, draw_size):
+        if sprite_name not in cls._states:
+            sprite_atlas_manager = SpriteAtlasManager.get_instance()
+            sprite_directory = os.path.join(DIR_ASSETS_SPRITES_CHARACTERS, sprite_name)
+            cls._states[sprite_name] = {
+                move_direction: sprite_atlas_manager.load_page(os.path.join(sprite_directory, move_direction), draw_size)
+                for move_direction in MoveDirection
+            }
 
     def set_direction(self, direction):
         self._current_direction = direction
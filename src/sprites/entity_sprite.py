@@ -17,10 +17,13 @@ class EntitySprite:
 
     game_clock = None
     game_context = None
+    render_scale_manager = None
 
     def __init__(self, game_surface, sprite_name, draw_size):
         self.game_surface = game_surface
         self.sprite_name = sprite_name
+        # frames are loaded the first time anything with that sprite spawns
+        self.load_sprite(sprite_name, draw_size)
         self.sprite_name_text = FONT_MONOSPACE_COURIER_16.render(self.sprite_name, True, WHITE)
         self.draw_size = draw_size
         self.current_continuous_state = SpriteState.IDLE
@@ -32,13 +35,15 @@ class EntitySprite:
     def setup_references(cls):
         from src.game_clock import GameClock
         from src.game_context import GameContext
+        from src.managers.core.render_scale_manager import RenderScaleManager
 
         cls.game_context = GameContext.get_instance()
+        cls.render_scale_manager = RenderScaleManager.get_instance()
         cls.game_clock = GameClock.get_instance()
 
     @classmethod
     @abstractmethod
-    def load_sprites(cls, draw_size):
+    def load_sprite(cls, sprite_name, draw_size):
         pass
 
     @abstractmethod
@@ -106,7 +111,10 @@ class EntitySprite:
     def draw(self, screen_position):
         screen_x, screen_y = screen_position
 
-        self.game_surface.blit(
+        # advanced before blitting, a frame drawn in a few clip passes shows the same animation frame in all of them
+        self.increment_current_frame_nr()
+
+        self.render_scale_manager.draw_world_surface(
             self.get_current_frame(),
             (
                 screen_x - (self.draw_size // 2),
@@ -114,7 +122,5 @@ class EntitySprite:
             )
         )
 
-        self.increment_current_frame_nr()
-
         if self.game_context.is_in_debug_mode:
             self.draw_area_rectangle(screen_position)
@@ -1,12 +1,20 @@
 import pygame
 
 
-def extract_frames_from_spritesheet(spritesheet, draw_size):
+def get_spritesheet_frames_quantity(spritesheet) -> int:
+    return spritesheet.get_width() // spritesheet.get_height()
+
+
+def extract_frames_from_spritesheet(spritesheet, draw_size, frames_surfaces=None):
+    # frames_surfaces, when given, receive the scaled frames instead of newly created surfaces
     frames = []
     frame_size = spritesheet.get_height()
-    frames_quantity = spritesheet.get_width() // frame_size
+    frames_quantity = get_spritesheet_frames_quantity(spritesheet)
     for frame_nr in range(frames_quantity):
         frame = spritesheet.subsurface(pygame.Rect(frame_nr * frame_size, 0, frame_size, frame_size))
-        frame = pygame.transform.scale(frame, (draw_size, draw_size))
+        if frames_surfaces is None:
+            frame = pygame.transform.scale(frame, (draw_size, draw_size))
+        else:
+            frame = pygame.transform.scale(frame, (draw_size, draw_size), frames_surfaces[frame_nr])
         frames.append(frame)
     return frames
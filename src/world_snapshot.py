@@ -0,0 +1,299 @@
+import glob
+import json
+import mmap
+import os
+import pickle
+import struct
+from itertools import chain
+
+import pygame
+
+from src.paths import PROJECT_ROOT, PATH_WORLD_SNAPSHOT, DIR_ASSETS, DIR_DATABASE_MAPS, TXT_COLLISIONS_GRID, \
+    PATH_JSON_ENEMY_COMMON_QUOTES, PATH_JSON_NPC_COMMON_QUOTES, PATH_JSON_PLAYER_COMMON_QUOTES, \
+    PATH_JSON_RETURN_TO_TOWN_QUOTES, PATH_JSON_CENSORED_WORDS
+
+SNAPSHOT_JSON_PATHS = (
+    PATH_JSON_ENEMY_COMMON_QUOTES,
+    PATH_JSON_NPC_COMMON_QUOTES,
+    PATH_JSON_PLAYER_COMMON_QUOTES,
+    PATH_JSON_RETURN_TO_TOWN_QUOTES,
+    PATH_JSON_CENSORED_WORDS
+)
+
+# byte -> its 8 bits as collisions, lowest bit first
+_BYTE_COLLISIONS = tuple(tuple(bool(byte >> bit & 1) for bit in range(8)) for byte in range(256))
+
+
+def get_snapshot_key(file_path) -> str:
+    # same key whether the path was built from the project root or relative to it
+    return os.path.relpath(os.path.abspath(file_path), PROJECT_ROOT).replace(os.sep, '/')
+
+
+def get_source_file_stamp(file_path) -> tuple[int, int] | None:
+    try:
+        file_stat = os.stat(file_path)
+    except OSError:
+        return None
+    return file_stat.st_size, file_stat.st_mtime_ns
+
+
+def pack_collisions_grid(collisions_grid) -> bytes:
+    packed_rows = []
+    for row in collisions_grid:
+        packed_row = bytearray((len(row) + 7) // 8)
+        for column_nr, is_collision in enumerate(row):
+            if is_collision:
+                packed_row[column_nr // 8] |= 1 << (column_nr % 8)
+        packed_rows.append(bytes(packed_row))
+    return b''.join(packed_rows)
+
+
+def unpack_collisions_grid(packed_grid, rows, columns) -> list[list[bool]]:
+    row_length = (columns + 7) // 8
+    return [
+        list(chain.from_iterable(
+            _BYTE_COLLISIONS[byte] for byte in packed_grid[row_nr * row_length:(row_nr + 1) * row_length]
+        ))[:columns]
+        for row_nr in range(rows)
+    ]
+
+
+class WorldSnapshot:
+    _instance = None
+
+    MAGIC = b'FHWS'
+    # bumped whenever the layout of the file or of any section changes
+    FORMAT_VERSION = 1
+    # magic, format version, index offset, index length
+    HEADER = struct.Struct('<4sIQQ')
+
+    @classmethod
+    def get_instance(cls):
+        return cls._instance
+
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self, snapshot_path=PATH_WORLD_SNAPSHOT):
+        if not hasattr(self, 'initialized'):
+            self.initialized = True
+
+            self.snapshot_path = snapshot_path
+
+            self._mmap = None
+            self._index = {}
+            # database sections are checked against the catalog version once, on first use
+            self._is_catalog_up_to_date = None
+
+            self.open()
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._mmap is not None
+
+    def open(self) -> None:
+        # missing, older or stale snapshot means that everything is loaded from the sources
+        try:
+            with open(self.snapshot_path, 'rb') as snapshot_file:
+                # copy on write, surfaces made over the snapshot can be drawn on without touching the file
+                snapshot_mmap = mmap.mmap(snapshot_file.fileno(), 0, access=mmap.ACCESS_COPY)
+        except (OSError, ValueError):
+            return
+
+        try:
+            magic, format_version, index_offset, index_length = self.HEADER.unpack_from(snapshot_mmap)
+            if magic != self.MAGIC or format_version != self.FORMAT_VERSION:
+                raise ValueError('Unsupported world snapshot')
+            index = pickle.loads(snapshot_mmap[index_offset:index_offset + index_length])
+        except (struct.error, pickle.UnpicklingError, ValueError, EOFError):
+            snapshot_mmap.close()
+            return
+
+        if not self.are_source_files_unchanged(index['source_files']):
+            snapshot_mmap.close()
+            return
+
+        self._mmap = snapshot_mmap
+        self._index = index
+
+    @staticmethod
+    def are_source_files_unchanged(source_files) -> bool:
+        return all(
+            get_source_file_stamp(os.path.join(PROJECT_ROOT, file_key)) == tuple(stamp)
+            for file_key, stamp in source_files.items()
+        )
+
+    def is_catalog_up_to_date(self) -> bool:
+        if self._is_catalog_up_to_date is None:
+            from src.database_service import DatabaseService
+            self._is_catalog_up_to_date = self._index['catalog_version'] == DatabaseService.get_catalog_version()
+        return self._is_catalog_up_to_date
+
+    def get_section(self, section_name):
+        # unpickled on every call, callers are free to change what they get
+        if not self.is_loaded:
+            return None
+        section = self._index['sections'].get(section_name)
+        if section is None:
+            return None
+        offset, length, is_from_database = section
+        if is_from_database and not self.is_catalog_up_to_date():
+            return None
+        return pickle.loads(self._mmap[offset:offset + length])
+
+    def get_json(self, file_path):
+        return self.get_section(f'json/{get_snapshot_key(file_path)}')
+
+    def get_image(self, file_path) -> pygame.Surface | None:
+        if not self.is_loaded:
+            return None
+        image = self._index['images'].get(get_snapshot_key(file_path))
+        if image is None:
+            return None
+        size, pixels_format, colorkey, offset, length = image
+        # shares the mapped pixels, nothing is decoded or copied until the image is converted
+        image = pygame.image.frombuffer(memoryview(self._mmap)[offset:offset + length], size, pixels_format)
+        if colorkey is not None:
+            image.set_colorkey(colorkey)
+        return image
+
+    def get_collisions_grid(self, map_id) -> list[list[bool]] | None:
+        if not self.is_loaded:
+            return None
+        collisions_grid = self._index['collisions_grids'].get(map_id)
+        if collisions_grid is None:
+            return None
+        rows, columns, offset, length = collisions_grid
+        return unpack_collisions_grid(self._mmap[offset:offset + length], rows, columns)
+
+    def get_map_info(self, map_id) -> dict | None:
+        return self.get_section(f'map_info/{map_id}')
+
+    def get_map_npcs(self, map_id) -> list | None:
+        return self.get_section(f'map_npcs/{map_id}')
+
+    def get_map_objects(self, map_id) -> list | None:
+        return self.get_section(f'map_objects/{map_id}')
+
+
+class WorldSnapshotBuilder:
+    # reads only the sources, never an existing snapshot
+
+    def __init__(self, snapshot_path=PATH_WORLD_SNAPSHOT):
+        self.snapshot_path = snapshot_path
+
+        self.snapshot_file = None
+        self.source_files = {}
+        self.sections = {}
+        self.images = {}
+        self.collisions_grids = {}
+
+    def add_source_file(self, file_path) -> str:
+        file_key = get_snapshot_key(file_path)
+        self.source_files[file_key] = get_source_file_stamp(file_path)
+        return file_key
+
+    def write_blob(self, blob) -> tuple[int, int]:
+        offset = self.snapshot_file.tell()
+        self.snapshot_file.write(blob)
+        return offset, len(blob)
+
+    def add_section(self, section_name, data, is_from_database=True) -> None:
+        self.sections[section_name] = (
+            *self.write_blob(pickle.dumps(data, pickle.HIGHEST_PROTOCOL)),
+            is_from_database
+        )
+
+    def add_catalog(self) -> None:
+        from src.database_service import DatabaseService
+        from src.game_catalog import GameCatalog
+
+        self.add_section('catalog', GameCatalog.read_tables())
+        self.add_section('kill_series_titles', DatabaseService.get_kill_series_titles())
+
+    def add_maps(self) -> None:
+        from src.database_service import DatabaseService
+
+        for map_name in sorted(os.listdir(DIR_DATABASE_MAPS)):
+            if not map_name.isdigit():
+                continue
+            map_id = int(map_name)
+
+            self.add_section(f'map_info/{map_id}', DatabaseService.get_map_info(map_id))
+            self.add_section(f'map_npcs/{map_id}', DatabaseService.get_map_npcs(map_id))
+            self.add_section(f'map_objects/{map_id}', DatabaseService.get_map_objects(map_id))
+
+            collisions_grid_path = os.path.join(DIR_DATABASE_MAPS, map_name, TXT_COLLISIONS_GRID)
+            self.add_source_file(collisions_grid_path)
+            with open(collisions_grid_path) as collisions_grid_file:
+                collisions_grid = [[column == '#' for column in line.rstrip('\n')] for line in collisions_grid_file]
+            self.collisions_grids[map_id] = (
+                len(collisions_grid),
+                len(collisions_grid[0]),
+                *self.write_blob(pack_collisions_grid(collisions_grid))
+            )
+
+    def add_json_files(self) -> None:
+        for json_path in SNAPSHOT_JSON_PATHS:
+            file_key = self.add_source_file(json_path)
+            with open(json_path, 'rt', encoding='utf-8') as f:
+                self.add_section(f'json/{file_key}', json.load(f), is_from_database=False)
+
+    def add_images(self) -> None:
+        images_paths = chain(
+            glob.glob(os.path.join(DIR_ASSETS, '**', '*.png'), recursive=True),
+            glob.glob(os.path.join(DIR_DATABASE_MAPS, '**', '*.png'), recursive=True)
+        )
+        for image_path in sorted(images_paths):
+            image = pygame.image.load(image_path)
+            pixels_format = 'RGBA' if image.get_flags() & pygame.SRCALPHA else 'RGB'
+            colorkey = image.get_colorkey()
+            file_key = self.add_source_file(image_path)
+            self.images[file_key] = (
+                image.get_size(),
+                pixels_format,
+                None if colorkey is None else tuple(colorkey),
+                *self.write_blob(pygame.image.tobytes(image, pixels_format))
+            )
+
+    def get_index(self, catalog_version) -> dict:
+        return {
+            'catalog_version': catalog_version,
+            'source_files': self.source_files,
+            'sections': self.sections,
+            'images': self.images,
+            'collisions_grids': self.collisions_grids
+        }
+
+    def build(self) -> None:
+        from src.database_service import DatabaseService
+
+        catalog_version = DatabaseService.get_catalog_version()
+        # written next to the old snapshot and swapped in, a running game keeps reading the old one
+        temporary_snapshot_path = f'{self.snapshot_path}.tmp'
+        with open(temporary_snapshot_path, 'wb') as self.snapshot_file:
+            # header is filled in once the index, stored after all the sections, is written
+            self.snapshot_file.write(bytes(WorldSnapshot.HEADER.size))
+            self.add_catalog()
+            self.add_maps()
+            self.add_json_files()
+            self.add_images()
+            index_offset, index_length = self.write_blob(
+                pickle.dumps(self.get_index(catalog_version), pickle.HIGHEST_PROTOCOL)
+            )
+            self.snapshot_file.seek(0)
+            self.snapshot_file.write(WorldSnapshot.HEADER.pack(
+                WorldSnapshot.MAGIC,
+                WorldSnapshot.FORMAT_VERSION,
+                index_offset,
+                index_length
+            ))
+        self.snapshot_file = None
+        os.replace(temporary_snapshot_path, self.snapshot_path)
+
+
+if __name__ == '__main__':
+    WorldSnapshotBuilder().build()
+    print(f'World snapshot built: {PATH_WORLD_SNAPSHOT}')